@@ -0,0 +1,102 @@
+"""학생 전체 가능 시간 텐서 (NumPy 선택 사항) - 학생 × 요일 × 칸 한 번에 묻기
+
+    tensor = AvailabilityTensor(students, time_grid)
+    tensor.students_at(2, 16 * 60, 90)   # 화 16:00부터 90분 가능한 학생 인덱스
+    tensor.feasible(90)                  # (학생, 요일, 칸) 90분 수업 시작 가능 여부
+
+칸 시작 시각마다 가능 여부를 bool 배열로 두고, 길이별 시작 가능 여부는 누적합 창(sliding window)으로
+한 번에 구한다. Student.can_place_block(step=칸 단위)과 같은 시각(시작, 칸마다, 끝)을 검사하므로
+길이가 칸 단위의 배수일 때만 쓸 수 있다 (supports). NumPy가 없으면 HAVE_NUMPY가 False이고
+호출하는 쪽은 기존 비트마스크 경로를 쓴다.
+"""
+from typing import List
+from student import Student, expand_day
+from time_grid import TimeGrid
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+HAVE_NUMPY = np is not None
+
+
+def _row_range(grid: TimeGrid, start: int, end: int, points: int) -> tuple[int, int]:
+    """[start, end)분 구간에 드는 칸 시작 시각(표본점) 범위 [lo, hi)"""
+    s0, slot = grid.start_minutes, grid.slot_minutes
+    lo = max(-(-(start - s0) // slot), 0)
+    hi = min(-(-(end - s0) // slot), points)
+    return lo, hi
+
+
+class AvailabilityTensor:
+    """available[학생, 요일(0=일~6=토), r] = 칸 시작 시각 row_start(r)에 가능 (r = 0 … rows, 마지막은 끝 시각)"""
+
+    def __init__(self, students: List[Student], time_grid: TimeGrid | None = None):
+        if np is None:
+            raise RuntimeError("AvailabilityTensor에는 NumPy가 필요합니다")
+        self.time_grid = grid = time_grid or TimeGrid()
+        points = grid.rows + 1
+        available = np.zeros((len(students), 7, points), dtype=bool)
+        blocked = np.zeros((7, points), dtype=bool)
+        for si, s in enumerate(students):
+            row = available[si]
+            if not s.available:
+                row[:] = True
+            for slot in s.available:
+                lo, hi = _row_range(grid, slot.start_hour * 60 + slot.start_min, slot.end_hour * 60 + slot.end_min, points)
+                if lo < hi:
+                    for d in expand_day(slot.day_of_week):
+                        row[d, lo:hi] = True
+            if s.unavailable:
+                blocked[:] = False
+                for slot in s.unavailable:
+                    lo, hi = _row_range(grid, slot.start_hour * 60 + slot.start_min, slot.end_hour * 60 + slot.end_min, points)
+                    if lo < hi:
+                        for d in expand_day(slot.day_of_week):
+                            blocked[d, lo:hi] = True
+                row &= ~blocked
+        self.available = available
+        self._feasible: dict[int, "np.ndarray"] = {}
+        self._prefix = None
+
+    def _bad_prefix(self) -> "np.ndarray":
+        """[..., i] = 표본점 0 … i-1 중 불가 개수 (길이 rows + 2)"""
+        if self._prefix is None:
+            shape = self.available.shape
+            prefix = np.zeros(shape[:2] + (shape[2] + 1,), dtype=np.int16)  # 표본점은 최대 24·60/5+1개
+            np.cumsum(~self.available, axis=-1, dtype=np.int16, out=prefix[..., 1:])
+            self._prefix = prefix
+        return self._prefix
+
+    def supports(self, duration: int) -> bool:
+        return duration > 0 and duration % self.time_grid.slot_minutes == 0
+
+    def feasible(self, duration: int) -> "np.ndarray":
+        """(학생, 요일, rows) bool - 그 칸에서 duration분 수업을 시작할 수 있는지 (끝이 end_hour 이내)"""
+        result = self._feasible.get(duration)
+        if result is not None:
+            return result
+        if not self.supports(duration):
+            raise ValueError(f"길이는 칸 단위({self.time_grid.slot_minutes}분)의 배수여야 합니다: {duration}")
+        rows = self.time_grid.rows
+        k = duration // self.time_grid.slot_minutes  # 시작부터 끝까지 k+1개 표본점이 모두 가능해야 함
+        result = np.zeros(self.available.shape[:2] + (rows,), dtype=bool)
+        if k <= rows:
+            # 불가 표본점 누적합으로 창 [r, r+k] 안의 불가 개수를 한 번에
+            bad = self._bad_prefix()
+            result[..., :rows - k + 1] = bad[..., k + 1:] == bad[..., :rows - k + 1]
+        self._feasible[duration] = result
+        return result
+
+    def students_at(self, day: int, start: int, duration: int) -> "np.ndarray":
+        """day요일 start분부터 duration분 수업이 가능한 학생 인덱스 (칸 시작이 아니면 빈 배열)"""
+        grid = self.time_grid
+        r = grid.row_of(start)
+        if not 0 <= day <= 6 or not 0 <= r < grid.rows or grid.row_start(r) != start:
+            return np.zeros(0, dtype=np.intp)
+        return np.flatnonzero(self.feasible(duration)[:, day, r])
+
+    def sample(self, mask: int) -> "np.ndarray":
+        """분 단위 비트마스크 → 칸 시작 시각별 bool (rows)"""
+        return np.frombuffer(self.time_grid.sample(mask).encode("ascii"), dtype=np.uint8) == ord("1")
@@ -0,0 +1 @@
+"""시간표 성능 벤치마크 (python -m benchmarks)"""
@@ -0,0 +1,71 @@
+"""벤치마크용 가상 학생 명단 - 같은 seed면 항상 같은 명단
+
+학교급마다 실제 학원과 비슷하게 수업 길이·주당 횟수·가능 시간을 다르게 준다.
+- 초등: 평일 하교 후(13~18시), 30/60분, 주 1~3회
+- 중등: 평일 저녁(15~21시) 위주, 60/90분, 주 2~3회
+- 고등: 평일 밤(18~22시) + 주말 낮, 90/120분, 주 1~2회
+일부 학생은 요일 하나를 통째로 막거나(다른 학원), 아무 제약 없이 둔다.
+"""
+import random
+from typing import List
+from student import Student, AvailableSlot, UnavailableSlot, GRADES
+
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GIVEN = "민서준하도윤지우수아현예은건시연채원진영태"
+
+# 학년별 비중 (중등이 가장 많음)
+GRADE_WEIGHTS = {
+    "초1": 3, "초2": 4, "초3": 5, "초4": 6, "초5": 7, "초6": 7,
+    "중1": 10, "중2": 10, "중3": 10, "고1": 7, "고2": 6, "고3": 5,
+}
+
+
+def _level(grade: str) -> str:
+    return grade[0]
+
+
+def make_student(rng: random.Random, i: int) -> Student:
+    grade = rng.choices(GRADES, weights=[GRADE_WEIGHTS[g] for g in GRADES])[0]
+    level = _level(grade)
+    available: list[AvailableSlot] = []
+    unavailable: list[UnavailableSlot] = []
+    free = rng.random() < 0.1  # 제약 없는 학생
+    if level == "초":
+        duration = rng.choice([30, 60, 60])
+        sessions = rng.choice([1, 2, 2, 3])
+        if not free:
+            available.append(AvailableSlot(7, rng.choice([13, 14, 15]), rng.choice([0, 30]), rng.choice([17, 18]), 0))
+    elif level == "중":
+        duration = rng.choice([60, 60, 90])
+        sessions = rng.choice([2, 2, 3])
+        if not free:
+            available.append(AvailableSlot(7, rng.choice([15, 16, 17]), rng.choice([0, 30]), rng.choice([20, 21]), 0))
+            if rng.random() < 0.4:
+                available.append(AvailableSlot(6, 10, 0, rng.choice([14, 16]), 0))
+    else:
+        duration = rng.choice([90, 120])
+        sessions = rng.choice([1, 2, 2])
+        if not free:
+            available.append(AvailableSlot(7, rng.choice([18, 19]), 0, 22, 0))
+            available.append(AvailableSlot(8, rng.choice([9, 10, 13]), 0, rng.choice([17, 18]), 0))
+    if not free and rng.random() < 0.35:
+        # 다른 학원 등으로 요일 하나를 막음
+        day = rng.randint(1, 5)
+        unavailable.append(UnavailableSlot(day, rng.choice([15, 16, 17]), 0, rng.choice([19, 20]), 0))
+    return Student(
+        name=rng.choice(_SURNAMES) + rng.choice(_GIVEN) + rng.choice(_GIVEN),
+        grade=grade,
+        age=0,
+        phone=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        address=f"{rng.choice(['행복', '푸른', '새빛', '한빛'])}아파트 {rng.randint(101, 120)}동 #{i}",
+        class_duration_minutes=duration,
+        sessions_per_week=sessions,
+        available=available,
+        unavailable=unavailable,
+    )
+
+
+def make_roster(n: int, seed: int = 0) -> List[Student]:
+    """n명 가상 명단 (id 없음 - DB에 넣으면 새로 붙음)"""
+    rng = random.Random(seed)
+    return [make_student(rng, i) for i in range(n)]
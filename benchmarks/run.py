@@ -0,0 +1,241 @@
+"""벤치마크 실행 - 가용 시간 검사, 자동 배치, DB 저장/로드, 시간표 그리드(오프스크린 Qt)
+
+    python -m benchmarks                          # 100 / 1,000 / 10,000명, 각 3회
+    python -m benchmarks --sizes 1000 --only solve,db -o after.json --compare before.json
+
+결과는 JSON(-o)으로 저장해 커밋끼리 비교한다 (--compare 이전 결과 → 중앙값 비율 표시).
+각 항목은 repeat번 잰 시간(초) 목록과 최솟값·중앙값을 담는다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+from benchmarks.roster import make_roster
+
+CASES = ("availability", "solve", "db", "qt")
+DEFAULT_SIZES = (100, 1000, 10000)
+# 자동 배치는 학생 수에 대해 대략 제곱으로 늘어 1만 명은 수십 초 - --full일 때만
+SOLVE_MAX_SIZE = 3000
+
+
+def _timed(fn: Callable, repeat: int) -> tuple[list[float], object]:
+    times = []
+    result = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - t)
+    return times, result
+
+
+def _record(name: str, size: int, times: list[float], **extra) -> dict:
+    return {
+        "name": name,
+        "size": size,
+        "times": [round(t, 6) for t in times],
+        "min": round(min(times), 6),
+        "median": round(statistics.median(times), 6),
+        "extra": extra,
+    }
+
+
+def bench_availability(students, size: int, repeat: int) -> Iterator[dict]:
+    rng = random.Random(1)
+    queries = [
+        (rng.choice(students), rng.randrange(7), rng.randrange(8 * 60, 22 * 60, 30), rng.choice([30, 60, 90, 120]))
+        for _ in range(20000)
+    ]
+
+    def can_place():
+        return sum(s.can_place_block(d, t, dur) for s, d, t, dur in queries)
+
+    def feasible():
+        return sum((s.feasible_starts(d, s.class_duration_minutes)).bit_count() for s in students for d in range(7))
+
+    times, hits = _timed(can_place, repeat)
+    yield _record("availability.can_place_block", size, times, queries=len(queries), hits=hits)
+    times, starts = _timed(feasible, repeat)
+    yield _record("availability.feasible_starts", size, times, calls=7 * len(students), starts=starts)
+
+
+def bench_solve(students, size: int, repeat: int) -> Iterator[dict]:
+    from schedule_generator import ScheduleGenerator
+
+    def solve():
+        gen = ScheduleGenerator(students)
+        blocks = gen.generate(auto_place=True)
+        return len(blocks), len(gen.unplaced)
+
+    times, (blocks, unplaced) = _timed(solve, repeat)
+    yield _record("solve.generate_auto_place", size, times, blocks=blocks, unplaced=unplaced)
+
+    # MRV 도메인 갱신: 파이썬 비트마스크 경로 vs NumPy 배열 경로 (_DomainArrays) - 같은 배치가 나와야 함
+    import availability
+    import schedule_generator
+    paths = {"python": 10 ** 9}
+    if availability.HAVE_NUMPY:
+        paths["numpy"] = 0
+    threshold = schedule_generator.VECTOR_MIN_GROUPS
+    placements = {}
+    try:
+        for path, min_groups in paths.items():
+            schedule_generator.VECTOR_MIN_GROUPS = min_groups
+
+            def place():
+                gen = ScheduleGenerator(students)
+                blocks = gen.generate()
+                gen.place(blocks)
+                return [(b.day_of_week, b.start_minutes) for b in blocks]
+
+            times, placements[path] = _timed(place, repeat)
+            yield _record(f"solve.place_{path}", size, times)
+    finally:
+        schedule_generator.VECTOR_MIN_GROUPS = threshold
+    if len(placements) == 2 and placements["python"] != placements["numpy"]:
+        print(f"경고: {size}명에서 NumPy 경로 배치가 파이썬 경로와 다름", file=sys.stderr)
+
+
+def bench_db(students, size: int, repeat: int) -> Iterator[dict]:
+    import db
+    from schedule_generator import ScheduleGenerator
+
+    blocks = ScheduleGenerator(students).generate()
+    for b in blocks:  # 저장량만 재므로 배치 대신 고르게 흩어 놓음
+        b.day_of_week = b.student_index % 7
+        b.start_minutes = 9 * 60 + (b.student_index % 24) * 30
+    upsert, load, save, load_blocks = [], [], [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for n in range(repeat):
+                db.set_db_path(Path(tmp) / f"bench{n}.db")
+                for s in students:
+                    s.id = None
+                upsert += _timed(lambda: db.bulk_upsert_students(students), 1)[0]
+                t, loaded = _timed(db.load_all_students, 1)
+                load += t
+                save += _timed(lambda: db.save_schedule(blocks, students), 1)[0]
+                load_blocks += _timed(lambda: db.load_schedule(loaded), 1)[0]
+        finally:
+            db.set_db_path(None)
+    slots = sum(len(s.available) + len(s.unavailable) for s in students)
+    yield _record("db.bulk_upsert_students", size, upsert, slots=slots)
+    yield _record("db.load_all_students", size, load, slots=slots)
+    yield _record("db.save_schedule", size, save, blocks=len(blocks))
+    yield _record("db.load_schedule", size, load_blocks, blocks=len(blocks))
+
+
+def bench_qt(students, size: int, repeat: int) -> Iterator[dict]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        print("PyQt6 없음 - qt 항목 건너뜀", file=sys.stderr)
+        return
+    from schedule_generator import ScheduleGenerator
+    from timetable_widget import TimetableWidget
+
+    app = QApplication.instance() or QApplication([])
+    gen = ScheduleGenerator(students)
+    blocks = gen.generate(auto_place=size <= SOLVE_MAX_SIZE)
+    w = TimetableWidget()
+    w.resize(1200, 800)
+    w.set_students(students)
+    w.show()
+
+    def set_blocks():
+        w.set_blocks(blocks)
+        app.processEvents()
+
+    def rebuild():
+        w.model.all_changed()
+        w.grid.viewport().grab()
+
+    placed = next((i for i, b in enumerate(blocks) if b.day_of_week >= 0), 0)
+
+    def highlight():
+        w._highlight_cache = None
+        w._start_drag_highlight(blocks[placed].student_index, blocks[placed].duration_minutes, placed)
+        w._clear_drag_highlight()
+
+    yield _record("qt.set_blocks", size, _timed(set_blocks, repeat)[0], blocks=len(blocks))
+    yield _record("qt.rebuild_paint", size, _timed(rebuild, repeat)[0])
+    yield _record("qt.drag_highlight", size, _timed(highlight, repeat)[0])
+    w.close()
+
+
+_BENCHES = {"availability": bench_availability, "solve": bench_solve, "db": bench_db, "qt": bench_qt}
+
+
+def _meta(seed: int) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _print_table(results: list[dict], baseline: dict | None):
+    print(f"{'항목':<34}{'학생 수':>8}{'최소(ms)':>12}{'중앙(ms)':>12}" + (f"{'이전 대비':>10}" if baseline else ""))
+    for r in results:
+        line = f"{r['name']:<34}{r['size']:>8}{r['min'] * 1e3:>12.2f}{r['median'] * 1e3:>12.2f}"
+        old = baseline.get((r["name"], r["size"])) if baseline else None
+        if old:
+            line += f"{r['median'] / old['median']:>9.2f}x" if old["median"] else f"{'-':>10}"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description="시간표 벤치마크")
+    p.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="학생 수 (쉼표 구분)")
+    p.add_argument("--only", default=",".join(CASES), help=f"실행할 항목 ({', '.join(CASES)})")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0, help="가상 명단 seed")
+    p.add_argument("--full", action="store_true", help=f"자동 배치도 {SOLVE_MAX_SIZE}명 넘게 실행")
+    p.add_argument("-o", "--output", type=Path, help="결과 JSON 저장 경로")
+    p.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    args = p.parse_args(argv)
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    cases = [c.strip() for c in args.only.split(",") if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        p.error(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+    baseline = None
+    if args.compare:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))
+        baseline = {(r["name"], r["size"]): r for r in old["results"]}
+
+    results = []
+    for size in sizes:
+        students = make_roster(size, args.seed)
+        for case in cases:
+            if case == "solve" and size > SOLVE_MAX_SIZE and not args.full:
+                print(f"solve {size}명 건너뜀 (--full로 실행)", file=sys.stderr)
+                continue
+            results.extend(_BENCHES[case](students, size, max(args.repeat, 1)))
+
+    _print_table(results, baseline)
+    if args.output:
+        args.output.write_text(
+            json.dumps({"meta": _meta(args.seed), "results": results}, ensure_ascii=False, indent=1) + "\n",
+            encoding="utf-8",
+        )
+    return 0
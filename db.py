@@ -1,12 +1,26 @@
 """SQLite DB로 학생 목록 저장/불러오기"""
+import atexit
+import gc
 import sys
 import sqlite3
+import threading
+import traceback
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from student import Student, UnavailableSlot, AvailableSlot
+from typing import Iterable, Iterator
+from student import Student, UnavailableSlot, AvailableSlot, normalize_slots
+from schedule_generator import ScheduleBlock
+import perf
+
+
+_path_override: Path | None = None  # set_db_path로 지정한 경로
 
 
 def _db_path() -> Path:
     """실행 환경에 따라 DB 경로 결정 (빌드된 exe는 exe와 같은 폴더)"""
+    if _path_override is not None:
+        return _path_override
     if getattr(sys, "frozen", False):
         base = Path(sys.executable).parent
     else:
@@ -14,197 +28,610 @@ def _db_path() -> Path:
     return base / "timetable.db"
 
 
-def get_connection():
-    path = _db_path()
-    conn = sqlite3.connect(str(path))
-    conn.row_factory = sqlite3.Row
-    return conn
+@contextmanager
+def _gc_paused():
+    """대량 객체 생성 중 순환 GC 일시 정지 (수만 개 슬롯 생성 시 GC 스캔이 로드 시간의 절반 이상)"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 
-def init_db():
-    """테이블 생성 (없을 때만)"""
-    conn = get_connection()
+def _migrate_v1(conn: sqlite3.Connection):
+    """학생·가능/불가 시간대 테이블 (기존 DB는 grade 컬럼만 추가)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            age INTEGER NOT NULL DEFAULT 0,
+            phone TEXT DEFAULT '',
+            address TEXT DEFAULT '',
+            class_duration_minutes INTEGER NOT NULL DEFAULT 60,
+            sessions_per_week INTEGER NOT NULL DEFAULT 1
+        )
+    """)
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(students)")}
+    if "grade" not in columns:
+        conn.execute("ALTER TABLE students ADD COLUMN grade TEXT DEFAULT '중1'")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS unavailable_slots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            day_of_week INTEGER NOT NULL,
+            start_hour INTEGER NOT NULL,
+            start_min INTEGER NOT NULL,
+            end_hour INTEGER NOT NULL,
+            end_min INTEGER NOT NULL,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS available_slots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            day_of_week INTEGER NOT NULL,
+            start_hour INTEGER NOT NULL,
+            start_min INTEGER NOT NULL,
+            end_hour INTEGER NOT NULL,
+            end_min INTEGER NOT NULL,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_unavailable_slots_student ON unavailable_slots(student_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_available_slots_student ON available_slots(student_id)")
+
+
+def _migrate_v2(conn: sqlite3.Connection):
+    """시간표 블록 저장 테이블"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schedule_blocks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            day_of_week INTEGER NOT NULL DEFAULT -1,
+            start_minutes INTEGER NOT NULL DEFAULT -1,
+            duration_minutes INTEGER NOT NULL,
+            FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_schedule_blocks_student ON schedule_blocks(student_id)")
+
+
+def _migrate_v3(conn: sqlite3.Connection):
+    """자원(강사·교실) 테이블과 블록의 resource_id (기존 블록은 0번 '기본' 자원)"""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS resources (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        )
+    """)
+    conn.execute("INSERT OR IGNORE INTO resources (id, name) VALUES (0, '기본')")
+    columns = {r[1] for r in conn.execute("PRAGMA table_info(schedule_blocks)")}
+    if "resource_id" not in columns:
+        conn.execute("ALTER TABLE schedule_blocks ADD COLUMN resource_id INTEGER NOT NULL DEFAULT 0")
+
+
+# PRAGMA user_version 순서대로 적용할 스키마 변경 (n번째 = 버전 n)
+_MIGRATIONS = [_migrate_v1, _migrate_v2, _migrate_v3]
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
+def _migrate(conn: sqlite3.Connection):
+    """user_version보다 새로운 마이그레이션만 한 트랜잭션으로 적용"""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS students (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                age INTEGER NOT NULL DEFAULT 0,
-                phone TEXT DEFAULT '',
-                address TEXT DEFAULT '',
-                class_duration_minutes INTEGER NOT NULL DEFAULT 60,
-                sessions_per_week INTEGER NOT NULL DEFAULT 1
-            )
-        """)
-        try:
-            conn.execute("ALTER TABLE students ADD COLUMN grade TEXT DEFAULT '중1'")
-        except sqlite3.OperationalError:
-            pass
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS unavailable_slots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                day_of_week INTEGER NOT NULL,
-                start_hour INTEGER NOT NULL,
-                start_min INTEGER NOT NULL,
-                end_hour INTEGER NOT NULL,
-                end_min INTEGER NOT NULL,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS available_slots (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER NOT NULL,
-                day_of_week INTEGER NOT NULL,
-                start_hour INTEGER NOT NULL,
-                start_min INTEGER NOT NULL,
-                end_hour INTEGER NOT NULL,
-                end_min INTEGER NOT NULL,
-                FOREIGN KEY (student_id) REFERENCES students(id) ON DELETE CASCADE
-            )
-        """)
+        for migration in _MIGRATIONS[version:]:
+            migration(conn)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.RLock()  # 공유 연결을 여러 스레드가 동시에 쓰지 않도록
+
+
+def get_connection() -> sqlite3.Connection:
+    """프로세스 전체가 공유하는 연결 (처음 호출 때 열고 pragma 설정·마이그레이션 1회)"""
+    global _conn
+    with _lock:
+        if _conn is None:
+            conn = sqlite3.connect(str(_db_path()), check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA cache_size=-16000")  # 약 16MB
+            _migrate(conn)
+            _conn = conn
+        return _conn
+
+
+def close_connection():
+    """공유 연결 닫기 (다음 get_connection 때 다시 열림)"""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+atexit.register(close_connection)
+
+
+def set_db_path(path: str | Path | None):
+    """다른 DB 파일 사용 (None이면 기본 경로) - 대기 중인 쓰기를 마치고 연결을 닫은 뒤 다음 접근 때 새로 연다"""
+    global _path_override
+    flush_writes()
+    close_connection()
+    _path_override = Path(path) if path is not None else None
+
+
+class _BackgroundWriter:
+    """DB 쓰기 전용 백그라운드 스레드 - UI 스레드가 저장을 기다리지 않도록
 
+    submit()으로 넣은 작업은 모였다가 한 트랜잭션으로 실행된다. 같은 key의 작업이
+    아직 실행 전이면 새 작업으로 바꿔치기해(마지막 값만 저장) 맨 뒤로 보낸다.
+    """
 
+    def __init__(self):
+        self._pending: dict = {}  # key -> [fn, args, callbacks]
+        self._cond = threading.Condition()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, key, fn, *args, callback=None):
+        """fn(conn, *args)를 나중에 실행. callback(error)는 쓰기 스레드에서 호출됨 (성공 시 None)"""
+        with self._cond:
+            old = self._pending.pop(key, None)
+            callbacks = old[2] if old else []
+            if callback is not None:
+                callbacks.append(callback)
+            self._pending[key] = [fn, args, callbacks]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """대기 중인 작업이 모두 저장될 때까지 기다림 (시간 초과 시 False)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._busy = True
+            error = None
+            try:
+                _write_batch(batch)
+            except Exception as e:  # 콜백으로 전달 (스레드가 죽지 않게)
+                error = e
+            for _, _, callbacks in batch:
+                for cb in callbacks:
+                    cb(error)
+            if error is not None and not any(callbacks for _, _, callbacks in batch):
+                traceback.print_exception(error)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+
+@perf.timed("db.write_batch")
+def _write_batch(batch: list):
+    """모인 예약 쓰기를 한 트랜잭션으로 실행"""
+    with _transaction() as conn:
+        for fn, args, _ in batch:
+            fn(conn, *args)
+
+
+_writer = _BackgroundWriter()
+
+
+def submit_write(key, fn, *args, callback=None):
+    """백그라운드 쓰기 예약 - fn(conn, *args). 같은 key의 이전 예약은 대체됨"""
+    _writer.submit(key, fn, *args, callback=callback)
+
+
+@perf.timed()
+def flush_writes(timeout: float | None = None) -> bool:
+    """예약된 백그라운드 쓰기가 끝날 때까지 대기"""
+    return _writer.flush(timeout)
+
+
+# 종료 시 남은 쓰기를 먼저 저장한 뒤 연결을 닫음 (atexit은 등록 역순으로 실행)
+atexit.register(flush_writes, 5.0)
+
+
+@contextmanager
+def _transaction():
+    """공유 연결로 트랜잭션 하나 실행 (정상 종료 시 commit, 예외 시 rollback)"""
+    with _lock:
+        conn = get_connection()
+        with conn:
+            yield conn
+
+
+def init_db():
+    """연결을 열어 스키마 준비 (마이그레이션은 프로세스당 한 번만 실행됨)"""
+    get_connection()
+
+
+def _row_to_student(row: tuple, unavailable, available) -> Student:
+    """students 테이블 행(id, name, age, grade, phone, address, 수업 시간, 주당 횟수) → Student"""
+    sid, name, age, grade_val, phone, address, duration, sessions = row
+    if not grade_val:
+        a = age or 0
+        if 7 <= a <= 12:
+            grade_val = ["초1","초2","초3","초4","초5","초6"][a - 7]
+        elif 13 <= a <= 15:
+            grade_val = ["중1","중2","중3"][a - 13]
+        elif 16 <= a <= 18:
+            grade_val = ["고1","고2","고3"][a - 16]
+        else:
+            grade_val = "초1"
+    return Student(
+        id=sid,
+        name=name or "",
+        grade=grade_val,
+        age=age or 0,
+        phone=phone or "",
+        address=address or "",
+        class_duration_minutes=duration or 60,
+        sessions_per_week=sessions or 1,
+        unavailable=unavailable,
+        available=available,
+    )
+
+
+@perf.timed()
+@_gc_paused()
 def load_all_students() -> list[Student]:
-    """DB에서 전체 학생 목록 + 불가 시간대 로드"""
-    init_db()
-    conn = get_connection()
+    """DB에서 전체 학생 목록 + 가능/불가 시간대 로드 (테이블마다 쿼리 1번, 슬롯은 메모리에서 학생별로 묶음)"""
+    flush_writes()  # 대기 중인 학생 추가·수정·삭제를 먼저 반영
     result = []
-    try:
-        cur = conn.execute(
+    with _lock:
+        cur = get_connection().cursor()
+        cur.row_factory = None  # 대량 로드는 튜플 행이 훨씬 빠름
+        unavail_by_student: dict[int, list[UnavailableSlot]] = {}
+        for sid, *vals in cur.execute(
+            "SELECT student_id, day_of_week, start_hour, start_min, end_hour, end_min FROM unavailable_slots ORDER BY id"
+        ):
+            slots = unavail_by_student.get(sid)
+            if slots is None:
+                slots = unavail_by_student[sid] = []
+            slots.append(UnavailableSlot(*vals))
+        avail_by_student: dict[int, list[AvailableSlot]] = {}
+        for sid, *vals in cur.execute(
+            "SELECT student_id, day_of_week, start_hour, start_min, end_hour, end_min FROM available_slots ORDER BY id"
+        ):
+            slots = avail_by_student.get(sid)
+            if slots is None:
+                slots = avail_by_student[sid] = []
+            slots.append(AvailableSlot(*vals))
+        rows = cur.execute(
             "SELECT id, name, age, grade, phone, address, class_duration_minutes, sessions_per_week FROM students ORDER BY id"
-        )
-        for row in cur:
-            sid = row["id"]
-            unavail_cur = conn.execute(
-                "SELECT day_of_week, start_hour, start_min, end_hour, end_min FROM unavailable_slots WHERE student_id = ?",
-                (sid,),
-            )
-            unavail_slots = [
-                UnavailableSlot(
-                    day_of_week=r["day_of_week"],
-                    start_hour=r["start_hour"],
-                    start_min=r["start_min"],
-                    end_hour=r["end_hour"],
-                    end_min=r["end_min"],
-                )
-                for r in unavail_cur
-            ]
-            avail_cur = conn.execute(
-                "SELECT day_of_week, start_hour, start_min, end_hour, end_min FROM available_slots WHERE student_id = ?",
-                (sid,),
-            )
-            avail_slots = [
-                AvailableSlot(
-                    day_of_week=r["day_of_week"],
-                    start_hour=r["start_hour"],
-                    start_min=r["start_min"],
-                    end_hour=r["end_hour"],
-                    end_min=r["end_min"],
-                )
-                for r in avail_cur
-            ]
-            grade_val = row["grade"] if "grade" in row.keys() and row["grade"] else None
-            if not grade_val:
-                a = row["age"] or 0
-                if 7 <= a <= 12:
-                    grade_val = ["초1","초2","초3","초4","초5","초6"][a - 7]
-                elif 13 <= a <= 15:
-                    grade_val = ["중1","중2","중3"][a - 13]
-                elif 16 <= a <= 18:
-                    grade_val = ["고1","고2","고3"][a - 16]
-                else:
-                    grade_val = "초1"
-            result.append(
-                Student(
-                    id=sid,
-                    name=row["name"] or "",
-                    grade=grade_val,
-                    age=row["age"] or 0,
-                    phone=row["phone"] or "",
-                    address=row["address"] or "",
-                    class_duration_minutes=row["class_duration_minutes"] or 60,
-                    sessions_per_week=row["sessions_per_week"] or 1,
-                    unavailable=unavail_slots,
-                    available=avail_slots,
-                )
-            )
-    finally:
-        conn.close()
+        ).fetchall()
+        cur.close()
+    for row in rows:
+        sid = row[0]
+        result.append(_row_to_student(row, unavail_by_student.get(sid, ()), avail_by_student.get(sid, ())))
     return result
 
 
+def iter_students(page_size: int = 1000) -> Iterator[Student]:
+    """학생을 id 순으로 page_size명씩 끊어 읽으며 하나씩 내보냄 (내보내기용, 메모리 일정)"""
+    flush_writes()
+    last_id = -1
+    while True:
+        with _lock:
+            cur = get_connection().cursor()
+            cur.row_factory = None
+            rows = cur.execute(
+                """SELECT id, name, age, grade, phone, address, class_duration_minutes, sessions_per_week
+                   FROM students WHERE id > ? ORDER BY id LIMIT ?""",
+                (last_id, page_size),
+            ).fetchall()
+            if not rows:
+                cur.close()
+                return
+            first, last_id = rows[0][0], rows[-1][0]
+            slots = {}
+            for table, cls in (("unavailable_slots", UnavailableSlot), ("available_slots", AvailableSlot)):
+                by_student: dict[int, list] = {}
+                for sid, *vals in cur.execute(
+                    f"""SELECT student_id, day_of_week, start_hour, start_min, end_hour, end_min FROM {table}
+                        WHERE student_id BETWEEN ? AND ? ORDER BY id""",
+                    (first, last_id),
+                ):
+                    by_student.setdefault(sid, []).append(cls(*vals))
+                slots[table] = by_student
+            cur.close()
+        for row in rows:
+            sid = row[0]
+            yield _row_to_student(row, slots["unavailable_slots"].get(sid, ()), slots["available_slots"].get(sid, ()))
+
+
+@perf.timed()
 def insert_student(s: Student) -> int:
     """학생 추가 후 새 id 반환"""
-    conn = get_connection()
-    try:
-        grade = getattr(s, 'grade', '중1') or '중1'
-        cur = conn.execute(
-            """INSERT INTO students (name, age, grade, phone, address, class_duration_minutes, sessions_per_week)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (s.name, s.age, grade, s.phone or "", s.address or "", s.class_duration_minutes, s.sessions_per_week),
-        )
-        sid = cur.lastrowid
-        for slot in s.unavailable:
-            conn.execute(
-                """INSERT INTO unavailable_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min),
-            )
-        for slot in s.available:
-            conn.execute(
-                """INSERT INTO available_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min),
-            )
-        conn.commit()
-        return sid
-    finally:
-        conn.close()
+    with _transaction() as conn:
+        _insert_student_row(conn, s)
+    return s.id
 
 
+@perf.timed()
 def update_student(s: Student) -> None:
-    """학생 수정 (id 필수). 불가 시간대는 기존 삭제 후 전부 다시 삽입."""
+    """학생 수정 (id 필수). 가능/불가 시간대는 기존 삭제 후 전부 다시 삽입."""
     if s.id is None:
         raise ValueError("update_student requires Student.id")
-    conn = get_connection()
-    try:
-        grade = getattr(s, 'grade', '중1') or '중1'
-        conn.execute(
-            """UPDATE students SET name=?, age=?, grade=?, phone=?, address=?, class_duration_minutes=?, sessions_per_week=?
-               WHERE id=?""",
-            (s.name, s.age, grade, s.phone or "", s.address or "", s.class_duration_minutes, s.sessions_per_week, s.id),
-        )
-        conn.execute("DELETE FROM unavailable_slots WHERE student_id = ?", (s.id,))
-        conn.execute("DELETE FROM available_slots WHERE student_id = ?", (s.id,))
-        for slot in s.unavailable:
-            conn.execute(
+    with _transaction() as conn:
+        _update_student_row(conn, s)
+
+
+def _insert_student_row(conn: sqlite3.Connection, s: Student):
+    """학생 한 명 INSERT (새 id를 s.id에 채움)"""
+    grade = getattr(s, 'grade', '중1') or '중1'
+    cur = conn.execute(
+        """INSERT INTO students (name, age, grade, phone, address, class_duration_minutes, sessions_per_week)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        (s.name, s.age, grade, s.phone or "", s.address or "", s.class_duration_minutes, s.sessions_per_week),
+    )
+    s.id = cur.lastrowid
+    _insert_slots(conn, s.id, s)
+
+
+def _update_student_row(conn: sqlite3.Connection, s: Student, source: Student | None = None):
+    """학생 한 명 UPDATE - s.id가 없으면 source.id 사용 (source의 추가가 먼저 실행된 경우)"""
+    if s.id is None and source is not None:
+        s.id = source.id
+    if s.id is None:
+        raise ValueError("update_student requires Student.id")
+    grade = getattr(s, 'grade', '중1') or '중1'
+    conn.execute(
+        """UPDATE students SET name=?, age=?, grade=?, phone=?, address=?, class_duration_minutes=?, sessions_per_week=?
+           WHERE id=?""",
+        (s.name, s.age, grade, s.phone or "", s.address or "", s.class_duration_minutes, s.sessions_per_week, s.id),
+    )
+    conn.execute("DELETE FROM unavailable_slots WHERE student_id = ?", (s.id,))
+    conn.execute("DELETE FROM available_slots WHERE student_id = ?", (s.id,))
+    _insert_slots(conn, s.id, s)
+
+
+def _insert_slots(conn: sqlite3.Connection, sid: int, s: Student):
+    """가능/불가 시간대 저장 - 겹치거나 중복된 구간은 normalize_slots로 합쳐서"""
+    available, unavailable = normalize_slots(s.available, s.unavailable)
+    conn.executemany(
+        """INSERT INTO unavailable_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        [(sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min) for slot in unavailable],
+    )
+    conn.executemany(
+        """INSERT INTO available_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        [(sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min) for slot in available],
+    )
+
+
+@perf.timed()
+def delete_student(student_id: int) -> None:
+    """학생 삭제 (관련 가능/불가 시간대는 foreign_keys=ON이라 CASCADE로 함께 삭제)"""
+    with _transaction() as conn:
+        conn.execute("DELETE FROM students WHERE id = ?", (student_id,))
+
+
+def _delete_student_row(conn: sqlite3.Connection, s: Student):
+    if s.id is not None:
+        conn.execute("DELETE FROM students WHERE id = ?", (s.id,))
+
+
+def _student_key(s: Student):
+    """같은 학생의 예약 쓰기끼리 합쳐지도록 (아직 id가 없으면 합치지 않음)"""
+    return ("student", s.id) if s.id is not None else object()
+
+
+@perf.timed()
+def insert_student_async(s: Student, callback=None) -> None:
+    """학생 추가를 백그라운드에서 - 실행될 때 s.id가 채워짐"""
+    submit_write(object(), _insert_student_row, s, callback=callback)
+
+
+@perf.timed()
+def update_student_async(s: Student, source: Student | None = None, callback=None) -> None:
+    """학생 수정을 백그라운드에서 - 같은 학생의 대기 중인 수정은 마지막 것만 저장
+
+    s.id가 없으면(source의 추가가 아직 대기 중) 실행 시점의 source.id를 쓴다.
+    예약은 넣은 순서대로 실행되므로 추가가 먼저 끝난다.
+    """
+    submit_write(_student_key(s), _update_student_row, s, source, callback=callback)
+
+
+@perf.timed()
+def delete_student_async(s: Student, callback=None) -> None:
+    """학생 삭제를 백그라운드에서 - 대기 중인 같은 학생의 수정은 버려짐"""
+    submit_write(_student_key(s), _delete_student_row, s, callback=callback)
+
+
+@perf.timed()
+def bulk_upsert_students(students: Iterable[Student], chunk_size: int = 1000) -> int:
+    """여러 학생을 한 트랜잭션으로 저장하고 저장한 학생 수 반환
+
+    id가 있으면 해당 학생을 덮어쓰고(가능/불가 시간대도 교체, 겹친 구간은 합쳐서), 없으면 새 id를 붙여 추가한다.
+    students는 chunk_size명씩 끊어 executemany로 넣으므로 제너레이터를 넘기면 메모리가 일정하다
+    (새 id를 붙일 학생만 커밋 때까지 잡아 둠). 중간에 예외가 나면 전체가 롤백되고,
+    새 id는 커밋이 끝난 뒤에야 학생에 붙이므로 롤백되면 id가 None 그대로다.
+    """
+    count = 0
+    new_ids: list[tuple[Student, int]] = []  # (새 학생, 커밋 후 붙일 id)
+    with _transaction() as conn:
+        seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'students'").fetchone()
+        max_id = conn.execute("SELECT MAX(id) FROM students").fetchone()[0]
+        next_id = max(seq[0] if seq else 0, max_id or 0) + 1
+        it = iter(students)
+        while True:
+            chunk = list(islice(it, chunk_size))
+            if not chunk:
+                break
+            chunk_ids = []
+            for s in chunk:
+                sid = s.id
+                if sid is None:
+                    sid = next_id
+                    new_ids.append((s, sid))
+                chunk_ids.append(sid)
+                next_id = max(next_id, sid + 1)
+            conn.executemany(
+                """INSERT INTO students (id, name, age, grade, phone, address, class_duration_minutes, sessions_per_week)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                       name=excluded.name, age=excluded.age, grade=excluded.grade, phone=excluded.phone,
+                       address=excluded.address, class_duration_minutes=excluded.class_duration_minutes,
+                       sessions_per_week=excluded.sessions_per_week""",
+                (
+                    (sid, s.name, s.age, getattr(s, 'grade', '중1') or '중1', s.phone or "", s.address or "",
+                     s.class_duration_minutes, s.sessions_per_week)
+                    for sid, s in zip(chunk_ids, chunk)
+                ),
+            )
+            ids = [(sid,) for sid in chunk_ids]
+            slots = [(sid, *normalize_slots(s.available, s.unavailable)) for sid, s in zip(chunk_ids, chunk)]
+            conn.executemany("DELETE FROM unavailable_slots WHERE student_id = ?", ids)
+            conn.executemany("DELETE FROM available_slots WHERE student_id = ?", ids)
+            conn.executemany(
                 """INSERT INTO unavailable_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
                    VALUES (?, ?, ?, ?, ?, ?)""",
-                (s.id, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min),
+                (
+                    (sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min)
+                    for sid, _, unavailable in slots for slot in unavailable
+                ),
             )
-        for slot in s.available:
-            conn.execute(
+            conn.executemany(
                 """INSERT INTO available_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
                    VALUES (?, ?, ?, ?, ?, ?)""",
-                (s.id, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min),
+                (
+                    (sid, slot.day_of_week, slot.start_hour, slot.start_min, slot.end_hour, slot.end_min)
+                    for sid, available, _ in slots for slot in available
+                ),
             )
-        conn.commit()
-    finally:
-        conn.close()
+            count += len(chunk)
+    for s, sid in new_ids:
+        s.id = sid
+    return count
 
 
-def delete_student(student_id: int) -> None:
-    """학생 삭제 (관련 불가 시간대는 CASCADE로 함께 삭제)"""
-    conn = get_connection()
-    try:
-        conn.execute("DELETE FROM students WHERE id = ?", (student_id,))
-        conn.execute("DELETE FROM unavailable_slots WHERE student_id = ?", (student_id,))
-        conn.execute("DELETE FROM available_slots WHERE student_id = ?", (student_id,))
-        conn.commit()
-    finally:
-        conn.close()
+@perf.timed()
+def load_schedule(students: list[Student]) -> list[ScheduleBlock]:
+    """저장된 시간표 블록 로드 (student_index는 students 목록 기준, 목록에 없는 학생의 블록은 제외)"""
+    index_by_id = {s.id: i for i, s in enumerate(students) if s.id is not None}
+    with _lock:
+        rows = get_connection().execute(
+            "SELECT id, student_id, day_of_week, start_minutes, duration_minutes, resource_id"
+            " FROM schedule_blocks ORDER BY id"
+        ).fetchall()
+    blocks = []
+    for bid, sid, day, start, duration, resource in rows:
+        si = index_by_id.get(sid)
+        if si is not None:
+            blocks.append(ScheduleBlock(si, day, start, duration, id=bid, resource_id=resource))
+    return blocks
+
+
+@perf.timed()
+def save_schedule(blocks: list[ScheduleBlock], students: list[Student]) -> None:
+    """시간표 전체를 새로 저장 (기존 블록 삭제). 저장한 블록에는 새 id가 붙는다."""
+    flush_writes()  # 추가가 대기 중인 학생도 id가 붙은 뒤 저장
+    with _transaction() as conn:
+        conn.execute("DELETE FROM schedule_blocks")
+        for b in blocks:
+            if 0 <= b.student_index < len(students) and students[b.student_index].id is not None:
+                cur = conn.execute(
+                    """INSERT INTO schedule_blocks (student_id, day_of_week, start_minutes, duration_minutes, resource_id)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (students[b.student_index].id, b.day_of_week, b.start_minutes, b.duration_minutes, b.resource_id),
+                )
+                b.id = cur.lastrowid
+            else:
+                b.id = None
+
+
+def _replace_schedule_rows(conn: sqlite3.Connection, rows: list, ids: list):
+    conn.execute("DELETE FROM schedule_blocks")
+    for student, day, start, duration, resource in rows:
+        if student is None or student.id is None:
+            ids.append(None)
+            continue
+        cur = conn.execute(
+            """INSERT INTO schedule_blocks (student_id, day_of_week, start_minutes, duration_minutes, resource_id)
+               VALUES (?, ?, ?, ?, ?)""",
+            (student.id, day, start, duration, resource),
+        )
+        ids.append(cur.lastrowid)
+
+
+@perf.timed()
+def save_schedule_async(blocks: list[ScheduleBlock], students: list[Student], callback=None) -> list:
+    """save_schedule를 백그라운드에서 - 배치는 지금 값으로 찍어 두고 블록 객체는 건드리지 않음
+
+    반환한 목록에 블록 순서대로 새 id(학생이 저장 안 됐으면 None)가 채워진다. 성공한 callback(None)
+    안에서 읽을 것 - 그 전에 다른 시간표 저장으로 대체되면 비어 있다. 학생 id는 쓰는 시점에 읽으므로
+    앞서 예약한 학생 추가의 id도 반영된다.
+    """
+    rows = [
+        (students[b.student_index] if 0 <= b.student_index < len(students) else None,
+         b.day_of_week, b.start_minutes, b.duration_minutes, b.resource_id)
+        for b in blocks
+    ]
+    ids: list = []
+    submit_write("schedule", _replace_schedule_rows, rows, ids, callback=callback)
+    return ids
+
+
+def _upsert_block_row(conn: sqlite3.Connection, row: tuple):
+    conn.execute(
+        """INSERT INTO schedule_blocks (id, student_id, day_of_week, start_minutes, duration_minutes, resource_id)
+           VALUES (?, ?, ?, ?, ?, ?)
+           ON CONFLICT(id) DO UPDATE SET
+               student_id=excluded.student_id, day_of_week=excluded.day_of_week,
+               start_minutes=excluded.start_minutes, duration_minutes=excluded.duration_minutes,
+               resource_id=excluded.resource_id""",
+        row,
+    )
+
+
+@perf.timed()
+def save_block_async(block: ScheduleBlock, student_id: int, callback=None) -> None:
+    """블록 하나의 현재 배치를 백그라운드에서 저장 (id 필수, 한 행 UPSERT)"""
+    if block.id is None:
+        raise ValueError("save_block_async requires ScheduleBlock.id")
+    row = (block.id, student_id, block.day_of_week, block.start_minutes, block.duration_minutes, block.resource_id)
+    submit_write(("schedule_block", block.id), _upsert_block_row, row, callback=callback)
+
+
+@perf.timed()
+def load_resources() -> list[str]:
+    """자원(강사·교실) 이름 목록 (목록 위치 = resource_id)"""
+    with _lock:
+        rows = get_connection().execute("SELECT id, name FROM resources ORDER BY id").fetchall()
+    names = {rid: name for rid, name in rows}
+    return [names.get(i, f"자원 {i + 1}") for i in range(max(names, default=0) + 1)]
+
+
+@perf.timed()
+def save_resources(names: list[str]) -> None:
+    """자원 이름 목록 저장 (목록 위치 = resource_id, 목록보다 뒤 번호는 삭제)"""
+    with _transaction() as conn:
+        conn.executemany(
+            "INSERT INTO resources (id, name) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET name=excluded.name",
+            list(enumerate(names)),
+        )
+        conn.execute("DELETE FROM resources WHERE id >= ?", (len(names),))
@@ -1,12 +1,23 @@
 import sys
 import traceback
+import multiprocessing
 
 def excepthook(etype, value, tb):
     traceback.print_exception(etype, value, tb)
     input("엔터를 누르면 종료합니다...")
 
 def main():
+    # exe(PyInstaller)에서 자동 배치 프로세스 풀이 창을 또 띄우지 않도록
+    multiprocessing.freeze_support()
     sys.excepthook = excepthook
+    # --profile: 성능 계측 (종료 시 출력, Ctrl+Shift+P 창), --profile-capture=cprofile|tracemalloc: 첫 동작 기록
+    import perf
+    for arg in sys.argv[1:]:
+        if arg == "--profile":
+            perf.enable()
+        elif arg.startswith("--profile-capture="):
+            perf.enable()
+            perf.arm(arg.split("=", 1)[1])
     try:
         from PyQt6.QtWidgets import QApplication
         from main_window import MainWindow
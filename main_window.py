@@ -1,12 +1,85 @@
+import os
+import sqlite3
+import threading
+from dataclasses import replace
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QStackedWidget, QMessageBox, QDialog
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLabel, QListView, QLineEdit, QStackedWidget, QMessageBox, QDialog, QFileDialog, QComboBox,
+    QInputDialog, QProgressDialog, QSpinBox, QCheckBox
 )
+from PyQt6.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QShortcut, QKeySequence
 from student import Student, GRADES
-from student_dialog import StudentDialog
 from schedule_generator import ScheduleGenerator, ScheduleBlock
-from timetable_widget import TimetableWidget, GRADE_COLORS
+from time_grid import TimeGrid, SLOT_CHOICES, ALL_DAYS
+from student_list import StudentListModel, StudentFilterProxy, SORT_CHOICES
 import db
+import perf
+import student_io
+
+# student_dialog, timetable_widget는 처음 쓸 때 불러옴 (창을 먼저 띄우기 위해)
+
+STUDENT_FILE_FILTER = "학생 파일 (*.csv *.json *.jsonl)"
+
+
+@perf.action("load_students")
+def _load_all() -> tuple[list[Student], list[ScheduleBlock], list[str]]:
+    students = db.load_all_students()
+    return students, db.load_schedule(students), db.load_resources()
+
+
+class _StudentLoader(QThread):
+    """DB에서 학생·시간표·자원을 읽는 스레드 (창이 뜬 뒤에 시작)"""
+    loaded = pyqtSignal(object, object, object)  # students, blocks, resources
+    failed = pyqtSignal(str)
+
+    def run(self):
+        try:
+            students, blocks, resources = _load_all()
+        except Exception as e:  # DB 손상 등 - 창은 그대로 두고 알림
+            self.failed.emit(str(e))
+            return
+        self.loaded.emit(students, blocks, resources)
+
+
+class _ScheduleSearcher(QThread):
+    """“더 찾기” 스레드 - 프로세스 풀을 기다리는 동안 창이 멈추지 않게 (cancel.set()으로 중단)"""
+    found = pyqtSignal(object)  # 가장 좋은 블록 목록 (취소하면 None)
+    failed = pyqtSignal(str)
+
+    def __init__(self, gen: ScheduleGenerator, parent=None):
+        super().__init__(parent)
+        self.gen = gen
+        self.cancel = threading.Event()
+
+    def run(self):
+        gen = self.gen
+        try:
+            best = gen.search(gen.generate(), restarts=2 * (os.cpu_count() or 1), time_budget=2.0, cancel=self.cancel)
+        except Exception as e:  # 작업 프로세스가 죽는 등 - 기존 시간표는 그대로 두고 알림
+            self.failed.emit(str(e))
+            return
+        self.found.emit(best)
+
+
+class _WriteRelay(QObject):
+    """DB 쓰기 스레드의 완료 콜백(error)을 UI 스레드에서 실행되도록 넘김"""
+    finished = pyqtSignal(object, object)  # fn, error
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.finished.connect(self._call)
+
+    def wrap(self, fn):
+        def callback(error):
+            try:
+                self.finished.emit(fn, error)
+            except RuntimeError:  # 창이 이미 닫힘
+                pass
+        return callback
+
+    def _call(self, fn, error):
+        fn(error)
 
 
 class MainWindow(QMainWindow):
@@ -14,13 +87,30 @@ class MainWindow(QMainWindow):
         super().__init__(parent)
         self.students: list[Student] = []
         self.blocks: list[ScheduleBlock] = []
-        self.student_list = QListWidget()
+        self.resources: list[str] = ["기본"]  # 강사·교실 이름 (위치 = resource_id)
+        self.time_grid = TimeGrid()  # 자동 배치와 시간표 그리드가 같이 쓰는 시간 격자
+        self.student_model = StudentListModel(self.students, self)
+        self.student_proxy = StudentFilterProxy(self)
+        self.student_proxy.setSourceModel(self.student_model)
+        self.student_list = QListView()
+        self.student_list.setModel(self.student_proxy)
+        self.student_list.setUniformItemSizes(True)  # 1만 명도 줄 높이를 한 번만 계산
         self.stack = QStackedWidget()
-        self.timetable_widget = TimetableWidget()
+        self._timetable_widget = None  # 시간표 페이지는 처음 열 때 만듦
+        self._data_buttons: list[QPushButton] = []
+        self._loader: _StudentLoader | None = None
+        self._searcher: _ScheduleSearcher | None = None
+        self._search_progress: QProgressDialog | None = None
+        self._relay = _WriteRelay(self)
+        self._write_errors: list[str] = []
         self._setup_ui()
-        self._load_students_from_db()
+        self._set_loading(True)
+        QTimer.singleShot(0, self._start_loading)  # 창이 그려진 뒤 백그라운드에서 불러오기
         self.setWindowTitle("시간표 관리 프로그램")
         self.resize(1000, 700)
+        self._perf_panel = None
+        if perf.enabled():
+            QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self._show_perf_panel)
 
     def _setup_ui(self):
         central = QWidget()
@@ -46,10 +136,34 @@ class MainWindow(QMainWindow):
         remove_btn.clicked.connect(self._remove_student)
         top_bar.addWidget(remove_btn)
         top_bar.addStretch()
+        import_btn = QPushButton("가져오기")
+        import_btn.setFixedWidth(80)
+        import_btn.clicked.connect(self._import_students)
+        top_bar.addWidget(import_btn)
+        export_btn = QPushButton("내보내기")
+        export_btn.setFixedWidth(80)
+        export_btn.clicked.connect(self._export_students)
+        top_bar.addWidget(export_btn)
         list_layout.addLayout(top_bar)
+        self._data_buttons += [add_btn, edit_btn, remove_btn, import_btn, export_btn]
+
+        search_bar = QHBoxLayout()
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("이름·학년 검색")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.student_proxy.set_filter)
+        search_bar.addWidget(self.search_edit)
+        self.sort_combo = QComboBox()
+        for label, _ in SORT_CHOICES:
+            self.sort_combo.addItem(label)
+        self.sort_combo.currentIndexChanged.connect(lambda i: self.student_proxy.set_sort(SORT_CHOICES[i][1]))
+        search_bar.addWidget(self.sort_combo)
+        list_layout.addLayout(search_bar)
 
+        self.loading_label = QLabel("학생 목록을 불러오는 중…")
+        list_layout.addWidget(self.loading_label)
         self.student_list.setMinimumHeight(150)
-        self.student_list.itemDoubleClicked.connect(self._edit_student)
+        self.student_list.doubleClicked.connect(self._edit_student)
         list_layout.addWidget(self.student_list)
 
         schedule_bar = QHBoxLayout()
@@ -57,18 +171,39 @@ class MainWindow(QMainWindow):
         gen_btn.setStyleSheet("QPushButton { font-weight: bold; padding: 10px 20px; }")
         gen_btn.clicked.connect(self._generate_schedule)
         schedule_bar.addWidget(gen_btn)
+        auto_btn = QPushButton("자동 배치")
+        auto_btn.setStyleSheet("QPushButton { padding: 10px 20px; }")
+        auto_btn.clicked.connect(self._auto_schedule)
+        schedule_bar.addWidget(auto_btn)
+        search_btn = QPushButton("자동 배치 (더 찾기)")
+        search_btn.setStyleSheet("QPushButton { padding: 10px 20px; }")
+        search_btn.clicked.connect(self._search_schedule)
+        schedule_bar.addWidget(search_btn)
         schedule_bar.addStretch()
         list_layout.addLayout(schedule_bar)
+        self._data_buttons += [gen_btn, auto_btn, search_btn]
 
         list_layout.addWidget(QLabel(
             "※ '시간표 짜기'를 누르면 오른쪽에 학생별 블록이 생깁니다. 블록을 끌어다 시간표에 놓으면 됩니다.\n"
-            "  블록을 누르거나 드래그하면 해당 학생의 가능한 시간이 하이라이트됩니다."
+            "  블록을 누르거나 드래그하면 해당 학생의 가능한 시간이 하이라이트됩니다.\n"
+            "※ '자동 배치'는 모든 블록을 가능한 시간에 겹치지 않게 자동으로 놓고, 못 놓은 블록만 오른쪽에 남깁니다.\n"
+            "  '더 찾기'는 여러 CPU 코어에서 순서를 바꿔 여러 번 시도해 가장 많이 놓은 결과를 고릅니다."
         ))
         list_layout.addStretch()
 
         self.stack.addWidget(list_page)
 
-        # 시간표 페이지
+        main_layout.addWidget(self.stack)
+
+    @property
+    def timetable_widget(self):
+        """시간표 페이지 (처음 접근할 때 timetable_widget을 불러와 만듦)"""
+        if self._timetable_widget is None:
+            self._timetable_widget = self._build_timetable_page()
+        return self._timetable_widget
+
+    def _build_timetable_page(self):
+        from timetable_widget import TimetableWidget, GRADE_COLORS, DAY_NAMES
         timetable_page = QWidget()
         timetable_layout = QVBoxLayout(timetable_page)
         back_btn = QPushButton("← 학생 목록으로")
@@ -82,36 +217,107 @@ class MainWindow(QMainWindow):
             lbl.setStyleSheet(f"background-color: rgb({rgb[0]},{rgb[1]},{rgb[2]}); padding: 2px 8px; border-radius: 3px;")
             legend_layout.addWidget(lbl)
         legend_layout.addStretch()
+        legend_layout.addWidget(QLabel("칸 단위"))
+        self.slot_combo = QComboBox()
+        for m in SLOT_CHOICES:
+            self.slot_combo.addItem(f"{m}분", m)
+        self.slot_combo.setCurrentIndex(SLOT_CHOICES.index(self.time_grid.slot_minutes))
+        self.slot_combo.currentIndexChanged.connect(self._change_time_grid)
+        legend_layout.addWidget(self.slot_combo)
+        # 시간 범위·요일 (자동 배치도 같은 격자를 씀)
+        self.start_hour_spin = QSpinBox()
+        self.start_hour_spin.setRange(0, 23)
+        self.start_hour_spin.setSuffix("시")
+        self.end_hour_spin = QSpinBox()
+        self.end_hour_spin.setRange(1, 24)
+        self.end_hour_spin.setSuffix("시")
+        legend_layout.addWidget(self.start_hour_spin)
+        legend_layout.addWidget(QLabel("~"))
+        legend_layout.addWidget(self.end_hour_spin)
+        self.day_checks = {}
+        for d in ALL_DAYS:
+            check = QCheckBox(DAY_NAMES[d])
+            self.day_checks[d] = check
+            legend_layout.addWidget(check)
+        self._sync_time_grid_controls()
+        self.start_hour_spin.valueChanged.connect(self._change_time_grid)
+        self.end_hour_spin.valueChanged.connect(self._change_time_grid)
+        for check in self.day_checks.values():
+            check.toggled.connect(self._change_time_grid)
+        legend_layout.addWidget(QLabel("자원"))
+        self.resource_combo = QComboBox()
+        self.resource_combo.addItems(self.resources)
+        self.resource_combo.currentIndexChanged.connect(self._change_resource)
+        legend_layout.addWidget(self.resource_combo)
+        add_resource_btn = QPushButton("추가")
+        add_resource_btn.clicked.connect(self._add_resource)
+        legend_layout.addWidget(add_resource_btn)
         timetable_layout.addLayout(legend_layout)
-        self.timetable_widget.setMinimumSize(800, 500)
-        timetable_layout.addWidget(self.timetable_widget)
+        widget = TimetableWidget()
+        widget.block_changed.connect(self._on_block_moved)
+        widget.set_time_grid(self.time_grid)
+        widget.setMinimumSize(800, 500)
+        timetable_layout.addWidget(widget)
         self.stack.addWidget(timetable_page)
+        return widget
 
-        main_layout.addWidget(self.stack)
+    def _start_loading(self):
+        if self._loader is not None:
+            return
+        self._loader = _StudentLoader(self)
+        self._loader.loaded.connect(self._on_loaded)
+        self._loader.failed.connect(self._on_load_failed)
+        self._loader.start()
+
+    def _set_loading(self, loading: bool):
+        for btn in self._data_buttons:
+            btn.setEnabled(not loading)
+        self.student_list.setEnabled(not loading)
+        self.loading_label.setVisible(loading)
+
+    def _on_loaded(self, students: list[Student], blocks: list[ScheduleBlock], resources: list[str]):
+        self.students = students
+        self.blocks = blocks
+        self._set_resources(resources)
+        self._set_loading(False)
+        self.student_model.reset(self.students)
+
+    def _on_load_failed(self, message: str):
+        self._set_loading(False)
+        QMessageBox.warning(self, "오류", f"학생 목록을 불러오지 못했습니다.\n{message}")
 
     def _load_students_from_db(self):
-        self.students = db.load_all_students()
-        self._update_student_list()
+        """동기 불러오기 (가져오기 직후 등)"""
+        db.flush_writes()
+        QApplication.sendPostedEvents(self._relay)  # 남은 쓰기 결과(실패 시 되돌리기)를 먼저 처리
+        self.students, self.blocks, resources = _load_all()
+        self._set_resources(resources)
+        self.student_model.reset(self.students)
 
     def _add_student(self):
-        dlg = StudentDialog(self)
+        from student_dialog import StudentDialog
+        dlg = StudentDialog(self, self.time_grid)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             s = dlg.get_student()
             if not s.name.strip():
                 QMessageBox.warning(self, "오류", "이름을 입력해주세요.")
                 return
-            new_id = db.insert_student(s)
-            s.id = new_id
-            self.students.append(s)
-            self._update_student_list()
+            # 목록에 먼저 넣고 저장은 백그라운드에서 (실패하면 되돌림)
+            self.student_model.append(s)
+            db.insert_student_async(s, callback=self._on_written(lambda: self._rollback_add(s)))
+
+    def _current_row(self) -> int:
+        """선택한 학생의 인덱스 (검색·정렬 중에도 self.students 기준, 없으면 -1)"""
+        return self.student_proxy.source_row(self.student_list.currentIndex())
 
     def _edit_student(self):
-        row = self.student_list.currentRow()
+        row = self._current_row()
         if row < 0 or row >= len(self.students):
             QMessageBox.warning(self, "알림", "수정할 학생을 선택해주세요.")
             return
+        from student_dialog import StudentDialog
         s = self.students[row]
-        dlg = StudentDialog(self)
+        dlg = StudentDialog(self, self.time_grid)
         dlg.setWindowTitle("학생 수정")
         dlg.set_student(s)
         if dlg.exec() == QDialog.DialogCode.Accepted:
@@ -120,43 +326,347 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "오류", "이름을 입력해주세요.")
                 return
             updated.id = s.id
-            db.update_student(updated)
-            self.students[row] = updated
-            self._update_student_list()
+            self.student_model.replace(row, updated)
+            self._student_changed(row)
+            # 시간표 고치기는 학생 저장이 끝난 뒤에 (실패해서 학생을 되돌리면 블록도 예전 가능 시간 그대로)
+            db.update_student_async(updated, source=s, callback=self._on_written(
+                lambda: self._rollback_edit(s, updated), saved=lambda: self._repair_after_edit(updated)))
+
+    def _repair_after_edit(self, updated: Student):
+        """수정 저장이 끝남 - 그 사이 다시 수정·삭제되지 않았으면 그 학생 블록만 고침"""
+        row = self.student_model.row_of(updated)
+        if row is not None and self.blocks:
+            self._repair_schedule(row)
+
+    def _repair_schedule(self, row: int):
+        """학생 한 명이 바뀐 뒤 시간표를 새로 짜지 않고 그 학생 블록만 고침"""
+        before = {id(b): (b.day_of_week, b.start_minutes, b.duration_minutes, b.resource_id) for b in self.blocks}
+        count = len(self.blocks)
+        gen = ScheduleGenerator(self.students, self.time_grid, len(self.resources))
+        gen.repair(self.blocks, {row})
+        if len(self.blocks) != count:
+            self._save_schedule()  # 블록 수가 바뀌면 통째로 저장
+        else:
+            for bi, b in enumerate(self.blocks):
+                if before[id(b)] != (b.day_of_week, b.start_minutes, b.duration_minutes, b.resource_id):
+                    self._save_block(bi)
+        self._refresh_timetable()
+        self._report_unplaced(gen)
+
+    def _save_schedule(self):
+        """self.blocks 전체를 백그라운드에서 새로 저장 - 새 id는 저장이 끝난 뒤 UI 스레드에서 붙임"""
+        blocks = list(self.blocks)
+        old_ids = [b.id for b in blocks]
+        placed = [(b.day_of_week, b.start_minutes, b.resource_id) for b in blocks]
+        for b in blocks:
+            b.id = None  # 저장이 끝날 때까지 블록 하나씩 저장(_save_block)은 건너뜀 - 옛 id 행은 곧 지워짐
+        ids = db.save_schedule_async(blocks, self.students, callback=self._on_written(
+            lambda: self._restore_block_ids(blocks, old_ids),
+            saved=lambda: self._schedule_saved(blocks, ids, placed)))
+
+    def _schedule_saved(self, blocks: list[ScheduleBlock], ids: list, placed: list[tuple]):
+        """시간표 저장 끝 - 새 id를 붙이고, 저장하는 사이 옮긴 블록은 한 번 더 저장"""
+        if len(ids) != len(blocks):  # 뒤에 예약한 시간표 저장으로 대체됨 (그쪽에서 id를 붙임)
+            return
+        moved = []
+        for b, bid, where in zip(blocks, ids, placed):
+            b.id = bid
+            if (b.day_of_week, b.start_minutes, b.resource_id) != where:
+                moved.append(b)
+        if moved:
+            index = {id(b): bi for bi, b in enumerate(self.blocks)}
+            for b in moved:
+                if id(b) in index:
+                    self._save_block(index[id(b)])
+
+    def _restore_block_ids(self, blocks: list[ScheduleBlock], old_ids: list):
+        """시간표 저장 실패 - DB에는 예전 행이 그대로이므로 예전 id로 되돌림"""
+        for b, bid in zip(blocks, old_ids):
+            b.id = bid
+
+    def _refresh_timetable(self):
+        """self.blocks를 제자리에서 바꾼 뒤 시간표 화면(점유 색인·미배정 풀·하이라이트)을 다시 맞춤"""
+        if self._timetable_widget is not None:
+            self._timetable_widget.set_students(self.students)
+            self._timetable_widget.set_blocks(self.blocks)
+
+    def _student_changed(self, row: int):
+        """학생 정보만 바뀜 - 시간표 화면에서 그 학생 블록만 다시 그림"""
+        if self._timetable_widget is not None:
+            self._timetable_widget.student_changed(row)
 
     def _remove_student(self):
-        row = self.student_list.currentRow()
+        row = self._current_row()
         if 0 <= row < len(self.students):
             s = self.students[row]
-            if s.id is not None:
-                db.delete_student(s.id)
-            self.students.pop(row)
-            self._update_student_list()
-
-    def _update_student_list(self):
-        self.student_list.clear()
-        for s in self.students:
-            sessions = getattr(s, 'sessions_per_week', 1)
-            grade = getattr(s, 'grade', '중1') or '중1'
-            self.student_list.addItem(f"{s.name} ({grade}) - {s.class_duration_minutes}분 수업, 주 {sessions}회")
-
-    def _generate_schedule(self):
+            removed = self._drop_student(row)
+            # 저장된 블록도 CASCADE로 삭제
+            db.delete_student_async(s, callback=self._on_written(lambda: self._rollback_remove(s, row, removed)))
+
+    def _drop_student(self, row: int) -> list[ScheduleBlock]:
+        """메모리에서 학생과 그 블록을 빼고 (뒤 학생들의 인덱스는 하나씩 당김) 뺀 블록 반환"""
+        self.student_model.pop(row)
+        removed = [b for b in self.blocks if b.student_index == row]
+        self.blocks[:] = [b for b in self.blocks if b.student_index != row]
+        for b in self.blocks:
+            if b.student_index > row:
+                b.student_index -= 1
+        if removed or self.blocks:
+            self._refresh_timetable()
+        return removed
+
+    def _on_written(self, rollback, saved=None):
+        """백그라운드 쓰기 완료 콜백 - 실패하면 UI 스레드에서 rollback() 후 알림, 성공하면 saved()"""
+        def done(error):
+            if error is None:
+                if saved is not None:
+                    saved()
+                return
+            rollback()
+            self._write_errors.append(str(error))
+            if len(self._write_errors) == 1:  # 한 트랜잭션의 실패는 한 번만 알림
+                QTimer.singleShot(0, self._report_write_errors)
+        return self._relay.wrap(done)
+
+    def _rollback_add(self, s: Student):
+        row = self.student_model.row_of(s)
+        if row is not None:
+            self._drop_student(row)
+
+    def _rollback_edit(self, old: Student, updated: Student):
+        row = self.student_model.row_of(updated)
+        if row is not None:
+            self.student_model.replace(row, old)
+            self._student_changed(row)
+
+    def _rollback_remove(self, s: Student, row: int, removed: list[ScheduleBlock]):
+        row = min(row, len(self.students))
+        self.student_model.insert(row, s)
+        for b in self.blocks:
+            if b.student_index >= row:
+                b.student_index += 1
+        for b in removed:
+            b.student_index = row
+        self.blocks.extend(removed)
+        if self.blocks:
+            self._refresh_timetable()
+
+    def _report_write_errors(self):
+        errors = sorted(set(self._write_errors))
+        self._write_errors.clear()
+        QMessageBox.warning(self, "오류", "저장에 실패해 변경을 되돌렸습니다.\n" + "\n".join(errors))
+
+    @pyqtSlot()  # 버튼 clicked(bool) 인자를 넘기지 않도록 (perf 래퍼는 *args를 받음)
+    @perf.action("import_students")
+    def _import_students(self):
+        path, _ = QFileDialog.getOpenFileName(self, "학생 가져오기", "", STUDENT_FILE_FILTER)
+        if not path:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            count = student_io.import_students(path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            QApplication.restoreOverrideCursor()
+            QMessageBox.warning(self, "오류", f"가져오기에 실패했습니다. (아무것도 저장되지 않음)\n{e}")
+            return
+        self._load_students_from_db()
+        QApplication.restoreOverrideCursor()
+        QMessageBox.information(self, "가져오기", f"학생 {count}명을 저장했습니다.")
+
+    @pyqtSlot()
+    @perf.action("export_students")
+    def _export_students(self):
+        path, _ = QFileDialog.getSaveFileName(self, "학생 내보내기", "students.csv", STUDENT_FILE_FILTER)
+        if not path:
+            return
+        try:
+            count = student_io.export_students(path)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            QMessageBox.warning(self, "오류", f"내보내기에 실패했습니다.\n{e}")
+            return
+        QMessageBox.information(self, "내보내기", f"학생 {count}명을 내보냈습니다.")
+
+    @pyqtSlot()
+    @perf.action("generate_schedule")
+    def _generate_schedule(self, auto_place: bool = False):
+        if not self.students:
+            QMessageBox.warning(self, "오류", "학생을 먼저 추가해주세요.")
+            return
+        if not self._confirm_regenerate():
+            return
+        gen = ScheduleGenerator(self.students, self.time_grid, len(self.resources))
+        self.blocks = gen.generate(auto_place=auto_place)
+        self._apply_new_schedule()
+        if auto_place:
+            self._report_unplaced(gen)
+
+    def _auto_schedule(self):
+        self._generate_schedule(auto_place=True)
+
+    @pyqtSlot()
+    @perf.action("search_schedule")
+    def _search_schedule(self):
         if not self.students:
             QMessageBox.warning(self, "오류", "학생을 먼저 추가해주세요.")
             return
-        gen = ScheduleGenerator(self.students)
-        gen.set_time_range(9, 21)
-        self.blocks = gen.generate()
+        if self._searcher is not None or not self._confirm_regenerate():
+            return
+        # 찾는 동안 학생 목록을 못 바꾸게 창을 막는 진행 창 (취소 가능)
+        progress = QProgressDialog("여러 순서로 배치해 보는 중…", "취소", 0, 0, self)
+        progress.setWindowTitle("자동 배치 (더 찾기)")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        self._searcher = searcher = _ScheduleSearcher(
+            ScheduleGenerator(list(self.students), self.time_grid, len(self.resources)), self)
+        self._search_progress = progress
+        progress.canceled.connect(searcher.cancel.set)
+        searcher.found.connect(self._on_searched)
+        searcher.failed.connect(self._on_search_failed)
+        searcher.finished.connect(self._search_finished)
+        searcher.start()
+        progress.show()
+
+    def _on_searched(self, best: list[ScheduleBlock] | None):
+        gen = self._searcher.gen
+        self._search_progress.reset()
+        if best is None:  # 취소 - 기존 시간표 그대로
+            return
+        self.blocks = best
+        self._apply_new_schedule()
+        self._report_unplaced(gen)
+
+    def _on_search_failed(self, message: str):
+        self._search_progress.reset()
+        QMessageBox.warning(self, "오류", f"자동 배치(더 찾기)에 실패했습니다.\n{message}")
+
+    def _search_finished(self):
+        self._search_progress.deleteLater()
+        self._searcher.deleteLater()
+        self._searcher = self._search_progress = None
+
+    def _confirm_regenerate(self) -> bool:
+        """저장된 시간표가 있으면 새로 짤지 묻기 (아니오 → 기존 시간표 열기)"""
+        if not self.blocks:
+            return True
+        answer = QMessageBox.question(
+            self, "시간표 짜기",
+            "저장된 시간표가 있습니다. 새로 짜면 기존 배치가 지워집니다.\n"
+            "새로 짤까요? ('아니오'를 누르면 저장된 시간표를 엽니다)",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No | QMessageBox.StandardButton.Cancel,
+            QMessageBox.StandardButton.No,
+        )
+        if answer == QMessageBox.StandardButton.No:
+            self.timetable_widget.set_students(self.students)
+            self.timetable_widget.set_blocks(self.blocks)
+            self._show_timetable()
+        return answer == QMessageBox.StandardButton.Yes
+
+    def _apply_new_schedule(self):
+        """새로 만든 시간표를 DB에 통째로 저장(백그라운드)하고 화면에 표시"""
+        self._save_schedule()
         self.timetable_widget.set_students(self.students)
         self.timetable_widget.set_blocks(self.blocks)
         self._show_timetable()
 
+    def _on_block_moved(self, block_idx: int):
+        """시간표 화면에서 옮긴 블록 - 화면의 배치를 self.blocks에 옮겨 적고 저장"""
+        if not 0 <= block_idx < len(self.blocks):
+            return
+        view, b = self.timetable_widget.blocks[block_idx], self.blocks[block_idx]
+        b.day_of_week, b.start_minutes, b.resource_id = view.day_of_week, view.start_minutes, view.resource_id
+        self._save_block(block_idx)
+
+    def _save_block(self, block_idx: int):
+        """바뀐 블록 하나만 백그라운드에서 저장"""
+        if not 0 <= block_idx < len(self.blocks):
+            return
+        b = self.blocks[block_idx]
+        if b.id is None or not 0 <= b.student_index < len(self.students):
+            return
+        sid = self.students[b.student_index].id
+        if sid is not None:
+            db.save_block_async(b, sid)
+
+    def _report_unplaced(self, gen: ScheduleGenerator):
+        if not gen.unplaced:
+            return
+        names = sorted({self.students[b.student_index].name for b in gen.unplaced if 0 <= b.student_index < len(self.students)})
+        QMessageBox.information(
+            self, "자동 배치",
+            f"{len(gen.unplaced)}개 블록은 배치하지 못해 미배정으로 남겼습니다.\n" + ", ".join(names),
+        )
+
     def _show_timetable(self):
-        self.stack.setCurrentIndex(1)
+        self.stack.setCurrentWidget(self.timetable_widget.parentWidget())
+
+    def _change_time_grid(self):
+        """칸 단위·시간 범위·요일 컨트롤 → 시간 격자 (시작 ≥ 끝, 요일 없음 등 잘못된 값이면 되돌림)"""
+        try:
+            time_grid = replace(
+                self.time_grid,
+                slot_minutes=self.slot_combo.currentData(),
+                start_hour=self.start_hour_spin.value(),
+                end_hour=self.end_hour_spin.value(),
+                days=tuple(d for d, check in self.day_checks.items() if check.isChecked()),
+            )
+        except ValueError:
+            self._sync_time_grid_controls()
+            return
+        self.time_grid = time_grid
+        self.timetable_widget.set_time_grid(self.time_grid)
+
+    def _sync_time_grid_controls(self):
+        """컨트롤 값을 현재 시간 격자에 맞춤 (신호 없이)"""
+        controls = [self.slot_combo, self.start_hour_spin, self.end_hour_spin, *self.day_checks.values()]
+        for control in controls:
+            control.blockSignals(True)
+        self.slot_combo.setCurrentIndex(SLOT_CHOICES.index(self.time_grid.slot_minutes))
+        self.start_hour_spin.setValue(self.time_grid.start_hour)
+        self.end_hour_spin.setValue(self.time_grid.end_hour)
+        for d, check in self.day_checks.items():
+            check.setChecked(d in self.time_grid.days)
+        for control in controls:
+            control.blockSignals(False)
+
+    def _set_resources(self, names: list[str]):
+        self.resources = list(names) or ["기본"]
+        if self._timetable_widget is not None:
+            self.resource_combo.blockSignals(True)
+            self.resource_combo.clear()
+            self.resource_combo.addItems(self.resources)
+            self.resource_combo.blockSignals(False)
+            self._change_resource()
+
+    def _change_resource(self):
+        self.timetable_widget.set_resource(max(self.resource_combo.currentIndex(), 0))
+
+    def _add_resource(self):
+        """강사·교실 추가 - 다음 자동 배치부터 이 자원에도 블록을 나눠 놓음"""
+        name, ok = QInputDialog.getText(self, "자원 추가", "강사·교실 이름:", text=f"자원 {len(self.resources) + 1}")
+        if not ok or not name.strip():
+            return
+        self.resources.append(name.strip())
+        db.save_resources(self.resources)
+        self.resource_combo.addItem(name.strip())
+        self.resource_combo.setCurrentIndex(len(self.resources) - 1)
 
     def _show_student_list(self):
         self.stack.setCurrentIndex(0)
 
+    def _show_perf_panel(self):
+        from perf_panel import PerfPanel
+        if self._perf_panel is None:
+            self._perf_panel = PerfPanel(self)
+        self._perf_panel.show()
+        self._perf_panel.raise_()
+
     def closeEvent(self, e):
-        self.timetable_widget.cleanup()
+        if self._loader is not None:
+            self._loader.wait()
+        if self._searcher is not None:
+            self._searcher.cancel.set()
+            self._searcher.wait()
+        db.flush_writes(5.0)
+        if self._timetable_widget is not None:
+            self._timetable_widget.cleanup()
         super().closeEvent(e)
@@ -0,0 +1,226 @@
+"""성능 계측 (기본 꺼짐) - 주요 함수 호출 횟수·소요 시간, 한 동작 프로파일
+
+켜는 법: 환경 변수 TIMETABLE_PROFILE=1, 또는 `python main.py --profile` / `python -m timetable --profile`.
+켜져 있으면 종료할 때 항목별 호출 수·합계·p50/p99·최댓값을 표준 오류로 출력한다.
+꺼져 있으면 @timed는 함수를 그대로 돌려주므로 추가 비용이 없다. 나중에 enable()하면
+그때 모듈·클래스 속성을 계측 래퍼로 바꿔 끼운다 (`from 모듈 import 함수`로 따로 잡아 둔 이름은 그대로).
+
+한 동작 프로파일: arm("cprofile" 또는 "tracemalloc") 후 @action으로 표시된 다음 사용자 동작
+(블록 옮기기, 시간표 짜기 등) 하나를 cProfile/tracemalloc으로 기록해 파일로 남긴다.
+환경 변수 TIMETABLE_PROFILE_CAPTURE=cprofile|tracemalloc이면 첫 동작을 기록한다.
+"""
+import atexit
+import functools
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+ENV_VAR = "TIMETABLE_PROFILE"
+CAPTURE_ENV_VAR = "TIMETABLE_PROFILE_CAPTURE"
+CAPTURE_MODES = ("cprofile", "tracemalloc")
+SAMPLE_SIZE = 4096  # 항목별 백분위 계산용 표본 수 (넘으면 저장소 표본 추출)
+
+
+class _Stat:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: list[float] = []
+
+    def add(self, elapsed: float):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if len(self.samples) < SAMPLE_SIZE:
+            self.samples.append(elapsed)
+        else:
+            i = random.randrange(self.count)
+            if i < SAMPLE_SIZE:
+                self.samples[i] = elapsed
+
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(int(p / 100 * len(ordered)), len(ordered) - 1)]
+
+
+_enabled = False
+_deferred: list[tuple] = []  # 꺼져 있을 때 그대로 돌려준 (함수, 래퍼) - enable()이 바꿔 끼움
+_stats: dict[str, _Stat] = {}
+_lock = threading.Lock()
+_armed: str | None = None  # 다음 action에서 쓸 캡처 방식
+_capture_dir = Path.cwd()
+_last_capture: Path | None = None
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def enable(dump_at_exit: bool = True):
+    """계측 켜기 (이미 켜져 있으면 무시)"""
+    global _enabled
+    if _enabled:
+        return
+    _enabled = True
+    for fn, wrapper in _deferred:
+        _rebind(fn, wrapper)
+    _deferred.clear()
+    if dump_at_exit:
+        atexit.register(dump)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def record(name: str, elapsed: float):
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.add(elapsed)
+
+
+def _rebind(fn, wrapper):
+    """모듈 함수나 클래스 메서드 자리(fn.__qualname__)에 fn이 그대로 있으면 wrapper로 바꿈"""
+    owner = sys.modules.get(fn.__module__)
+    *path, attr = fn.__qualname__.split(".")
+    for part in path:
+        owner = getattr(owner, part, None)
+    if owner is not None and getattr(owner, attr, None) is fn:
+        setattr(owner, attr, wrapper)
+
+
+def timed(name: str | None = None):
+    """함수 호출 시간 계측 데코레이터 (name 기본값: 모듈.함수 이름)
+
+    계측이 꺼져 있으면 fn을 그대로 돌려준다 (가장 뜨거운 can_place_block에도 호출 비용을 더하지 않도록).
+    모듈 최상위 함수와 클래스 메서드에만 쓴다 - 지역 함수는 enable() 때 바꿔 끼울 수 없다.
+    """
+    def decorate(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+        if _enabled:
+            return wrapper
+        _deferred.append((fn, wrapper))
+        return fn
+    return decorate
+
+
+def arm(mode: str | None, directory: str | Path | None = None):
+    """다음 사용자 동작 하나를 mode(cprofile/tracemalloc)로 기록 (None이면 해제)"""
+    global _armed, _capture_dir
+    if mode is not None and mode not in CAPTURE_MODES:
+        raise ValueError(f"캡처 방식은 {CAPTURE_MODES} 중 하나여야 합니다: {mode}")
+    _armed = mode
+    if directory is not None:
+        _capture_dir = Path(directory)
+
+
+def armed() -> str | None:
+    return _armed
+
+
+def last_capture() -> Path | None:
+    """마지막으로 저장한 캡처 파일"""
+    return _last_capture
+
+
+def action(name: str):
+    """사용자 동작 하나 - 켜져 있으면 timed처럼 재고, arm()되어 있으면 이 호출을 cProfile/tracemalloc으로 기록
+
+    동작은 드물게 불리므로 꺼져 있어도 래퍼를 두고 호출마다 플래그를 본다 (나중에 켜도 바로 잼).
+    """
+    def decorate(fn):
+        label = f"action.{name}"
+
+        def timed_fn(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - start)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            global _armed
+            if _armed is None:
+                return timed_fn(*args, **kwargs)
+            mode, _armed = _armed, None
+            return _capture(mode, name, timed_fn, args, kwargs)
+        return wrapper
+    return decorate
+
+
+def _capture(mode: str, name: str, fn, args, kwargs):
+    global _last_capture
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    if mode == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(fn, *args, **kwargs)
+        finally:
+            path = _capture_dir / f"profile-{name}-{stamp}.prof"
+            profiler.dump_stats(path)
+            _last_capture = path
+            print(f"[perf] cProfile 저장: {path} (python -m pstats {path})", file=sys.stderr)
+    import tracemalloc
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(25)
+    before = tracemalloc.take_snapshot()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        after = tracemalloc.take_snapshot()
+        if not was_tracing:
+            tracemalloc.stop()
+        path = _capture_dir / f"memory-{name}-{stamp}.txt"
+        top = after.compare_to(before, "lineno")[:30]
+        path.write_text("\n".join(str(s) for s in top) + "\n", encoding="utf-8")
+        _last_capture = path
+        print(f"[perf] tracemalloc 저장: {path}", file=sys.stderr)
+
+
+def report() -> str:
+    """항목별 호출 수·합계·p50/p99·최댓값 표 (합계 큰 순)"""
+    with _lock:
+        items = sorted(_stats.items(), key=lambda kv: kv[1].total, reverse=True)
+        lines = [f"{'항목':<44}{'호출':>8}{'합계ms':>10}{'p50ms':>9}{'p99ms':>9}{'최대ms':>9}"]
+        for label, st in items:
+            lines.append(
+                f"{label:<44}{st.count:>8}{st.total * 1e3:>10.1f}"
+                f"{st.percentile(50) * 1e3:>9.3f}{st.percentile(99) * 1e3:>9.3f}{st.max * 1e3:>9.3f}"
+            )
+    return "\n".join(lines)
+
+
+def dump(file=None):
+    if _stats:
+        print(report(), file=file or sys.stderr)
+
+
+if os.environ.get(ENV_VAR, "").strip() not in ("", "0"):
+    enable()
+if os.environ.get(CAPTURE_ENV_VAR):
+    arm(os.environ[CAPTURE_ENV_VAR].strip().lower())
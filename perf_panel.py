@@ -0,0 +1,57 @@
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QLabel
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtCore import QTimer
+import perf
+
+
+class PerfPanel(QDialog):
+    """성능 계측 창 (계측이 켜져 있을 때 Ctrl+Shift+P) - 항목별 p50/p99, 다음 동작 프로파일"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("성능 계측")
+        self.resize(760, 420)
+        layout = QVBoxLayout(self)
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        layout.addWidget(self.text)
+        self.status = QLabel()
+        layout.addWidget(self.status)
+
+        buttons = QHBoxLayout()
+        refresh_btn = QPushButton("새로고침")
+        refresh_btn.clicked.connect(self.refresh)
+        buttons.addWidget(refresh_btn)
+        reset_btn = QPushButton("초기화")
+        reset_btn.clicked.connect(self._reset)
+        buttons.addWidget(reset_btn)
+        buttons.addStretch()
+        for mode in perf.CAPTURE_MODES:
+            btn = QPushButton(f"다음 동작 {mode}")
+            btn.clicked.connect(lambda _=False, m=mode: self._arm(m))
+            buttons.addWidget(btn)
+        layout.addLayout(buttons)
+
+        # 열어 둔 채로 조작하면 1초마다 갱신
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        self.text.setPlainText(perf.report())
+        if perf.armed():
+            self.status.setText(f"다음 동작을 {perf.armed()}로 기록합니다 (블록 옮기기, 시간표 짜기 등)")
+        elif perf.last_capture():
+            self.status.setText(f"마지막 기록: {perf.last_capture()}")
+        else:
+            self.status.setText("")
+
+    def _reset(self):
+        perf.reset()
+        self.refresh()
+
+    def _arm(self, mode: str):
+        perf.arm(mode)
+        self.refresh()
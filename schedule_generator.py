@@ -1,33 +1,721 @@
-from dataclasses import dataclass
-from typing import List
-from student import Student
+import os
+import random
+import threading
+import time
+from bisect import bisect_left, insort
+from dataclasses import dataclass, replace
+from typing import Iterable, Iterator, List
+from student import Student, minutes_mask
+from time_grid import TimeGrid
+import perf
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleBlock:
     student_index: int
     day_of_week: int
     start_minutes: int
     duration_minutes: int
+    id: int | None = None  # DB 저장용 (None이면 아직 저장 안 됨)
+    resource_id: int = 0  # 강사·교실 번호 (0부터) - 같은 자원끼리만 겹치면 안 됨
+
+
+def count_gaps(blocks: List[ScheduleBlock]) -> int:
+    """자원·요일별로 배정된 블록 사이 빈 시간 구간 수"""
+    by_day: dict[tuple[int, int], list[tuple[int, int]]] = {}
+    for b in blocks:
+        if b.day_of_week >= 0:
+            by_day.setdefault((b.resource_id, b.day_of_week), []).append((b.start_minutes, b.start_minutes + b.duration_minutes))
+    gaps = 0
+    for spans in by_day.values():
+        spans.sort()
+        for (_, prev_end), (start, _) in zip(spans, spans[1:]):
+            if start > prev_end:
+                gaps += 1
+    return gaps
+
+
+_CANCEL_POLL = 0.1  # search가 프로세스 결과를 기다리며 cancel을 확인하는 간격 (초)
+
+
+def _search_worker(args):
+    """프로세스 풀 작업: 시드 하나로 자동 배치 1회 → (점수, (요일 배열, 시작 배열, 자원 배열))
+
+    블록은 BlockStore(열 배열)로 주고받아 프로세스 사이 피클이 작다.
+    """
+    from block_store import BlockStore
+    students, store, settings, seed, time_budget = args
+    blocks = store.to_blocks()
+    time_grid, max_backtracks, resources = settings
+    gen = ScheduleGenerator(students, time_grid, resources)
+    gen.max_backtracks = max_backtracks
+    rng = random.Random(seed) if seed is not None else None
+    unplaced = gen.place(blocks, rng=rng, time_budget=time_budget)
+    score = (len(unplaced), count_gaps(blocks))
+    return score, BlockStore.from_blocks(blocks).positions()
+
+
+def _smear(mask: int, width: int) -> int:
+    """비트 t = mask가 [t, t+width) 구간에 하나라도 켜져 있음"""
+    covered = 1
+    while covered < width:
+        step = min(covered, width - covered)
+        mask |= mask >> step
+        covered += step
+    return mask
+
+
+def _spread(mask: int, width: int) -> int:
+    """비트 t = mask가 (t-width, t] 구간에 하나라도 켜져 있음 (시작 후보 → 차지하는 분)"""
+    covered = 1
+    while covered < width:
+        step = min(covered, width - covered)
+        mask |= mask << step
+        covered += step
+    return mask
+
+
+def _iter_bits(mask: int):
+    while mask:
+        low = mask & -mask
+        mask ^= low
+        yield low.bit_length() - 1
+
+
+class OccupancyIndex:
+    """요일별 배정 블록 점유 현황 - 분 단위 비트맵 + 시작순 정렬 목록
+
+    블록 인덱스(blocks 목록 위치) 단위로 place/unplace해 점진적으로 갱신한다.
+    겹침 검사는 비트 AND 한 번, 칸의 블록 찾기는 이분 탐색. 블록을 빼거나 제외할 때는
+    그 구간과 겹치는 블록만 (가장 긴 블록 길이로 이분 탐색 범위를 잡아) 다시 칠한다.
+    """
+
+    def __init__(self, blocks: List[ScheduleBlock] | None = None):
+        self._masks = [0] * 7
+        self._spans: list[list[tuple[int, int, int]]] = [[] for _ in range(7)]  # (시작, 끝, 블록 인덱스)
+        self._where: dict[int, tuple[int, int, int]] = {}  # 블록 인덱스 -> (요일, 시작, 끝)
+        self._longest = 0  # 놓인 적 있는 가장 긴 블록 (분) - 겹칠 수 있는 블록 찾기 범위
+        self.version = 0  # 점유가 바뀔 때마다 증가 (바깥 캐시 무효화용)
+        if blocks is not None:
+            self.rebuild(blocks)
+
+    def rebuild(self, blocks: List[ScheduleBlock]):
+        self._masks = [0] * 7
+        self._spans = [[] for _ in range(7)]
+        self._where.clear()
+        self._longest = 0
+        self.version += 1
+        for bi, b in enumerate(blocks):
+            if 0 <= b.day_of_week <= 6:
+                self.place(bi, b.day_of_week, b.start_minutes, b.duration_minutes)
+
+    def place(self, block_idx: int, day: int, start: int, duration: int):
+        """블록을 (요일, 시작)에 배정 - 이미 다른 곳에 있으면 옮김"""
+        self.unplace(block_idx)
+        end = start + duration
+        self._where[block_idx] = (day, start, end)
+        insort(self._spans[day], (start, end, block_idx))
+        self._masks[day] |= minutes_mask(start, end)
+        self._longest = max(self._longest, duration)
+        self.version += 1
+
+    def unplace(self, block_idx: int):
+        where = self._where.pop(block_idx, None)
+        if where is None:
+            return
+        day, start, end = where
+        spans = self._spans[day]
+        spans.pop(bisect_left(spans, (start, end, block_idx)))
+        self._masks[day] = self._without(day, start, end)
+        self.version += 1
+
+    def _without(self, day: int, start: int, end: int, skip: int | None = None) -> int:
+        """요일 비트맵에서 [start, end)를 지우고 그 구간에 걸친 다른 블록(skip 제외)만 다시 칠함"""
+        spans = self._spans[day]
+        refill = 0
+        for i in range(bisect_left(spans, (start - self._longest,)), bisect_left(spans, (end,))):
+            s, e, bi = spans[i]
+            if e > start and bi != skip:
+                refill |= minutes_mask(max(s, start), min(e, end))
+        return self._masks[day] & ~minutes_mask(start, end) | refill
+
+    def day_mask(self, day: int, exclude: int | None = None) -> int:
+        """요일 점유 비트맵 (exclude 블록은 빼고 - 옮기는 중인 블록용)"""
+        if not 0 <= day <= 6:
+            return 0
+        where = self._where.get(exclude) if exclude is not None else None
+        if where is None or where[0] != day:
+            return self._masks[day]
+        return self._without(day, where[1], where[2], skip=exclude)
+
+    def overlaps(self, day: int, start: int, duration: int, exclude: int | None = None) -> bool:
+        """[start, start+duration) 구간이 다른 배정 블록과 겹치는지"""
+        return bool(self.day_mask(day, exclude) & minutes_mask(start, start + duration))
+
+    def blocked_starts(self, day: int, duration: int, exclude: int | None = None) -> int:
+        """overlaps가 참이 되는 시작 분들의 비트마스크 (비트 t = t분 시작 시 겹침)"""
+        return _smear(self.day_mask(day, exclude), duration)
+
+    def block_in(self, day: int, start: int, end: int) -> int | None:
+        """[start, end) 구간에 걸친 블록 인덱스 (없으면 None)"""
+        if not 0 <= day <= 6:
+            return None
+        spans = self._spans[day]
+        i = bisect_left(spans, (end,)) - 1
+        if i >= 0 and spans[i][1] > start:
+            return spans[i][2]
+        return None
+
+    def blocks_in(self, day: int, start: int, end: int) -> list[int]:
+        """[start, end) 구간과 겹치는 모든 블록 인덱스"""
+        if not 0 <= day <= 6:
+            return []
+        spans = self._spans[day]
+        lo, hi = bisect_left(spans, (start - self._longest,)), bisect_left(spans, (end,))
+        return [bi for s, e, bi in spans[lo:hi] if e > start]
+
+
+class ResourceOccupancy:
+    """자원(강사·교실)별 OccupancyIndex + 학생별 배정 구간
+
+    블록끼리는 같은 자원 안에서만 겹치면 안 되고, 한 학생의 블록은 자원이 달라도 겹치면 안 된다.
+    자원별 색인은 처음 쓸 때 만든다. version은 어느 자원이든 바뀌면 증가한다.
+    """
+
+    def __init__(self, blocks: List[ScheduleBlock] | None = None):
+        self._resources: dict[int, OccupancyIndex] = {}
+        self._students: dict[tuple[int, int], dict[int, tuple[int, int]]] = {}  # (학생, 요일) -> {블록: (시작, 끝)}
+        self._where: dict[int, tuple[int, int, int]] = {}  # 블록 인덱스 -> (자원, 학생, 요일)
+        self.version = 0
+        if blocks is not None:
+            self.rebuild(blocks)
+
+    def resource(self, resource_id: int) -> OccupancyIndex:
+        occ = self._resources.get(resource_id)
+        if occ is None:
+            occ = self._resources[resource_id] = OccupancyIndex()
+        return occ
+
+    def rebuild(self, blocks: List[ScheduleBlock], placed: Iterable[int] | None = None):
+        """placed: 배정된 블록 인덱스 (BlockStore.placed(), 없으면 blocks를 훑어 찾음)"""
+        self._resources.clear()
+        self._students.clear()
+        self._where.clear()
+        self.version += 1
+        if placed is None:
+            placed = (bi for bi, b in enumerate(blocks) if b.day_of_week >= 0)
+        for bi in placed:
+            if blocks[bi].day_of_week <= 6:
+                self.place(bi, blocks[bi])
+
+    def place(self, block_idx: int, block: ScheduleBlock):
+        """블록을 현재 (자원, 요일, 시작)에 배정 - 이미 다른 곳에 있으면 옮김"""
+        self.unplace(block_idx)
+        r, si, day = block.resource_id, block.student_index, block.day_of_week
+        self.resource(r).place(block_idx, day, block.start_minutes, block.duration_minutes)
+        self._students.setdefault((si, day), {})[block_idx] = (block.start_minutes, block.start_minutes + block.duration_minutes)
+        self._where[block_idx] = (r, si, day)
+        self.version += 1
+
+    def unplace(self, block_idx: int):
+        where = self._where.pop(block_idx, None)
+        if where is None:
+            return
+        r, si, day = where
+        self._resources[r].unplace(block_idx)
+        spans = self._students[(si, day)]
+        del spans[block_idx]
+        if not spans:
+            del self._students[(si, day)]
+        self.version += 1
+
+    def student_mask(self, student_index: int, day: int, exclude: int | None = None) -> int:
+        """학생의 그 요일 배정 구간 비트맵 (exclude 블록 제외)"""
+        mask = 0
+        for bi, (start, end) in self._students.get((student_index, day), {}).items():
+            if bi != exclude:
+                mask |= minutes_mask(start, end)
+        return mask
+
+    def overlaps(self, resource_id: int, student_index: int, day: int, start: int, duration: int,
+                 exclude: int | None = None) -> bool:
+        """그 자원의 다른 블록이나 같은 학생의 다른 블록과 겹치는지"""
+        span = minutes_mask(start, start + duration)
+        return bool((self.resource(resource_id).day_mask(day, exclude) | self.student_mask(student_index, day, exclude)) & span)
+
+    def blocked_starts(self, resource_id: int, student_index: int, day: int, duration: int,
+                       exclude: int | None = None) -> int:
+        """overlaps가 참이 되는 시작 분들의 비트마스크"""
+        occupied = self.resource(resource_id).day_mask(day, exclude) | self.student_mask(student_index, day, exclude)
+        return _smear(occupied, duration)
+
+
+class _Group:
+    """같은 학생·같은 길이의 미배정 블록 묶음 (가능 시작 집합이 동일)"""
+    __slots__ = ("student_index", "duration", "pending", "static", "domain", "size", "tiebreak")
+
+    def __init__(self, student_index: int, duration: int):
+        self.student_index = student_index
+        self.duration = duration
+        self.pending: List[ScheduleBlock] = []  # 아직 못 놓은 블록 (뒤에서부터 배치)
+        self.static = [0] * 7   # 요일별 학생 가능 ∩ 시간 범위
+        self.domain = [0] * 7   # 요일별 현재 남은 시작 후보 수
+        self.size = 0
+        self.tiebreak = 0
+
+
+# 그룹이 이만큼 많으면 MRV 도메인 크기를 NumPy 배열로 한꺼번에 갱신 (NumPy가 있을 때)
+# python -m benchmarks --only solve의 solve.place_python/numpy: 100명은 비슷하거나 느리고,
+# 300명 1.4배, 1000명 3배, 3000명 4배 빠름 (학생 한 명 = 그룹 하나 정도)
+VECTOR_MIN_GROUPS = 300
+
+
+class _DomainArrays:
+    """place()의 그룹별 남은 시작 후보 수를 (그룹, 요일) 배열로 관리 - 요일 하나가 바뀌면 모든 그룹을 한 번에
+
+    AvailabilityTensor의 (학생, 요일, 칸) 시작 가능 여부에서 그룹별 static을 가져와
+    겹침으로 막힌 칸을 빼고 요일별로 센다. 파이썬 경로(_Group.domain/size)와 같은 값을 낸다.
+    """
+
+    @classmethod
+    def create(cls, students: List[Student], grid: TimeGrid, active: List[_Group], blocked: dict) -> "_DomainArrays | None":
+        """NumPy가 없거나 칸 단위로 나누어지지 않는 길이가 있으면 None (파이썬 경로 사용)"""
+        import availability
+        if not availability.HAVE_NUMPY or any(dur % grid.slot_minutes for dur in blocked):
+            return None
+        return cls(availability, students, grid, active, blocked)
+
+    def __init__(self, availability, students, grid, active, blocked):
+        np = self.np = availability.np
+        used = sorted({g.student_index for g in active})
+        self.tensor = availability.AvailabilityTensor([students[si] for si in used], grid)
+        local = {si: i for i, si in enumerate(used)}
+        in_grid = np.zeros((7, 1), dtype=bool)
+        in_grid[list(grid.days)] = True
+        self.active = active
+        self.feasible = np.zeros((len(active), 7, grid.rows), dtype=bool)
+        self.by_duration: dict[int, "np.ndarray"] = {}
+        for dur in blocked:
+            groups = [g for g in active if g.duration == dur]
+            idx = np.array([g.tiebreak for g in groups], dtype=np.intp)
+            rows = np.array([local[g.student_index] for g in groups], dtype=np.intp)
+            self.feasible[idx] = self.tensor.feasible(dur)[rows] & in_grid
+            self.by_duration[dur] = idx
+        self.domain = np.zeros((len(active), 7), dtype=np.int32)
+        for d in range(7):
+            self.refresh(d, blocked)
+        self.pending = np.array([bool(g.pending) for g in active])
+        self.duration = np.array([g.duration for g in active])
+
+    def refresh(self, day: int, blocked: dict):
+        sample = self.tensor.sample
+        for dur, idx in self.by_duration.items():
+            free = ~sample(blocked[dur][day])
+            self.domain[idx, day] = (self.feasible[idx, day] & free).sum(axis=-1)
+
+    def pick(self) -> _Group | None:
+        """남은 블록이 있는 그룹 중 (후보 수, -길이, tiebreak)가 가장 작은 그룹 (domain/size를 채워 반환)"""
+        np = self.np
+        cand = np.flatnonzero(self.pending)
+        if not cand.size:
+            return None
+        size = self.domain[cand].sum(axis=1)
+        cand = cand[size == size.min()]
+        if cand.size > 1:
+            dur = self.duration[cand]
+            cand = cand[dur == dur.max()]
+        i = int(cand[0])  # tiebreak = active 위치
+        g = self.active[i]
+        g.domain = self.domain[i].tolist()
+        g.size = sum(g.domain)
+        return g
 
 
 class ScheduleGenerator:
-    def __init__(self, students: List[Student]):
+    def __init__(self, students: List[Student], time_grid: TimeGrid | None = None, resources: int = 1):
         self.students = students
-        self.start_hour = 9
-        self.end_hour = 21
-        self.min_slot_minutes = 30
+        self.time_grid = time_grid or TimeGrid()  # 시간 범위·칸 단위·요일 (시간표 그리드와 공유)
+        self.resources = max(resources, 1)  # 동시에 수업할 수 있는 강사·교실 수 (resource_id 0 … resources-1)
+        self.max_backtracks = 200  # 자동 배치 시 되돌리기(백점프) 횟수 상한
+        self.unplaced: List[ScheduleBlock] = []  # 마지막 자동 배치에서 못 놓은 블록
 
     def set_time_range(self, start_hour: int, end_hour: int):
-        self.start_hour = start_hour
-        self.end_hour = end_hour
+        self.time_grid = replace(self.time_grid, start_hour=start_hour, end_hour=end_hour)
+
+    @perf.timed()
+    def generate(self, auto_place: bool = False) -> List[ScheduleBlock]:
+        """학생별 블록을 미배정(day=-1)으로 생성 → 오른쪽 풀에서 끌어다 배치
 
-    def generate(self) -> List[ScheduleBlock]:
-        """학생별 블록을 미배정(day=-1)으로 생성 → 오른쪽 풀에서 끌어다 배치"""
+        auto_place=True면 생성한 블록을 바로 자동 배치 (못 놓은 블록은 미배정으로 남고 self.unplaced에 기록)
+        """
         blocks = []
         for si, s in enumerate(self.students):
-            duration = max(s.class_duration_minutes, self.min_slot_minutes)
+            duration = max(s.class_duration_minutes, self.time_grid.slot_minutes)
             sessions = getattr(s, 'sessions_per_week', 1)
             for _ in range(sessions):
                 blocks.append(ScheduleBlock(si, -1, -1, duration))  # 미배정
+        if auto_place:
+            self.place(blocks)
         return blocks
+
+    @perf.timed()
+    def search(
+        self,
+        blocks: List[ScheduleBlock],
+        restarts: int = 16,
+        workers: int | None = None,
+        time_budget: float = 2.0,
+        seed: int = 0,
+        cancel: threading.Event | None = None,
+    ) -> List[ScheduleBlock] | None:
+        """자동 배치를 restarts번 (동점 순서를 섞어) 여러 프로세스에서 돌려 가장 좋은 결과 반환
+
+        점수는 (못 놓은 블록 수, 빈틈 수)가 작을수록 좋고, 같으면 앞 번호 시도가 이긴다.
+        0번 시도는 섞지 않은 기본 배치라 place()보다 나빠지지 않는다.
+        각 시도는 time_budget초가 지나면 되돌리기를 멈추고 남은 블록을 바로 채운다.
+        같은 seed면 (시간 한도에 걸리지 않는 한) 같은 결과가 나온다.
+        반환값은 새 블록 목록이며 입력 blocks는 바꾸지 않는다.
+        다른 스레드에서 cancel을 켜면 남은 시도를 버리고 None을 반환한다 (이미 도는 프로세스는 그 시도만 마치고 끝남).
+        """
+        from block_store import BlockStore
+        master = random.Random(seed)
+        seeds = [None] + [master.getrandbits(64) for _ in range(max(restarts, 1) - 1)]
+        settings = (self.time_grid, self.max_backtracks, self.resources)
+        store = BlockStore.from_blocks(blocks)
+        tasks = [(self.students, store, settings, sd, time_budget) for sd in seeds]
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(tasks) == 1:
+            results = []
+            for t in tasks:
+                if cancel is not None and cancel.is_set():
+                    return None
+                results.append(_search_worker(t))
+        else:
+            # multiprocessing은 무거워 여기서만 불러옴
+            from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+            try:
+                futures = [pool.submit(_search_worker, t) for t in tasks]
+                pending = set(futures)
+                while pending:
+                    _, pending = wait(pending, timeout=_CANCEL_POLL, return_when=FIRST_COMPLETED)
+                    if cancel is not None and cancel.is_set():
+                        return None
+                results = [f.result() for f in futures]
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+        best_score, (days, starts, resources) = min(results, key=lambda r: r[0])  # min은 동점이면 앞 것을 유지
+        best = []
+        for b, day, start, resource in zip(blocks, days, starts, resources):
+            best.append(replace(b, day_of_week=day, start_minutes=start, resource_id=resource))
+        self.unplaced = [b for b in best if b.day_of_week < 0]
+        return best
+
+    @perf.timed()
+    def repair(self, blocks: List[ScheduleBlock], changed, max_moves: int = 200) -> List[ScheduleBlock]:
+        """일부 학생만 바뀌었을 때 나머지 배치는 그대로 두고 고침 (blocks를 제자리에서 수정)
+
+        changed(학생 인덱스들)의 블록 수·길이를 학생 정보에 맞추고(남으면 미배정부터 뺌),
+        그 학생의 배정 블록 중 이제 can_place_block이 거짓이거나 (같은 자원·같은 학생과) 겹치는 것만 미배정으로 돌린다.
+        그렇게 뺀 블록과 새로 생긴 블록만 place()로 다시 놓고, 그래도 못 놓으면 가로막는
+        블록 하나를 다른 빈 곳으로 옮겨 보는 시도를 max_moves번까지 한다.
+        원래 미배정이던 블록(풀에 남겨 둔 것)은 건드리지 않는다. 반환값은 못 놓은 블록 목록.
+        """
+        grid = self.time_grid
+        changed = {si for si in changed if 0 <= si < len(self.students)}
+        retry: set[int] = set()  # 다시 놓을 블록 (id(block))
+        for si in sorted(changed):
+            s = self.students[si]
+            duration = max(s.class_duration_minutes, grid.slot_minutes)
+            own = [b for b in blocks if b.student_index == si]
+            for b in own:
+                b.duration_minutes = duration  # 길이가 바뀌었으면 아래 검사에서 걸러짐
+            extra = len(own) - getattr(s, 'sessions_per_week', 1)
+            if extra > 0:
+                drop = {id(b) for b in sorted(own, key=lambda b: b.day_of_week >= 0)[:extra]}
+                blocks[:] = [b for b in blocks if id(b) not in drop]
+            for _ in range(-extra):
+                b = ScheduleBlock(si, -1, -1, duration)
+                blocks.append(b)
+                retry.add(id(b))
+
+        # 바뀌지 않은 학생의 배치는 고정, 바뀐 학생의 배치는 하나씩 다시 확인
+        occ = ResourceOccupancy()
+        suspects = []
+        for bi, b in enumerate(blocks):
+            if b.day_of_week < 0:
+                continue
+            if b.student_index in changed:
+                suspects.append(bi)
+            else:
+                occ.place(bi, b)
+        for bi in suspects:
+            b = blocks[bi]
+            s = self.students[b.student_index]
+            if (s.can_place_block(b.day_of_week, b.start_minutes, b.duration_minutes, grid.slot_minutes)
+                    and not occ.overlaps(b.resource_id, b.student_index, b.day_of_week, b.start_minutes, b.duration_minutes)):
+                occ.place(bi, b)
+            else:
+                b.day_of_week = -1
+                b.start_minutes = -1
+                retry.add(id(b))
+
+        if not retry:
+            self.unplaced = []
+            return self.unplaced
+        self.place([b for b in blocks if b.day_of_week >= 0 or id(b) in retry])
+        if self.unplaced and max_moves > 0:
+            self._eject(blocks, max_moves)
+        return self.unplaced
+
+    def _eject(self, blocks: List[ScheduleBlock], max_moves: int):
+        """못 놓은 블록마다 한 자원에서 가로막는 블록이 하나뿐인 자리를 찾아 그 블록을 다른 빈 곳으로 옮김"""
+        grid = self.time_grid
+        occ = ResourceOccupancy(blocks)
+        index_of = {id(b): bi for bi, b in enumerate(blocks)}
+
+        def starts(b: ScheduleBlock) -> Iterator[tuple[int, int]]:
+            """학생이 가능하고 자기 다른 블록과 겹치지 않는 (요일, 시작)"""
+            s = self.students[b.student_index]
+            window = grid.start_mask(b.duration_minutes)
+            for d in grid.days:
+                mask = s.feasible_starts(d, b.duration_minutes, grid.slot_minutes) & window
+                mask &= ~_smear(occ.student_mask(b.student_index, d), b.duration_minutes)
+                for t in _iter_bits(mask):
+                    yield d, t
+
+        def free_spot(b: ScheduleBlock) -> tuple[int, int, int] | None:
+            for d, t in starts(b):
+                for r in range(self.resources):
+                    if not occ.resource(r).overlaps(d, t, b.duration_minutes):
+                        return d, t, r
+            return None
+
+        moves = max_moves
+        for b in self.unplaced:
+            bi = index_of[id(b)]
+            for day, start in starts(b):
+                if moves <= 0:
+                    break
+                for r in range(self.resources):
+                    conflicts = occ.resource(r).blocks_in(day, start, start + b.duration_minutes)
+                    if len(conflicts) == 1:
+                        break
+                else:
+                    continue
+                moves -= 1
+                ci = conflicts[0]
+                c = blocks[ci]
+                occ.unplace(ci)
+                b.day_of_week, b.start_minutes, b.resource_id = day, start, r
+                occ.place(bi, b)
+                target = free_spot(c)
+                if target is None:  # 옮길 곳이 없으면 원래대로
+                    occ.unplace(bi)
+                    b.day_of_week = b.start_minutes = -1
+                    occ.place(ci, c)
+                    continue
+                c.day_of_week, c.start_minutes, c.resource_id = target
+                occ.place(ci, c)
+                break
+        self.unplaced = [b for b in self.unplaced if b.day_of_week < 0]
+
+    @perf.timed()
+    def place(
+        self,
+        blocks: List[ScheduleBlock],
+        rng: random.Random | None = None,
+        time_budget: float | None = None,
+    ) -> List[ScheduleBlock]:
+        """미배정 블록(day<0)에 요일·시작을 배정하고 배치 못 한 블록 목록을 반환
+
+        이미 배정된 블록은 고정으로 두고 겹치지 않게 나머지를 채운다.
+        자원이 여럿이면 시작 시각은 어느 자원이든 비어 있으면 후보이고, 놓을 때는 그 시각에 빈 자원 중
+        배정된 분이 가장 적은 자원을 고른다 (같은 학생 블록은 자원이 달라도 겹치지 않게).
+        가능한 시작 후보가 가장 적은 블록부터 놓고(MRV), 막히면 max_backtracks까지
+        되돌아가 다른 후보를 시도한다. rng를 주면 동점 순서를 섞는다(재시작 탐색용).
+        time_budget(초)이 지나면 더 되돌아가지 않고 남은 블록을 바로 채운다.
+        """
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        grid = self.time_grid
+        occ: dict[int, list[int]] = {r: [0] * 7 for r in range(self.resources)}  # 자원 -> 요일별 점유
+        load = dict.fromkeys(range(self.resources), 0)  # 자원별 배정된 분 (고르게 나누기용)
+        own: dict[tuple[int, int], int] = {}  # (학생, 요일) -> 그 학생이 차지한 분
+        student_days: dict[tuple[int, int], int] = {}
+        for b in blocks:
+            if 0 <= b.day_of_week <= 6:
+                span = minutes_mask(b.start_minutes, b.start_minutes + b.duration_minutes)
+                occ.setdefault(b.resource_id, [0] * 7)[b.day_of_week] |= span
+                if b.resource_id in load:
+                    load[b.resource_id] += b.duration_minutes
+                key = (b.student_index, b.day_of_week)
+                student_days[key] = student_days.get(key, 0) + 1
+                own[key] = own.get(key, 0) | span
+        usable = [occ[r] for r in range(self.resources)]
+        # 자원이 하나뿐이면 학생 자신의 블록도 그 자원 점유에 들어 있어 따로 볼 필요 없음
+        multi = len(occ) > 1
+
+        def blocked_on(d: int, dur: int) -> int:
+            """모든 자원에서 겹치는 시작 (하나라도 비어 있으면 후보)"""
+            mask = -1
+            for days in usable:
+                mask &= _smear(days[d], dur)
+            return mask
+
+        def free_starts(g: _Group, d: int) -> int:
+            free = g.static[d] & ~blocked[g.duration][d]
+            if multi and (g.student_index, d) in own:
+                free &= ~_smear(own[(g.student_index, d)], g.duration)
+            return free
+
+        groups: dict[tuple[int, int], _Group] = {}
+        unplaced: List[ScheduleBlock] = []
+        for b in blocks:
+            if b.day_of_week >= 0:
+                continue
+            if not 0 <= b.student_index < len(self.students):
+                unplaced.append(b)
+                continue
+            key = (b.student_index, b.duration_minutes)
+            g = groups.get(key)
+            if g is None:
+                g = groups[key] = _Group(*key)
+                s = self.students[b.student_index]
+                window = grid.start_mask(b.duration_minutes)
+                g.static = [
+                    s.feasible_starts(d, b.duration_minutes, grid.slot_minutes) & window if d in grid.days else 0
+                    for d in range(7)
+                ]
+            g.pending.append(b)
+        active: List[_Group] = []
+        for g in groups.values():
+            if any(g.static):
+                g.pending.reverse()
+                active.append(g)
+            else:
+                unplaced.extend(g.pending)
+        if rng is not None:
+            rng.shuffle(active)
+        for i, g in enumerate(active):
+            g.tiebreak = i
+
+        # 길이별 "겹쳐서 못 쓰는 시작" 마스크를 요일마다 캐시
+        durations = {g.duration for g in active}
+        blocked = {dur: [blocked_on(d, dur) for d in range(7)] for dur in durations}
+
+        def refresh_day(d: int):
+            for dur in durations:
+                blocked[dur][d] = blocked_on(d, dur)
+            if vec is not None:
+                vec.refresh(d, blocked)
+                return
+            for g in active:
+                g.size -= g.domain[d]
+                g.domain[d] = free_starts(g, d).bit_count()
+                g.size += g.domain[d]
+
+        # 배열 경로는 자원 점유만 세므로 학생 자신의 겹침을 따로 봐야 하는 다중 자원에서는 쓰지 않음
+        vec = None
+        if len(active) >= VECTOR_MIN_GROUPS and not multi:
+            vec = _DomainArrays.create(self.students, grid, active, blocked)
+        if vec is None:
+            for g in active:
+                g.domain = [free_starts(g, d).bit_count() for d in range(7)]
+                g.size = sum(g.domain)
+
+        day_rank = {d: i for i, d in enumerate(grid.days)}
+        if rng is not None:
+            shuffled = list(grid.days)
+            rng.shuffle(shuffled)
+            day_rank = {d: i for i, d in enumerate(shuffled)}
+
+        def candidates(g: _Group) -> list[tuple[int, int]]:
+            cands = []
+            for d in range(7):
+                if g.domain[d]:
+                    cands.extend((d, t) for t in _iter_bits(free_starts(g, d)))
+            # 같은 학생은 가능하면 다른 요일, 그다음 이른 시각부터 (빈틈 없이 채움)
+            cands.sort(key=lambda c: (student_days.get((g.student_index, c[0]), 0), c[1], day_rank[c[0]]))
+            return cands
+
+        def apply(g: _Group, day: int, start: int) -> ScheduleBlock:
+            b = g.pending.pop()
+            if vec is not None:
+                vec.pending[g.tiebreak] = bool(g.pending)
+            span = minutes_mask(start, start + g.duration)
+            r = 0 if len(usable) == 1 else min((r for r, days in enumerate(usable) if not days[day] & span),
+                                               key=lambda r: (load[r], r))
+            b.day_of_week = day
+            b.start_minutes = start
+            b.resource_id = r
+            usable[r][day] |= span
+            load[r] += g.duration
+            key = (g.student_index, day)
+            student_days[key] = student_days.get(key, 0) + 1
+            own[key] = own.get(key, 0) | span
+            refresh_day(day)
+            return b
+
+        def undo(g: _Group, b: ScheduleBlock, day: int, start: int):
+            g.pending.append(b)
+            if vec is not None:
+                vec.pending[g.tiebreak] = True
+            span = minutes_mask(start, start + g.duration)
+            usable[b.resource_id][day] &= ~span
+            load[b.resource_id] -= g.duration
+            b.day_of_week = -1
+            b.start_minutes = -1
+            key = (g.student_index, day)
+            student_days[key] -= 1
+            own[key] &= ~span
+            refresh_day(day)
+
+        # 스택 프레임: [그룹, 블록, 후보 목록, 현재 후보 위치]
+        frames: list[list] = []
+        budget = self.max_backtracks
+        while True:
+            if vec is not None:
+                g = vec.pick()
+            else:
+                g = min(
+                    (g for g in active if g.pending),
+                    key=lambda g: (g.size, -g.duration, g.tiebreak),
+                    default=None,
+                )
+            if g is None:
+                break
+            if g.size == 0:
+                # 막힌 그룹의 후보를 실제로 가리는 가장 최근 배치 찾기 (그 위 배치는 무관)
+                reach = [_spread(g.static[d], g.duration) for d in range(7)]
+                depth = len(frames) - 1
+                while depth >= 0:
+                    fg, fb, cands, pos = frames[depth]
+                    if reach[fb.day_of_week] & minutes_mask(fb.start_minutes, fb.start_minutes + fg.duration):
+                        break
+                    depth -= 1
+                if deadline is not None and time.perf_counter() > deadline:
+                    budget = 0
+                if budget > 0 and depth >= 0:
+                    # 그 배치까지 되돌리고 다음 후보 시도 (백점프)
+                    budget -= 1
+                    while len(frames) > depth:
+                        fr = frames[-1]
+                        fg, fb, cands, pos = fr
+                        undo(fg, fb, *cands[pos])
+                        if len(frames) - 1 == depth and pos + 1 < len(cands):
+                            fr[1] = apply(fg, *cands[pos + 1])
+                            fr[3] = pos + 1
+                            break
+                        frames.pop()
+                    continue
+                # 되돌리기 한도 초과 → 이 그룹의 남은 블록은 포기
+                unplaced.extend(reversed(g.pending))
+                g.pending.clear()
+                if vec is not None:
+                    vec.pending[g.tiebreak] = False
+                continue
+            cands = candidates(g)
+            frames.append([g, apply(g, *cands[0]), cands, 0])
+
+        self.unplaced = unplaced
+        return unplaced
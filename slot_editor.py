@@ -0,0 +1,233 @@
+"""학생 대화상자의 가능/불가 시간대 편집 - 표 모델 + 칸 편집기(델리게이트), 주간 칠하기 캔버스
+
+표는 슬롯 목록을 그대로 보여주는 모델이라 줄마다 위젯을 만들지 않고, 편집하는 칸에만
+델리게이트가 콤보/스핀 상자를 잠깐 띄운다. 추가·삭제는 그 줄만 넣고 뺀다.
+캔버스는 요일별 실제 가능 비트마스크(Student.day_mask와 같은 형식)를 직접 칠하고,
+다 칠하면 대화상자가 연속 구간을 슬롯으로 바꿔(student.slots_from_masks) 표에 넣는다.
+"""
+from dataclasses import replace
+from PyQt6.QtWidgets import QWidget, QStyledItemDelegate, QComboBox, QSpinBox, QSizePolicy
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QPainter, QPen
+from student import minutes_mask
+from time_grid import TimeGrid
+
+DAY_NAMES = ["일", "월", "화", "수", "목", "금", "토", "평일", "주말"]
+HEADERS = ["요일", "시작 시", "시작 분", "끝 시", "끝 분"]
+_FIELDS = ("day_of_week", "start_hour", "start_min", "end_hour", "end_min")
+_RANGES = (None, (0, 23), (0, 59), (0, 24), (0, 59))  # 시·분 칸 입력 범위 (끝 24시 = 자정, 분은 0)
+
+
+class SlotTableModel(QAbstractTableModel):
+    """가능/불가 슬롯 목록 표 (열: 요일, 시작 시·분, 끝 시·분)
+
+    슬롯 객체는 학생과 공유될 수 있으므로 칸을 고칠 때 새 객체로 바꿔 넣는다.
+    """
+
+    def __init__(self, slot_type, parent=None):
+        super().__init__(parent)
+        self.slot_type = slot_type
+        self._slots: list = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._slots)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._slots):
+            return None
+        value = getattr(self._slots[index.row()], _FIELDS[index.column()])
+        if role == Qt.ItemDataRole.EditRole:
+            return value
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                return DAY_NAMES[value] if 0 <= value < len(DAY_NAMES) else str(value)
+            return f"{value:02d}" if index.column() in (2, 4) else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid():
+            return False
+        row, field = index.row(), _FIELDS[index.column()]
+        changes = {field: value}
+        if field == "end_hour" and value == 24:
+            changes["end_min"] = 0
+        elif field == "end_min" and self._slots[row].end_hour == 24:
+            changes["end_min"] = 0
+        old = self._slots[row]
+        new = replace(old, **changes)
+        if new == old:
+            return False
+        self._slots[row] = new
+        self.dataChanged.emit(index, self.index(row, len(_FIELDS) - 1) if len(changes) > 1 else index)
+        return True
+
+    def slots(self) -> list:
+        return list(self._slots)
+
+    def set_slots(self, slots):
+        self.beginResetModel()
+        self._slots = list(slots)
+        self.endResetModel()
+
+    def append(self, slot):
+        row = len(self._slots)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._slots.append(slot)
+        self.endInsertRows()
+
+    def remove(self, row: int):
+        if not 0 <= row < len(self._slots):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._slots[row]
+        self.endRemoveRows()
+
+
+class SlotDelegate(QStyledItemDelegate):
+    """편집하는 칸에만 요일 콤보 / 시·분 스핀 상자를 띄움"""
+
+    def createEditor(self, parent, option, index):
+        if index.column() == 0:
+            editor = QComboBox(parent)
+            editor.addItems(DAY_NAMES)
+            return editor
+        editor = QSpinBox(parent)
+        editor.setRange(*_RANGES[index.column()])
+        return editor
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.ItemDataRole.EditRole)
+        if isinstance(editor, QComboBox):
+            editor.setCurrentIndex(max(0, min(value, len(DAY_NAMES) - 1)))
+        else:
+            editor.setValue(value)
+
+    def setModelData(self, editor, model, index):
+        value = editor.currentIndex() if isinstance(editor, QComboBox) else editor.value()
+        model.setData(index, value, Qt.ItemDataRole.EditRole)
+
+
+class AvailabilityCanvas(QWidget):
+    """주간 가능/불가 칠하기 (열 = 요일, 행 = 칸) - 불가(빨강) 칸에서 끌면 가능(초록)으로,
+    가능 칸에서 끌면 불가로 바꿈
+
+    masks는 요일별 실제 가능 비트마스크(가능에서 불가를 뺀 것). 칸 범위 밖(격자 시간 외,
+    칸보다 잘게 나뉜 분)은 건드리지 않는다. 마우스를 놓으면 painted 신호를 낸다.
+    """
+
+    painted = pyqtSignal()
+
+    _FILL = QColor(200, 255, 200)        # 가능
+    _UNAVAILABLE = QColor(255, 230, 230)  # 불가
+    _GRID_PEN = QPen(QColor(220, 220, 220))
+    HEADER = 20
+    LABEL = 40
+
+    def __init__(self, time_grid: TimeGrid | None = None, parent=None):
+        super().__init__(parent)
+        self.time_grid = time_grid or TimeGrid()
+        self.masks = [0] * 7
+        self._anchor: tuple[int, int] | None = None  # 끌기 시작 (열, 행)
+        self._paint = True  # 칠하기(True) / 지우기(False)
+        self._before: list[int] | None = None  # 끌기 시작 때 masks
+        self.setMinimumSize(self.LABEL + 7 * 28, self.HEADER + 8 * 12)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+    def sizeHint(self):
+        return QSize(self.LABEL + 7 * 48, self.HEADER + self.time_grid.rows * 10)
+
+    def set_masks(self, masks: list[int]):
+        self.masks = list(masks)
+        self.update()
+
+    def _cell_mask(self, row: int) -> int:
+        start = self.time_grid.row_start(row)
+        return minutes_mask(start, start + self.time_grid.slot_minutes)
+
+    def _cell_at(self, pos) -> tuple[int, int]:
+        grid = self.time_grid
+        w = (self.width() - self.LABEL) / len(grid.days)
+        h = (self.height() - self.HEADER) / grid.rows
+        col = min(max(int((pos.x() - self.LABEL) // w), 0), len(grid.days) - 1)
+        row = min(max(int((pos.y() - self.HEADER) // h), 0), grid.rows - 1)
+        return col, row
+
+    def _apply(self, corner: tuple[int, int]):
+        """끌기 시작 칸 ~ corner 사각형을 칠하거나 지움 (시작 때 상태 기준)"""
+        (c0, r0), (c1, r1) = self._anchor, corner
+        span = 0
+        for r in range(min(r0, r1), max(r0, r1) + 1):
+            span |= self._cell_mask(r)
+        masks = list(self._before)
+        for c in range(min(c0, c1), max(c0, c1) + 1):
+            d = self.time_grid.days[c]
+            masks[d] = masks[d] | span if self._paint else masks[d] & ~span
+        if masks != self.masks:
+            self.masks = masks
+            self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.MouseButton.LeftButton:
+            return super().mousePressEvent(event)
+        col, row = self._cell_at(event.position())
+        d = self.time_grid.days[col]
+        cell = self._cell_mask(row)
+        self._paint = self.masks[d] & cell != cell
+        self._anchor = (col, row)
+        self._before = list(self.masks)
+        self._apply((col, row))
+
+    def mouseMoveEvent(self, event):
+        if self._anchor is not None:
+            self._apply(self._cell_at(event.position()))
+
+    def mouseReleaseEvent(self, event):
+        if self._anchor is None:
+            return super().mouseReleaseEvent(event)
+        self._apply(self._cell_at(event.position()))
+        changed = self.masks != self._before
+        self._anchor = self._before = None
+        if changed:
+            self.painted.emit()
+
+    def paintEvent(self, event):
+        grid = self.time_grid
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(255, 255, 255))
+        w = (self.width() - self.LABEL) / len(grid.days)
+        h = (self.height() - self.HEADER) / grid.rows
+        label_every = max(1, 60 // grid.slot_minutes)
+        for c, d in enumerate(grid.days):
+            x = self.LABEL + c * w
+            painter.drawText(QRect(int(x), 0, int(w), self.HEADER), Qt.AlignmentFlag.AlignCenter, DAY_NAMES[d])
+            for r in range(grid.rows):
+                cell = self._cell_mask(r)
+                rect = QRect(int(x), int(self.HEADER + r * h), int(w) + 1, int(h) + 1)
+                painter.fillRect(rect, self._FILL if self.masks[d] & cell else self._UNAVAILABLE)
+        painter.setPen(self._GRID_PEN)
+        for r in range(grid.rows + 1):
+            y = int(self.HEADER + r * h)
+            painter.drawLine(self.LABEL, y, self.width(), y)
+        for c in range(len(grid.days) + 1):
+            x = int(self.LABEL + c * w)
+            painter.drawLine(x, self.HEADER, x, self.height())
+        painter.setPen(QColor(100, 100, 100))
+        for r in range(0, grid.rows, label_every):
+            start = grid.row_start(r)
+            painter.drawText(QRect(0, int(self.HEADER + r * h), self.LABEL - 4, int(h)),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             f"{start // 60:02d}:{start % 60:02d}")
+        painter.end()
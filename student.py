@@ -1,8 +1,13 @@
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List
+import perf
 
 
-@dataclass
+# 시간대는 고정(frozen) - 필드를 제자리에서 바꾸면 학생의 비트맵이 모르고 지나가므로
+# 바꿀 때는 dataclasses.replace로 새 객체를 만들어 목록에 넣는다 (_SlotList가 무효화)
+@dataclass(frozen=True)
 class UnavailableSlot:
     """불가능한 시간대: 요일(0=일~6=토), 시작/끝 시·분"""
     day_of_week: int
@@ -12,7 +17,7 @@ class UnavailableSlot:
     end_min: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class AvailableSlot:
     """가능한 시간대: 요일(0=일~6=토), 시작/끝 시·분 (비어있으면 모든 시간 가능)"""
     day_of_week: int
@@ -22,6 +27,190 @@ class AvailableSlot:
     end_min: int
 
 
+DAY_MINUTES = 24 * 60
+# 비트 i = 그 날 i분(0분~24:00)에 수업 가능. 끝 시각(24:00)까지 검사하므로 1비트 여유
+_DAY_BITS = DAY_MINUTES + 1
+_FULL_DAY = (1 << _DAY_BITS) - 1
+# 학생마다 기억해 둘 feasible_starts 결과 수 ((요일, 길이, 간격)별, 넘치면 가장 오래 안 쓴 것부터 버림)
+FEASIBLE_CACHE_SIZE = 32
+
+
+def minutes_mask(start_minutes: int, end_minutes: int) -> int:
+    """[start, end) 분 구간 비트마스크"""
+    start_minutes = max(start_minutes, 0)
+    end_minutes = min(end_minutes, _DAY_BITS)
+    if end_minutes <= start_minutes:
+        return 0
+    return ((1 << (end_minutes - start_minutes)) - 1) << start_minutes
+
+
+_WEEKDAYS = (1, 2, 3, 4, 5)
+
+
+def expand_day(slot_day: int) -> tuple[int, ...]:
+    """슬롯 요일 코드를 실제 요일(0=일~6=토)로 펼침 (7=평일, 8=주말)"""
+    if 0 <= slot_day <= 6:
+        return (slot_day,)
+    if slot_day == 7:  # 평일 (월~금)
+        return (1, 2, 3, 4, 5)
+    if slot_day == 8:  # 주말 (일, 토)
+        return (0, 6)
+    return ()
+
+
+def slot_masks(slots) -> list[int]:
+    """슬롯 목록 → 요일(0=일~6=토)별 분 단위 비트마스크 (평일/주말 코드는 펼침)"""
+    masks = [0] * 7
+    for slot in slots:
+        m = minutes_mask(slot.start_hour * 60 + slot.start_min, slot.end_hour * 60 + slot.end_min)
+        if not m:
+            continue
+        for d in expand_day(slot.day_of_week):
+            masks[d] |= m
+    return masks
+
+
+def _runs(mask: int):
+    """비트마스크의 연속 구간 [start, end) 분"""
+    while mask:
+        start = (mask & -mask).bit_length() - 1
+        end = start + ((mask >> start) ^ ((mask >> start) + 1)).bit_length() - 1
+        yield start, end
+        mask &= ~minutes_mask(start, end)
+
+
+def slots_from_masks(masks: list[int], slot_type) -> list:
+    """요일별 비트마스크 → 겹치지 않는 슬롯 목록 (요일·시작 순, 월~금이 같으면 평일, 일·토가 같으면 주말 한 줄로)"""
+    days: list[tuple[int, int]] = []  # (슬롯 요일 코드, 마스크)
+    if masks[1] and all(masks[d] == masks[1] for d in _WEEKDAYS):
+        days.append((7, masks[1]))
+    else:
+        days.extend((d, masks[d]) for d in _WEEKDAYS)
+    if masks[0] and masks[0] == masks[6]:
+        days.append((8, masks[0]))
+    else:
+        days.extend((d, masks[d]) for d in (6, 0))
+    days.sort()
+    slots = []
+    for code, mask in days:
+        for start, end in _runs(mask):
+            end = min(end, DAY_MINUTES)
+            slots.append(slot_type(code, start // 60, start % 60, end // 60, end % 60))
+    return slots
+
+
+def effective_masks(available, unavailable) -> list[int]:
+    """가능/불가 슬롯 → 요일별 실제 가능 비트마스크 (가능 시간이 없으면 종일에서 불가만 뺌)"""
+    avail = slot_masks(available) if available else [_FULL_DAY] * 7
+    return [a & ~u for a, u in zip(avail, slot_masks(unavailable))]
+
+
+def normalize_slots(available, unavailable) -> tuple[list[AvailableSlot], list[UnavailableSlot]]:
+    """가능/불가 슬롯을 같은 뜻의 최소 구간 목록으로 (요일 코드 펼침 → 요일별 병합·정렬 → 가능에서 불가 빼기)
+
+    가능 시간이 있으면 불가를 뺀 가능 구간만 남기고 불가 목록은 비운다. 빼고 나서 가능 구간이
+    하나도 없으면(원래 "언제도 불가") 종일 불가(평일·주말 0:00~24:00)로 바꾼다.
+    가능 시간이 없으면 불가 구간만 병합한다.
+    """
+    unavail = slot_masks(unavailable)
+    if not available:
+        return [], slots_from_masks(unavail, UnavailableSlot)
+    avail = [a & ~u for a, u in zip(slot_masks(available), unavail)]
+    if not any(avail):
+        return [], [UnavailableSlot(7, 0, 0, 24, 0), UnavailableSlot(8, 0, 0, 24, 0)]
+    return slots_from_masks(avail, AvailableSlot), []
+
+
+@lru_cache(maxsize=None)
+def _probe_mask(duration_minutes: int, step: int = 30) -> int:
+    """can_place_block이 검사하는 시각들(0, step, 2·step, …분과 끝 시각)의 비트마스크"""
+    mask = 1 << duration_minutes
+    for offset in range(0, duration_minutes, step):
+        mask |= 1 << offset
+    return mask
+
+
+class _SlotList(list):
+    """Student.available/unavailable용 리스트 - 내용이 바뀌면 주인의 비트맵을 무효화"""
+
+    def __init__(self, iterable=(), owner=None):
+        super().__init__(iterable)
+        self._owner = owner
+
+    def _changed(self):
+        # 언피클/복사 중에는 _owner가 아직 없음
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            owner._invalidate_slots()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, other):
+        result = super().__iadd__(other)
+        self._changed()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+    def append(self, item):
+        super().append(item)
+        self._changed()
+
+    def extend(self, iterable):
+        super().extend(iterable)
+        self._changed()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+class _SlotField:
+    """Student.available/unavailable 디스크립터 - 대입 값을 _SlotList로 감싸고 비트맵 무효화"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return ()  # dataclass 기본값 (빈 목록)
+        return obj.__dict__[self.name]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = _SlotList(value, owner=obj)
+        obj._invalidate_slots()
+
+
 GRADES = ["초1", "초2", "초3", "초4", "초5", "초6", "중1", "중2", "중3", "고1", "고2", "고3"]
 
 
@@ -35,8 +224,36 @@ class Student:
     address: str = ""
     class_duration_minutes: int = 60
     sessions_per_week: int = 1  # 주당 수업 횟수
-    unavailable: List[UnavailableSlot] = field(default_factory=list)
-    available: List[AvailableSlot] = field(default_factory=list)
+    unavailable: List[UnavailableSlot] = _SlotField()
+    available: List[AvailableSlot] = _SlotField()
+
+    def _invalidate_slots(self):
+        """슬롯이 바뀌면 컴파일된 요일별 비트맵과 시작 가능 캐시 폐기 (다음 조회 때 재생성)"""
+        d = self.__dict__
+        d["_slots_version"] = d.get("_slots_version", 0) + 1
+        d["_day_masks"] = None
+        d["_feasible"] = None
+
+    def __getstate__(self):
+        # 시작 가능 캐시는 학생 수 × 수십 개 큰 정수라 프로세스로 보낼 때 빼고 보냄 (받는 쪽에서 다시 채움)
+        state = self.__dict__.copy()
+        state["_feasible"] = None
+        return state
+
+    def _compile_day_masks(self) -> tuple[int, ...]:
+        """가능/불가 슬롯을 요일(0=일~6=토)별 분 단위 비트맵으로 컴파일"""
+        return tuple(effective_masks(self.available, self.unavailable))
+
+    def day_mask(self, day_of_week: int) -> int:
+        """해당 요일의 가능 비트맵 (비트 i = i분에 가능)"""
+        masks = self.__dict__.get("_day_masks")
+        if masks is None:
+            masks = self._compile_day_masks()
+            self.__dict__["_day_masks"] = masks
+        if 0 <= day_of_week <= 6:
+            return masks[day_of_week]
+        # 범위 밖 요일: 어떤 슬롯과도 안 맞음 → 가능 시간이 있으면 불가, 없으면 가능
+        return 0 if self.available else _FULL_DAY
 
     def _age_to_grade(self) -> str:
         """age로 grade 추정 (기존 DB 호환)"""
@@ -49,21 +266,6 @@ class Student:
             return ["고1", "고2", "고3"][a - 16]
         return "초1"
 
-    def _in_slot(self, check_minutes: int, slot) -> bool:
-        slot_start = slot.start_hour * 60 + slot.start_min
-        slot_end = slot.end_hour * 60 + slot.end_min
-        return slot_start <= check_minutes < slot_end
-
-    def _slot_matches_day(self, slot_day: int, check_day: int) -> bool:
-        """슬롯의 요일이 check_day와 일치하는지 (7=평일, 8=주말)"""
-        if 0 <= slot_day <= 6:
-            return slot_day == check_day
-        if slot_day == 7:  # 평일 (월~금)
-            return 1 <= check_day <= 5
-        if slot_day == 8:  # 주말 (일, 토)
-            return check_day in (0, 6)
-        return False
-
     def is_available(self, day_of_week: int, hour: int, min: int) -> bool:
         """가능/불가능 시간대를 모두 고려해 해당 시각에 수업 가능 여부 반환
         
@@ -73,44 +275,56 @@ class Student:
         - 둘 다 비움: 모든 시간 가능 (학교 시간 고려 안 함)
         """
         check_minutes = hour * 60 + min
-        has_avail = bool(self.available)
-        has_unavail = bool(self.unavailable)
-
-        if has_avail and not has_unavail:
-            # 가능 시간만 있음 → 가능 시간 안에 있어야 함
-            for slot in self.available:
-                if self._slot_matches_day(slot.day_of_week, day_of_week) and self._in_slot(check_minutes, slot):
-                    return True
-            return False
-
-        if not has_avail and has_unavail:
-            # 불가만 있음 → 불가 제외한 모든 시간 가능
-            for slot in self.unavailable:
-                if self._slot_matches_day(slot.day_of_week, day_of_week) and self._in_slot(check_minutes, slot):
+        if 0 <= check_minutes < _DAY_BITS:
+            return bool(self.day_mask(day_of_week) >> check_minutes & 1)
+        # 하루 범위 밖은 어떤 슬롯에도 포함되지 않음
+        return not self.available
+
+    @perf.timed()
+    def can_place_block(self, day_of_week: int, start_minutes: int, duration_minutes: int, step: int = 30) -> bool:
+        """해당 요일·시작·길이로 수업 배치 가능한지 (step분 간격 + 끝 시각 검사, step은 시간 격자 칸 단위)"""
+        end_m = start_minutes + duration_minutes
+        if start_minutes < 0 or end_m >= _DAY_BITS:
+            # 하루 범위를 벗어나는 경우는 드묾 → 기존 방식대로 시각별 검사
+            for m in list(range(start_minutes, end_m, step)) + [end_m]:
+                h, mn = divmod(m, 60)
+                if not self.is_available(day_of_week, h, mn):
                     return False
             return True
+        # 이미 구한 시작 가능 마스크가 있으면 (드래그 하이라이트 후 드롭 등) 그 비트만 봄
+        cache = self.__dict__.get("_feasible")
+        if cache:
+            starts = cache.get((day_of_week, duration_minutes, step))
+            if starts is not None:
+                return bool(starts >> start_minutes & 1)
+        probe = _probe_mask(duration_minutes, step) << start_minutes
+        return self.day_mask(day_of_week) & probe == probe
 
-        if has_avail and has_unavail:
-            # 둘 다 있음 → 가능 AND 불가 아님
-            for slot in self.unavailable:
-                if self._slot_matches_day(slot.day_of_week, day_of_week) and self._in_slot(check_minutes, slot):
-                    return False
-            for slot in self.available:
-                if self._slot_matches_day(slot.day_of_week, day_of_week) and self._in_slot(check_minutes, slot):
-                    return True
-            return False
-
-        # 둘 다 비움 → 모든 시간 가능 (학교 시간 고려 안 함)
-        return True
-
-    def can_place_block(self, day_of_week: int, start_minutes: int, duration_minutes: int) -> bool:
-        """해당 요일·시작·길이로 수업 배치 가능한지 (30분 단위로 검사)"""
-        for offset in range(0, duration_minutes, 30):
-            m = start_minutes + offset
-            h, mn = divmod(m, 60)
-            if not self.is_available(day_of_week, h, mn):
-                return False
-        # 끝 시각도 검사
-        end_m = start_minutes + duration_minutes
-        eh, em = divmod(end_m, 60)
-        return self.is_available(day_of_week, eh, em)
+    def feasible_starts(self, day_of_week: int, duration_minutes: int, step: int = 30) -> int:
+        """can_place_block이 참이 되는 시작 분들의 비트마스크 (비트 t = t분 시작 가능)
+
+        (요일, 길이, 간격)별로 FEASIBLE_CACHE_SIZE개까지 LRU로 기억한다 (슬롯이 바뀌면 버림).
+        """
+        d = self.__dict__
+        cache = d.get("_feasible")
+        if cache is None:
+            cache = d["_feasible"] = OrderedDict()
+        key = (day_of_week, duration_minutes, step)
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        result = cache[key] = self._compute_feasible_starts(day_of_week, duration_minutes, step)
+        if len(cache) > FEASIBLE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def _compute_feasible_starts(self, day_of_week: int, duration_minutes: int, step: int) -> int:
+        day = self.day_mask(day_of_week)
+        probe = _probe_mask(duration_minutes, step)
+        result = day
+        while probe:
+            low = probe & -probe
+            probe ^= low
+            result &= day >> (low.bit_length() - 1)
+        return result
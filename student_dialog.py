@@ -1,19 +1,19 @@
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QFormLayout, QHBoxLayout,
-    QLineEdit, QSpinBox, QPushButton, QLabel, QTableWidget, QComboBox
+    QDialog, QVBoxLayout, QFormLayout, QHBoxLayout, QAbstractItemView,
+    QLineEdit, QSpinBox, QPushButton, QLabel, QTableView, QComboBox, QTabWidget
 )
-from PyQt6.QtCore import Qt
-from student import Student, UnavailableSlot, AvailableSlot, GRADES
-
-DAY_NAMES = ["일", "월", "화", "수", "목", "금", "토", "평일", "주말"]
+from student import (
+    Student, UnavailableSlot, AvailableSlot, GRADES, normalize_slots, effective_masks, minutes_mask, slots_from_masks
+)
+from slot_editor import SlotTableModel, SlotDelegate, AvailabilityCanvas
+from time_grid import TimeGrid
 AGE_BY_GRADE = {"초1":7,"초2":8,"초3":9,"초4":10,"초5":11,"초6":12,"중1":13,"중2":14,"중3":15,"고1":16,"고2":17,"고3":18}
 
 
 class StudentDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, time_grid: TimeGrid | None = None):
         super().__init__(parent)
-        self.unavailable_slots: list[UnavailableSlot] = []
-        self.available_slots: list[AvailableSlot] = []
+        self.time_grid = time_grid or TimeGrid()  # 캔버스 칸 = 시간표와 같은 격자
         self._setup_ui()
         self.setWindowTitle("학생 추가")
         self.resize(550, 600)
@@ -53,10 +53,19 @@ class StudentDialog(QDialog):
         layout.addLayout(form)
 
         layout.addWidget(QLabel("가능한 시간대 (불가만 있으면→불가 제외 전부 가능 / 가능만 있으면→가능 시간만 가능):"))
-        self.available_table = QTableWidget(0, 5)
-        self.available_table.setHorizontalHeaderLabels(["요일", "시작 시", "시작 분", "끝 시", "끝 분"])
-        self.available_table.horizontalHeader().setStretchLastSection(True)
-        layout.addWidget(self.available_table)
+        self.available_model = SlotTableModel(AvailableSlot, self)
+        self.available_table = self._slot_table(self.available_model)
+        # 시간대는 표 / 주간 칠하기 두 가지로 편집 (캔버스는 가능·불가를 합친 실제 가능 시간)
+        self.canvas = AvailabilityCanvas(self.time_grid)
+        self.canvas.setToolTip(
+            "빨간(불가) 칸에서 끌면 가능으로, 초록(가능) 칸에서 끌면 불가로 바꿉니다\n"
+            "가능 시간 목록이 있으면 가능 목록으로, 없으면 불가 목록으로 적습니다"
+        )
+        self.canvas.painted.connect(self._on_canvas_painted)
+        avail_tabs = QTabWidget()
+        avail_tabs.addTab(self.available_table, "목록")
+        avail_tabs.addTab(self.canvas, "주간 칠하기")
+        layout.addWidget(avail_tabs)
 
         avail_btn_layout = QHBoxLayout()
         add_avail_btn = QPushButton("가능 시간 추가")
@@ -69,10 +78,12 @@ class StudentDialog(QDialog):
         layout.addLayout(avail_btn_layout)
 
         layout.addWidget(QLabel("불가능한 시간대:"))
-        self.unavailable_table = QTableWidget(0, 5)
-        self.unavailable_table.setHorizontalHeaderLabels(["요일", "시작 시", "시작 분", "끝 시", "끝 분"])
-        self.unavailable_table.horizontalHeader().setStretchLastSection(True)
+        self.unavailable_model = SlotTableModel(UnavailableSlot, self)
+        self.unavailable_table = self._slot_table(self.unavailable_model)
         layout.addWidget(self.unavailable_table)
+        for model in (self.available_model, self.unavailable_model):
+            for signal in (model.dataChanged, model.rowsInserted, model.rowsRemoved, model.modelReset):
+                signal.connect(self._refresh_canvas)
 
         btn_layout = QHBoxLayout()
         add_btn = QPushButton("시간대 추가")
@@ -94,146 +105,68 @@ class StudentDialog(QDialog):
         dialog_buttons.addWidget(cancel_btn)
         layout.addLayout(dialog_buttons)
 
-    def _sync_available_from_table(self):
-        """테이블에 입력된 값을 available_slots에 반영 (추가/삭제 전 호출)"""
-        self.available_slots = []
-        for i in range(self.available_table.rowCount()):
-            day = 0
-            combo = self.available_table.cellWidget(i, 0)
-            if combo:
-                day = min(combo.currentIndex(), 8)  # 0~6 요일, 7=평일, 8=주말
-            sh = sm = eh = em = 0
-            for col, rng in enumerate([(0, 23), (0, 59), (0, 23), (0, 59)]):
-                w = self.available_table.cellWidget(i, col + 1)
-                if w:
-                    val = w.value()
-                    if col == 0: sh = val
-                    elif col == 1: sm = val
-                    elif col == 2: eh = val
-                    else: em = val
-            self.available_slots.append(AvailableSlot(day, sh, sm, eh, em))
+    def _slot_table(self, model: SlotTableModel) -> QTableView:
+        """슬롯 표 - 칸 편집기는 편집할 때만 델리게이트가 만듦"""
+        table = QTableView()
+        table.setModel(model)
+        table.setItemDelegate(SlotDelegate(table))
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.SelectedClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+            | QAbstractItemView.EditTrigger.AnyKeyPressed
+        )
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
 
-    def _sync_unavailable_from_table(self):
-        """테이블에 입력된 값을 unavailable_slots에 반영"""
-        self.unavailable_slots = []
-        for i in range(self.unavailable_table.rowCount()):
-            day = 0
-            combo = self.unavailable_table.cellWidget(i, 0)
-            if combo:
-                day = min(combo.currentIndex(), 8)
-            sh = sm = eh = em = 0
-            for col in range(4):
-                w = self.unavailable_table.cellWidget(i, col + 1)
-                if w:
-                    val = w.value()
-                    if col == 0: sh = val
-                    elif col == 1: sm = val
-                    elif col == 2: eh = val
-                    else: em = val
-            self.unavailable_slots.append(UnavailableSlot(day, sh, sm, eh, em))
+    @property
+    def available_slots(self) -> list[AvailableSlot]:
+        return self.available_model.slots()
 
-    def _add_unavailable_slot(self):
-        self._sync_unavailable_from_table()
-        self.unavailable_slots.append(UnavailableSlot(1, 9, 0, 12, 0))
-        self._load_unavailable_to_table()
+    @property
+    def unavailable_slots(self) -> list[UnavailableSlot]:
+        return self.unavailable_model.slots()
 
     def _add_available_slot(self):
-        self._sync_available_from_table()
-        self.available_slots.append(AvailableSlot(1, 16, 0, 21, 0))
-        self._load_available_to_table()
+        self.available_model.append(AvailableSlot(1, 16, 0, 21, 0))
 
     def _remove_available_slot(self):
-        self._sync_available_from_table()
-        row = self.available_table.currentRow()
-        if 0 <= row < len(self.available_slots):
-            self.available_slots.pop(row)
-            self._load_available_to_table()
+        self.available_model.remove(self.available_table.currentIndex().row())
 
-    def _load_available_to_table(self):
-        self.available_table.setRowCount(len(self.available_slots))
-        for i, s in enumerate(self.available_slots):
-            day_combo = QComboBox()
-            day_combo.addItems(DAY_NAMES)
-            day_combo.setCurrentIndex(max(0, min(s.day_of_week, 8)))
-            self.available_table.setCellWidget(i, 0, day_combo)
-            for col, (val, rng) in enumerate([
-                (s.start_hour, (0, 23)), (s.start_min, (0, 59)),
-                (s.end_hour, (0, 23)), (s.end_min, (0, 59))
-            ], 1):
-                sp = QSpinBox()
-                sp.setRange(*rng)
-                sp.setValue(val)
-                self.available_table.setCellWidget(i, col, sp)
+    def _add_unavailable_slot(self):
+        self.unavailable_model.append(UnavailableSlot(1, 9, 0, 12, 0))
 
     def _remove_unavailable_slot(self):
-        self._sync_unavailable_from_table()
-        row = self.unavailable_table.currentRow()
-        if 0 <= row < len(self.unavailable_slots):
-            self.unavailable_slots.pop(row)
-            self._load_unavailable_to_table()
-
-    def _load_unavailable_to_table(self):
-        self.unavailable_table.setRowCount(len(self.unavailable_slots))
-        for i, s in enumerate(self.unavailable_slots):
-            day_combo = QComboBox()
-            day_combo.addItems(DAY_NAMES)
-            day_combo.setCurrentIndex(max(0, min(s.day_of_week, 8)))
-            self.unavailable_table.setCellWidget(i, 0, day_combo)
-            for col, (val, rng) in enumerate([
-                (s.start_hour, (0, 23)), (s.start_min, (0, 59)),
-                (s.end_hour, (0, 23)), (s.end_min, (0, 59))
-            ], 1):
-                sp = QSpinBox()
-                sp.setRange(*rng)
-                sp.setValue(val)
-                self.unavailable_table.setCellWidget(i, col, sp)
+        self.unavailable_model.remove(self.unavailable_table.currentIndex().row())
+
+    def _refresh_canvas(self, *_):
+        """표가 바뀌면 캔버스를 다시 그림 (실제 가능 = 초록, 불가 = 연한 빨강)"""
+        self.canvas.set_masks(effective_masks(self.available_model.slots(), self.unavailable_model.slots()))
+
+    def _on_canvas_painted(self):
+        """칠한 결과를 표로 (연속 구간마다 한 줄) - 학생이 쓰던 방식을 유지
+
+        가능 목록이 있던 학생은 가능 목록으로(다 지우면 종일 불가), 불가만 있던 학생은
+        종일에서 뺀 불가 목록으로 적는다. 칠하기만으로 입력 방식이 바뀌지 않게.
+        """
+        masks = self.canvas.masks
+        if not self.available_model.rowCount():
+            day = minutes_mask(0, 24 * 60)
+            available, unavailable = [], slots_from_masks([day & ~m for m in masks], UnavailableSlot)
+        elif any(masks):
+            available, unavailable = slots_from_masks(masks, AvailableSlot), []
+        else:
+            available, unavailable = [], [UnavailableSlot(7, 0, 0, 24, 0), UnavailableSlot(8, 0, 0, 24, 0)]
+        self.available_model.set_slots(available)
+        self.unavailable_model.set_slots(unavailable)
 
     def get_student(self) -> Student:
-        avail_slots = []
-        for i in range(self.available_table.rowCount()):
-            day = 0
-            combo = self.available_table.cellWidget(i, 0)
-            if combo:
-                day = min(combo.currentIndex(), 8)
-            sh = sm = eh = em = 0
-            widgets = [
-                self.available_table.cellWidget(i, 1),
-                self.available_table.cellWidget(i, 2),
-                self.available_table.cellWidget(i, 3),
-                self.available_table.cellWidget(i, 4),
-            ]
-            for col, widget in enumerate(widgets):
-                if widget:
-                    val = widget.value()
-                    if col == 0: sh = val
-                    elif col == 1: sm = val
-                    elif col == 2: eh = val
-                    else: em = val
-            avail_slots.append(AvailableSlot(day, sh, sm, eh, em))
-
-        slots = []
-        for i in range(self.unavailable_table.rowCount()):
-            day = 0
-            combo = self.unavailable_table.cellWidget(i, 0)
-            if combo:
-                day = min(combo.currentIndex(), 8)
-            sh = sm = eh = em = 0
-            widgets = [
-                self.unavailable_table.cellWidget(i, 1),
-                self.unavailable_table.cellWidget(i, 2),
-                self.unavailable_table.cellWidget(i, 3),
-                self.unavailable_table.cellWidget(i, 4),
-            ]
-            for col, widget in enumerate(widgets):
-                if widget:
-                    val = widget.value()
-                    if col == 0: sh = val
-                    elif col == 1: sm = val
-                    elif col == 2: eh = val
-                    else: em = val
-            slots.append(UnavailableSlot(day, sh, sm, eh, em))
         grade_text = self.grade_combo.currentText()
         age = AGE_BY_GRADE.get(grade_text, 13)
+        available, unavailable = normalize_slots(self.available_model.slots(), self.unavailable_model.slots())
         return Student(
             name=self.name_edit.text(),
             grade=grade_text,
@@ -242,8 +175,8 @@ class StudentDialog(QDialog):
             address=self.address_edit.text(),
             class_duration_minutes=self.duration_spin.value(),
             sessions_per_week=self.sessions_spin.value(),
-            unavailable=slots,
-            available=avail_slots
+            unavailable=unavailable,
+            available=available
         )
 
     def set_student(self, s: Student):
@@ -258,7 +191,5 @@ class StudentDialog(QDialog):
         self.address_edit.setText(s.address)
         self.duration_spin.setValue(s.class_duration_minutes)
         self.sessions_spin.setValue(getattr(s, 'sessions_per_week', 1))
-        self.unavailable_slots = list(s.unavailable)
-        self.available_slots = list(getattr(s, 'available', []))
-        self._load_available_to_table()
-        self._load_unavailable_to_table()
+        self.unavailable_model.set_slots(s.unavailable)
+        self.available_model.set_slots(getattr(s, 'available', []))
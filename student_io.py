@@ -0,0 +1,223 @@
+"""학생 목록 CSV/JSON 가져오기·내보내기 (한 명씩 스트리밍해 메모리 일정)
+
+- CSV: 한 줄에 학생 한 명. 시간대는 "요일 HH:MM-HH:MM"를 ';'로 이어 씀 (예: "7 16:00-21:00;1 09:00-12:00")
+- JSON Lines(.jsonl): 한 줄에 학생 한 명 JSON 객체
+- JSON(.json): 학생 객체 배열 (가져오기도 배열 원소를 하나씩 해석해 파일 크기와 무관하게 메모리 일정)
+요일 코드는 DB와 같음: 0=일~6=토, 7=평일, 8=주말. id가 비어 있으면 새 학생으로 추가된다.
+"""
+import csv
+import json
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+from student import Student, UnavailableSlot, AvailableSlot
+import db
+
+CSV_FIELDS = [
+    "id", "name", "grade", "age", "phone", "address",
+    "class_duration_minutes", "sessions_per_week", "available", "unavailable",
+]
+
+
+def _format_slots(slots) -> str:
+    return ";".join(
+        f"{s.day_of_week} {s.start_hour:02d}:{s.start_min:02d}-{s.end_hour:02d}:{s.end_min:02d}" for s in slots
+    )
+
+
+def _parse_slots(text: str) -> list[tuple[int, int, int, int, int]]:
+    """"7 16:00-21:00;1 09:00-12:00" → [(7, 16, 0, 21, 0), (1, 9, 0, 12, 0)]"""
+    slots = []
+    for part in text.split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        day, span = part.split()
+        start, end = span.split("-")
+        sh, sm = start.split(":")
+        eh, em = end.split(":")
+        slots.append((int(day), int(sh), int(sm), int(eh), int(em)))
+    return slots
+
+
+def _student_to_dict(s: Student) -> dict:
+    return {
+        "id": s.id,
+        "name": s.name,
+        "grade": s.grade,
+        "age": s.age,
+        "phone": s.phone,
+        "address": s.address,
+        "class_duration_minutes": s.class_duration_minutes,
+        "sessions_per_week": s.sessions_per_week,
+        "available": [[x.day_of_week, x.start_hour, x.start_min, x.end_hour, x.end_min] for x in s.available],
+        "unavailable": [[x.day_of_week, x.start_hour, x.start_min, x.end_hour, x.end_min] for x in s.unavailable],
+    }
+
+
+def _student_from_dict(d: dict) -> Student:
+    return Student(
+        id=int(d["id"]) if d.get("id") not in (None, "") else None,
+        name=d.get("name") or "",
+        grade=d.get("grade") or "중1",
+        age=int(d.get("age") or 0),
+        phone=d.get("phone") or "",
+        address=d.get("address") or "",
+        class_duration_minutes=int(d.get("class_duration_minutes") or 60),
+        sessions_per_week=int(d.get("sessions_per_week") or 1),
+        available=[AvailableSlot(*x) for x in d.get("available") or []],
+        unavailable=[UnavailableSlot(*x) for x in d.get("unavailable") or []],
+    )
+
+
+def read_students_csv(fp: IO[str]) -> Iterator[Student]:
+    for line_no, row in enumerate(csv.DictReader(fp), start=2):
+        try:
+            row["available"] = _parse_slots(row.get("available") or "")
+            row["unavailable"] = _parse_slots(row.get("unavailable") or "")
+            student = _student_from_dict(row)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"CSV {line_no}번째 줄을 읽을 수 없습니다: {e}") from e
+        yield student
+
+
+def write_students_csv(fp: IO[str], students: Iterable[Student]) -> int:
+    writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    count = 0
+    for s in students:
+        row = _student_to_dict(s)
+        row["available"] = _format_slots(s.available)
+        row["unavailable"] = _format_slots(s.unavailable)
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def read_students_jsonl(fp: IO[str]) -> Iterator[Student]:
+    for line_no, line in enumerate(fp, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield _student_from_dict(json.loads(line))
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"JSON {line_no}번째 줄을 읽을 수 없습니다: {e}") from e
+
+
+def write_students_jsonl(fp: IO[str], students: Iterable[Student]) -> int:
+    count = 0
+    for s in students:
+        fp.write(json.dumps(_student_to_dict(s), ensure_ascii=False))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+_JSON_CHUNK = 1 << 16  # JSON 배열을 읽을 때 한 번에 읽는 글자 수
+_JSON_SPACE = " \t\r\n"
+_JSON_DELIMITERS = _JSON_SPACE + ",]"
+
+
+def _iter_json_array(fp: IO[str], chunk_size: int = _JSON_CHUNK) -> Iterator:
+    """최상위 JSON 배열의 원소를 하나씩 (파일을 chunk_size 글자씩 읽어 raw_decode로 해석)"""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def skip_space() -> bool:
+        """공백을 건너뛰고 다음 글자가 있으면 True (모자라면 더 읽음)"""
+        nonlocal buf, pos, eof
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_SPACE:
+                pos += 1
+            if pos < len(buf) or eof:
+                return pos < len(buf)
+            chunk = fp.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    if not skip_space() or buf[pos] != "[":
+        raise ValueError("JSON 파일을 읽을 수 없습니다: 배열([ … ])이 아닙니다")
+    pos += 1
+    first = True
+    while True:
+        if not skip_space():
+            raise ValueError("JSON 파일을 읽을 수 없습니다: 배열이 ']'로 닫히지 않았습니다")
+        if buf[pos] == "]":
+            pos += 1
+            if skip_space():
+                raise ValueError("JSON 파일을 읽을 수 없습니다: 배열 뒤에 다른 내용이 있습니다")
+            return
+        if not first:
+            if buf[pos] != ",":
+                raise ValueError(f"JSON 파일을 읽을 수 없습니다: 원소 사이에 ','가 없습니다: {buf[pos:pos + 20]!r}")
+            pos += 1
+            if not skip_space():
+                continue
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                item, end = None, -1
+            # 숫자는 조각 경계에서 잘려도 앞부분만으로 해석되므로("-2." → -2) 뒤에 구분자가 보일 때까지 더 읽음
+            if 0 <= end and (eof or end < len(buf) and buf[end] in _JSON_DELIMITERS):
+                break
+            if eof:
+                raise ValueError(f"JSON 파일을 읽을 수 없습니다: 원소를 해석할 수 없습니다: {buf[pos:pos + 40]!r}")
+            chunk = fp.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+        yield item
+        pos = end  # 버퍼는 더 읽을 때만 앞을 잘라냄 (원소마다 자르면 조각 길이에 비례해 복사)
+        first = False
+
+
+def read_students_json(fp: IO[str]) -> Iterator[Student]:
+    for i, d in enumerate(_iter_json_array(fp)):
+        try:
+            yield _student_from_dict(d)
+        except (ValueError, TypeError, KeyError) as e:
+            raise ValueError(f"JSON {i + 1}번째 학생을 읽을 수 없습니다: {e}") from e
+
+
+def write_students_json(fp: IO[str], students: Iterable[Student]) -> int:
+    count = 0
+    fp.write("[")
+    for s in students:
+        fp.write(",\n" if count else "\n")
+        fp.write(json.dumps(_student_to_dict(s), ensure_ascii=False))
+        count += 1
+    fp.write("\n]\n")
+    return count
+
+
+_READERS = {".csv": read_students_csv, ".jsonl": read_students_jsonl, ".json": read_students_json}
+_WRITERS = {".csv": write_students_csv, ".jsonl": write_students_jsonl, ".json": write_students_json}
+
+
+def _format_of(path: Path, table: dict):
+    fmt = table.get(path.suffix.lower())
+    if fmt is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path.suffix} (csv, json, jsonl)")
+    return fmt
+
+
+def read_students(path: str | Path) -> Iterator[Student]:
+    """파일 확장자(.csv/.json/.jsonl)에 맞춰 학생을 하나씩 읽음"""
+    path = Path(path)
+    reader = _format_of(path, _READERS)
+    with open(path, encoding="utf-8-sig", newline="") as fp:
+        yield from reader(fp)
+
+
+def import_students(path: str | Path) -> int:
+    """파일의 학생들을 한 트랜잭션으로 DB에 저장하고 저장한 수 반환"""
+    return db.bulk_upsert_students(read_students(path))
+
+
+def export_students(path: str | Path, students: Iterable[Student] | None = None) -> int:
+    """학생들(기본: DB 전체)을 파일로 내보내고 내보낸 수 반환"""
+    path = Path(path)
+    writer = _format_of(path, _WRITERS)
+    if students is None:
+        students = db.iter_students()
+    # CSV는 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    encoding = "utf-8-sig" if path.suffix.lower() == ".csv" else "utf-8"
+    with open(path, "w", encoding=encoding, newline="") as fp:
+        return writer(fp, students)
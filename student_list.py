@@ -0,0 +1,262 @@
+"""메인 창 학생 목록 모델 - 학생 한 명이 바뀌면 그 줄만 갱신, 이름·학년 검색/정렬은 프록시로"""
+from bisect import bisect_left
+from PyQt6.QtCore import Qt, QAbstractListModel, QAbstractProxyModel, QModelIndex
+from student import Student, GRADES
+
+ROLE_STUDENT = Qt.ItemDataRole.UserRole
+
+_GRADE_RANK = {g: i for i, g in enumerate(GRADES)}
+
+
+def _grade(s: Student) -> str:
+    return getattr(s, 'grade', '중1') or '중1'
+
+
+# 정렬 콤보 항목: (표시 이름, 정렬 키) - 키가 None이면 등록순(원본 순서)
+SORT_CHOICES = (
+    ("등록순", None),
+    ("이름순", lambda s: s.name.casefold()),
+    ("학년순", lambda s: _GRADE_RANK.get(_grade(s), len(GRADES))),
+)
+
+
+class StudentListModel(QAbstractListModel):
+    """MainWindow.students 목록을 그대로 보여주는 모델 (줄 번호 = 학생 인덱스)
+
+    목록은 이 모델의 append/insert/replace/pop으로만 바꿔 뷰에 한 줄씩 알린다.
+    row_of()는 Student.id → 줄 번호 사전으로 찾고, 중간 줄이 빠지거나 끼면 다음 조회 때 다시 만든다.
+    """
+
+    def __init__(self, students: list[Student], parent=None):
+        super().__init__(parent)
+        self.students = students
+        self._rows: dict[int, int] | None = None  # Student.id -> 줄 번호 (None이면 다시 만들어야 함)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.students)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.students):
+            return None
+        s = self.students[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            sessions = getattr(s, 'sessions_per_week', 1)
+            return f"{s.name} ({_grade(s)}) - {s.class_duration_minutes}분 수업, 주 {sessions}회"
+        if role == ROLE_STUDENT:
+            return s
+        return None
+
+    def reset(self, students: list[Student]):
+        """목록 전체 교체 (불러오기 때)"""
+        self.beginResetModel()
+        self.students = students
+        self._rows = None
+        self.endResetModel()
+
+    def row_of(self, s: Student) -> int | None:
+        """목록에서 s 객체의 줄 번호 (없으면 None)"""
+        if s.id is not None:
+            if self._rows is None:
+                self._rows = {x.id: i for i, x in enumerate(self.students) if x.id is not None}
+            row = self._rows.get(s.id)
+            if row is not None and self.students[row] is s:
+                return row
+        # 아직 저장 전(id 없음)이거나 나중에 id가 붙은 경우
+        row = next((i for i, x in enumerate(self.students) if x is s), None)
+        if row is not None and s.id is not None and self._rows is not None:
+            self._rows[s.id] = row
+        return row
+
+    def append(self, s: Student):
+        self.insert(len(self.students), s)
+
+    def insert(self, row: int, s: Student):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.students.insert(row, s)
+        if row == len(self.students) - 1 and self._rows is not None:
+            if s.id is not None:
+                self._rows[s.id] = row
+        else:
+            self._rows = None
+        self.endInsertRows()
+
+    def replace(self, row: int, s: Student):
+        """한 줄 교체 - 그 줄만 다시 그림"""
+        old = self.students[row]
+        self.students[row] = s
+        if self._rows is not None:
+            self._rows.pop(old.id, None)
+            if s.id is not None:
+                self._rows[s.id] = row
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def pop(self, row: int) -> Student:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        s = self.students.pop(row)
+        self._rows = None
+        self.endRemoveRows()
+        return s
+
+
+class StudentFilterProxy(QAbstractProxyModel):
+    """이름·학년 검색(대소문자 무시)과 정렬 - 보이는 줄 순서를 파이썬 목록으로 직접 관리
+
+    QSortFilterProxyModel은 정렬할 때 비교마다 data()를 불러 1만 명이면 1초 넘게 걸린다.
+    여기서는 학생 객체에서 바로 키를 뽑아 sorted() 한 번으로 순서를 정하고,
+    원본의 한 줄 추가·삭제·수정은 그 줄만 넣고 빼서 알린다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""  # casefold된 검색어
+        self._sort_key = None  # 학생 -> 정렬 키 (None이면 등록순)
+        self._rows: list[int] = []  # 보이는 순서대로 원본 줄 번호
+        self._keys: list[tuple] = []  # _rows와 나란한 (정렬 키, 원본 줄 번호) - 오름차순
+        self._pos: dict[int, int] | None = None  # 원본 줄 -> 보이는 줄 (None이면 다시 만듦)
+
+    def setSourceModel(self, model: StudentListModel):
+        super().setSourceModel(model)
+        model.modelReset.connect(self._rebuild)
+        model.rowsInserted.connect(self._on_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_rows_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        self._rebuild()
+
+    # --- QAbstractProxyModel ---
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < len(self._rows):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, child=None):
+        if child is None:  # QObject.parent()
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        pos = self._position(source_index.row())
+        return self.index(pos) if pos is not None else QModelIndex()
+
+    # --- 검색·정렬 ---
+    def set_filter(self, text: str):
+        self._text = text.strip().casefold()
+        self._rebuild()
+
+    def set_sort(self, key):
+        """key(student)로 정렬 (None이면 등록순)"""
+        self._sort_key = key
+        self._rebuild()
+
+    def source_row(self, index: QModelIndex) -> int:
+        """프록시 줄 → 학생 인덱스 (선택 없으면 -1)"""
+        if not index.isValid() or index.row() >= len(self._rows):
+            return -1
+        return self._rows[index.row()]
+
+    def _students(self) -> list[Student]:
+        return self.sourceModel().students
+
+    def _accepts(self, s: Student) -> bool:
+        return not self._text or self._text in f"{s.name} {_grade(s)}".casefold()
+
+    def _key(self, row: int) -> tuple:
+        key = self._sort_key
+        return (key(self._students()[row]) if key else 0, row)
+
+    def _position(self, row: int) -> int | None:
+        if self._pos is None:
+            self._pos = {r: i for i, r in enumerate(self._rows)}
+        return self._pos.get(row)
+
+    def _rebuild(self):
+        self.beginResetModel()
+        students = self._students()
+        key = self._sort_key
+        self._keys = sorted(
+            (key(s) if key else 0, r) for r, s in enumerate(students) if self._accepts(s)
+        )
+        self._rows = [r for _, r in self._keys]
+        self._pos = None
+        self.endResetModel()
+
+    def _shift(self, first: int, delta: int):
+        """원본 줄 first 이상을 delta만큼 당기거나 밈 (보이는 순서는 그대로)"""
+        self._rows = [r + delta if r >= first else r for r in self._rows]
+        self._keys = [(k, r) for (k, _), r in zip(self._keys, self._rows)]
+        self._pos = None
+
+    def _insert(self, row: int):
+        key = self._key(row)
+        pos = bisect_left(self._keys, key)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._keys.insert(pos, key)
+        self._rows.insert(pos, row)
+        self._pos = None
+        self.endInsertRows()
+
+    def _remove(self, pos: int):
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        del self._keys[pos]
+        del self._rows[pos]
+        self._pos = None
+        self.endRemoveRows()
+
+    def _on_rows_inserted(self, parent, first, last):
+        self._shift(first, last - first + 1)
+        students = self._students()
+        for r in range(first, last + 1):
+            if self._accepts(students[r]):
+                self._insert(r)
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        for r in range(last, first - 1, -1):
+            pos = self._position(r)
+            if pos is not None:
+                self._remove(pos)
+
+    def _on_rows_removed(self, parent, first, last):
+        self._shift(last + 1, -(last - first + 1))
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        students = self._students()
+        for r in range(top_left.row(), bottom_right.row() + 1):
+            pos = self._position(r)
+            accepted = self._accepts(students[r])
+            if pos is None:
+                if accepted:
+                    self._insert(r)
+                continue
+            if not accepted:
+                self._remove(pos)
+                continue
+            key = self._key(r)
+            dest = bisect_left(self._keys, key)
+            if dest in (pos, pos + 1):  # 순서 그대로 - 그 줄만 다시 그림
+                self._keys[pos] = key
+                index = self.index(pos)
+                self.dataChanged.emit(index, index)
+                continue
+            # 정렬 위치가 바뀜 - 선택이 유지되도록 옮김
+            self.beginMoveRows(QModelIndex(), pos, pos, QModelIndex(), dest)
+            del self._keys[pos]
+            del self._rows[pos]
+            new_pos = dest - 1 if dest > pos else dest
+            self._keys.insert(new_pos, key)
+            self._rows.insert(new_pos, r)
+            self._pos = None
+            self.endMoveRows()
@@ -0,0 +1,5 @@
+"""테스트 공용 - 저장소 루트의 모듈을 바로 불러오도록 경로 추가"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
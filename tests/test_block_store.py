@@ -0,0 +1,84 @@
+import pickle
+import random
+
+import pytest
+
+import block_store
+from block_store import BlockStore
+from schedule_generator import ScheduleBlock
+
+
+def _blocks(n=500, seed=1):
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(n):
+        placed = rng.random() < 0.7
+        blocks.append(ScheduleBlock(
+            rng.randrange(50), rng.randrange(7) if placed else -1, rng.randrange(8 * 60, 22 * 60) if placed else -1,
+            rng.choice((30, 60, 90)), id=i + 1 if rng.random() < 0.8 else None, resource_id=rng.randrange(3),
+        ))
+    return blocks
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "array":
+        monkeypatch.setattr(block_store, "np", None)
+    elif block_store.np is None:
+        pytest.skip("NumPy 없음")
+
+
+def test_round_trip():
+    blocks = _blocks()
+    store = BlockStore.from_blocks(blocks)
+    assert len(store) == len(blocks)
+    assert store.to_blocks() == blocks
+    assert [v.to_block() for v in store] == blocks
+    assert pickle.loads(pickle.dumps(store)).to_blocks() == blocks
+    appended = BlockStore()
+    for b in blocks:
+        appended.append(b)
+    assert appended.to_blocks() == blocks
+
+
+def test_filters_match_list_scan(backend):
+    blocks = _blocks()
+    store = BlockStore.from_blocks(blocks)
+    assert store.unassigned() == [i for i, b in enumerate(blocks) if b.day_of_week < 0]
+    assert store.placed() == [i for i, b in enumerate(blocks) if b.day_of_week >= 0]
+    for day in range(7):
+        assert store.on_day(day) == [i for i, b in enumerate(blocks) if b.day_of_week == day]
+    for r in range(3):
+        assert store.on_resource(r) == [i for i, b in enumerate(blocks) if b.resource_id == r and b.day_of_week >= 0]
+    for si in (0, 7, 49, 50):
+        assert store.of_student(si) == [i for i, b in enumerate(blocks) if b.student_index == si]
+    assert BlockStore().unassigned() == [] and BlockStore().placed() == []
+    assert BlockStore().on_day(0) == BlockStore().on_resource(0) == BlockStore().of_student(0) == []
+
+
+def test_index_of():
+    blocks = _blocks()
+    store = BlockStore.from_blocks(blocks)
+    for i, b in enumerate(blocks):
+        if b.id is not None:
+            assert store.index_of(b.id) == i
+    assert store.index_of(10 ** 9) is None
+    store[0].id = 10 ** 9
+    assert store.index_of(10 ** 9) == 0
+    store.append(ScheduleBlock(1, -1, -1, 60, id=10 ** 9 + 1))
+    assert store.index_of(10 ** 9 + 1) == len(blocks)
+    assert pickle.loads(pickle.dumps(store)).index_of(10 ** 9) == 0
+
+
+def test_view_writes_through():
+    blocks = _blocks(20)
+    store = BlockStore.from_blocks(blocks)
+    view = store[3]
+    view.day_of_week, view.start_minutes, view.resource_id = 2, 600, 1
+    view.id = None
+    assert store.to_blocks()[3] == ScheduleBlock(blocks[3].student_index, 2, 600, blocks[3].duration_minutes,
+                                                 id=None, resource_id=1)
+    assert view == store.to_blocks()[3]
+    assert 3 in store.placed()
+    with pytest.raises(IndexError):
+        store[len(store)]
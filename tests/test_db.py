@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+
+import pytest
+
+import db
+from schedule_generator import ScheduleBlock
+from student import Student, AvailableSlot, UnavailableSlot
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "timetable.db"
+    db.set_db_path(path)
+    yield path
+    db.set_db_path(None)
+
+
+def _create_v0(path):
+    """마이그레이션 도입 전 DB (user_version 0, grade·시간표·자원 없음)"""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, age INTEGER NOT NULL DEFAULT 0,
+            phone TEXT DEFAULT '', address TEXT DEFAULT '',
+            class_duration_minutes INTEGER NOT NULL DEFAULT 60, sessions_per_week INTEGER NOT NULL DEFAULT 1);
+        CREATE TABLE unavailable_slots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER NOT NULL, day_of_week INTEGER NOT NULL,
+            start_hour INTEGER NOT NULL, start_min INTEGER NOT NULL, end_hour INTEGER NOT NULL, end_min INTEGER NOT NULL);
+        CREATE TABLE available_slots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER NOT NULL, day_of_week INTEGER NOT NULL,
+            start_hour INTEGER NOT NULL, start_min INTEGER NOT NULL, end_hour INTEGER NOT NULL, end_min INTEGER NOT NULL);
+        INSERT INTO students (name, age, class_duration_minutes, sessions_per_week) VALUES ('김민수', 15, 90, 2);
+        INSERT INTO available_slots (student_id, day_of_week, start_hour, start_min, end_hour, end_min)
+            VALUES (1, 7, 16, 0, 21, 0);
+    """)
+    conn.commit()
+    conn.close()
+
+
+def test_migrate_from_v0(db_path):
+    _create_v0(db_path)
+    students = db.load_all_students()
+    assert [(s.name, s.class_duration_minutes, s.sessions_per_week) for s in students] == [("김민수", 90, 2)]
+    assert students[0].available == [AvailableSlot(7, 16, 0, 21, 0)]
+    assert db.get_connection().execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+
+
+def test_migrate_from_v0_adds_default_resource(db_path):
+    _create_v0(db_path)
+    students = db.load_all_students()
+    assert db.load_resources() == ["기본"]
+    db.save_schedule([ScheduleBlock(0, 2, 16 * 60, 90, resource_id=0), ScheduleBlock(0, -1, -1, 90)], students)
+    assert [(b.day_of_week, b.start_minutes, b.resource_id) for b in db.load_schedule(students)] == [
+        (2, 16 * 60, 0), (-1, -1, 0)]
+
+
+def test_migrate_is_noop_when_current(db_path):
+    db.insert_student(Student(name="a"))
+    db.close_connection()
+    assert [s.name for s in db.load_all_students()] == ["a"]
+    assert db.get_connection().execute("PRAGMA user_version").fetchone()[0] == db.SCHEMA_VERSION
+
+
+def test_bulk_upsert_inserts_then_replaces(db_path):
+    students = [Student(name=f"s{i}", available=[AvailableSlot(1, 9 + i, 0, 10 + i, 0)]) for i in range(5)]
+    assert db.bulk_upsert_students(students, chunk_size=2) == 5
+    assert [s.id for s in db.load_all_students()] == [s.id for s in students]
+    students[0].name = "바뀜"
+    students[0].available = [AvailableSlot(2, 13, 0, 15, 0)]
+    db.bulk_upsert_students(students[:1])
+    loaded = db.load_all_students()
+    assert (loaded[0].name, loaded[0].available) == ("바뀜", [AvailableSlot(2, 13, 0, 15, 0)])
+    assert len(loaded) == 5
+
+
+
+def test_bulk_upsert_rollback_leaves_ids_unset(db_path):
+    students = [Student(name=f"s{i}") for i in range(4)]
+
+    def roster():
+        yield from students
+        raise ValueError("가져오기 실패")
+
+    with pytest.raises(ValueError):
+        db.bulk_upsert_students(roster(), chunk_size=2)
+    assert [s.id for s in students] == [None] * 4
+    assert db.load_all_students() == []
+    assert db.bulk_upsert_students(students) == 4
+    assert [s.id for s in db.load_all_students()] == [s.id for s in students]
+
+def test_writer_coalesces_same_key(db_path):
+    s = Student(name="원래")
+    db.insert_student(s)
+    results = []
+    with db._writer._cond:  # 쓰기 스레드가 가져가기 전에 둘 다 넣음
+        for name in ("첫째", "둘째"):
+            updated = Student(id=s.id, name=name)
+            db.update_student_async(updated, callback=results.append)
+    assert db.flush_writes(5)
+    assert results == [None, None]
+    assert [x.name for x in db.load_all_students()] == ["둘째"]
+
+
+def test_writer_rolls_back_failed_batch(db_path):
+    results = []
+    event = threading.Event()
+
+    def fail(conn):
+        raise RuntimeError("disk full")
+
+    with db._writer._cond:
+        db.insert_student_async(Student(name="a"), callback=results.append)
+        db.submit_write(object(), fail, callback=lambda e: (results.append(e), event.set()))
+    assert db.flush_writes(5) and event.is_set()
+    assert len(results) == 2 and all(isinstance(e, RuntimeError) for e in results)
+    assert db.load_all_students() == []
+
+
+def test_bulk_upsert_normalizes_slots(db_path):
+    s = Student(name="a", available=[AvailableSlot(1, 9, 0, 11, 0), AvailableSlot(1, 10, 0, 12, 0)],
+                unavailable=[UnavailableSlot(1, 9, 0, 9, 30)])
+    db.bulk_upsert_students([s])
+    loaded = db.load_all_students()[0]
+    assert (loaded.available, loaded.unavailable) == ([AvailableSlot(1, 9, 30, 12, 0)], [])
+
+
+def test_save_schedule_async(db_path):
+    saved, pending = Student(name="a"), Student(name="b")
+    db.insert_student(saved)
+    blocks = [ScheduleBlock(0, 1, 600, 60), ScheduleBlock(1, -1, -1, 60), ScheduleBlock(5, 2, 600, 60)]
+    results = []
+    with db._writer._cond:
+        db.insert_student_async(pending)
+        first = db.save_schedule_async(blocks, [saved], callback=results.append)
+        ids = db.save_schedule_async(blocks, [saved, pending], callback=results.append)
+    assert db.flush_writes(5)
+    assert results == [None, None] and first == []  # 앞 예약은 뒤 예약으로 대체
+    assert ids[2] is None and all(b.id is None for b in blocks)
+    loaded = db.load_schedule(db.load_all_students())
+    assert [(b.id, b.student_index, b.day_of_week) for b in loaded] == [(ids[0], 0, 1), (ids[1], 1, -1)]
@@ -0,0 +1,157 @@
+import random
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+import availability
+import schedule_generator
+from benchmarks.roster import make_roster
+from schedule_generator import ScheduleGenerator, OccupancyIndex
+from student import UnavailableSlot, minutes_mask
+from time_grid import TimeGrid
+
+
+def _assert_valid(blocks, students):
+    """배정 블록이 학생 가능 시간 안에 있고, 같은 학생·같은 자원끼리 겹치지 않음"""
+    by_resource, by_student = {}, {}
+    for b in blocks:
+        if b.day_of_week < 0:
+            continue
+        assert students[b.student_index].can_place_block(b.day_of_week, b.start_minutes, b.duration_minutes)
+        span = minutes_mask(b.start_minutes, b.start_minutes + b.duration_minutes)
+        for key, seen in (((b.resource_id, b.day_of_week), by_resource), ((b.student_index, b.day_of_week), by_student)):
+            assert not seen.get(key, 0) & span, b
+            seen[key] = seen.get(key, 0) | span
+
+
+def _positions(blocks):
+    return [(b.student_index, b.day_of_week, b.start_minutes, b.resource_id) for b in blocks]
+
+
+@pytest.mark.parametrize("resources", [1, 2, 3])
+def test_place_is_valid(resources):
+    students = make_roster(120, 5)
+    gen = ScheduleGenerator(students, resources=resources)
+    blocks = gen.generate()
+    unplaced = gen.place(blocks)
+    _assert_valid(blocks, students)
+    assert {id(b) for b in unplaced} == {id(b) for b in blocks if b.day_of_week < 0}
+    assert len(unplaced) < len(blocks)
+    assert {b.resource_id for b in blocks if b.day_of_week >= 0} <= set(range(resources))
+
+
+def test_more_resources_place_more():
+    students = make_roster(300, 2)
+    placed = []
+    for resources in (1, 2):
+        gen = ScheduleGenerator(students, resources=resources)
+        blocks = gen.generate()
+        gen.place(blocks)
+        placed.append(sum(b.day_of_week >= 0 for b in blocks))
+    assert placed[1] > placed[0]
+
+
+def test_place_keeps_fixed_blocks():
+    students = make_roster(60, 8)
+    gen = ScheduleGenerator(students)
+    blocks = gen.generate(auto_place=True)
+    fixed = [(i, b.day_of_week, b.start_minutes) for i, b in enumerate(blocks) if b.day_of_week >= 0][::2]
+    for i, b in enumerate(blocks):
+        if (i, b.day_of_week, b.start_minutes) not in fixed:
+            b.day_of_week = b.start_minutes = -1
+    gen.place(blocks)
+    assert all((blocks[i].day_of_week, blocks[i].start_minutes) == (d, t) for i, d, t in fixed)
+    _assert_valid(blocks, students)
+
+
+def test_repair_moves_only_changed_student():
+    students = make_roster(40, 11)
+    gen = ScheduleGenerator(students)
+    blocks = gen.generate(auto_place=True)
+    b = next(b for b in blocks if b.day_of_week >= 0)
+    si, day = b.student_index, b.day_of_week
+    students[si] = replace(students[si], unavailable=list(students[si].unavailable) + [UnavailableSlot(day, 0, 0, 24, 0)],
+                           available=list(students[si].available))
+    before = _positions(blocks)
+    gen.repair(blocks, {si})
+    _assert_valid(blocks, students)
+    assert all(b.day_of_week != day for b in blocks if b.student_index == si)
+    moved = {old[0] for old, new in zip(before, _positions(blocks)) if old != new}
+    assert moved == {si}
+
+
+def test_repair_matches_block_count_to_sessions():
+    students = make_roster(30, 12)
+    gen = ScheduleGenerator(students)
+    blocks = gen.generate(auto_place=True)
+    students[0] = replace(students[0], sessions_per_week=students[0].sessions_per_week + 1,
+                          available=list(students[0].available), unavailable=list(students[0].unavailable))
+    gen.repair(blocks, {0})
+    assert sum(b.student_index == 0 for b in blocks) == students[0].sessions_per_week
+    _assert_valid(blocks, students)
+
+
+def test_search_is_deterministic_across_worker_counts():
+    students = make_roster(80, 4)
+    gen = ScheduleGenerator(students, resources=2)
+    blocks = gen.generate()
+    results = [_positions(gen.search(blocks, restarts=4, workers=w, time_budget=60.0, seed=9)) for w in (1, 2)]
+    assert results[0] == results[1]
+    assert all(b.day_of_week < 0 for b in blocks)  # 입력은 그대로
+    best = gen.search(blocks, restarts=4, workers=1, time_budget=60.0, seed=9)
+    _assert_valid(best, students)
+    placed = gen.generate()
+    gen.place(placed)
+    assert sum(b.day_of_week >= 0 for b in best) >= sum(b.day_of_week >= 0 for b in placed)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_search_cancel_returns_none(workers):
+    students = make_roster(200, 4)
+    gen = ScheduleGenerator(students)
+    blocks = gen.generate()
+    cancel = threading.Event()
+    cancel.set()
+    assert gen.search(blocks, restarts=4, workers=workers, cancel=cancel) is None
+    cancel.clear()
+    threading.Timer(0.2, cancel.set).start()
+    started = time.perf_counter()
+    assert gen.search(blocks, restarts=64, workers=workers, time_budget=60.0, cancel=cancel) is None
+    assert time.perf_counter() - started < 10
+
+
+@pytest.mark.skipif(not availability.HAVE_NUMPY, reason="NumPy 없음")
+@pytest.mark.parametrize("slot", [10, 30])
+def test_numpy_domains_match_python(monkeypatch, slot):
+    students = make_roster(150, 6)
+    grid = TimeGrid(slot_minutes=slot)
+    results = []
+    for min_groups in (10 ** 9, 0):
+        monkeypatch.setattr(schedule_generator, "VECTOR_MIN_GROUPS", min_groups)
+        gen = ScheduleGenerator(students, grid)
+        blocks = gen.generate()
+        gen.place(blocks)
+        results.append(_positions(blocks))
+    assert results[0] == results[1]
+
+
+def test_occupancy_index_matches_rebuild():
+    rng = random.Random(3)
+    occ, where = OccupancyIndex(), {}
+    for _ in range(3000):
+        bi = rng.randrange(80)
+        if rng.random() < 0.6:
+            day, start, duration = rng.randrange(7), rng.randrange(480, 1300), rng.choice((30, 60, 90, 180))
+            occ.place(bi, day, start, duration)
+            where[bi] = (day, start, start + duration)
+        else:
+            occ.unplace(bi)
+            where.pop(bi, None)
+        day, exclude = rng.randrange(7), rng.randrange(80)
+        expected = 0
+        for other, (d, s, e) in where.items():
+            if d == day and other != exclude:
+                expected |= minutes_mask(s, e)
+        assert occ.day_mask(day, exclude) == expected
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from benchmarks.roster import make_roster
+from student import (
+    Student, AvailableSlot, UnavailableSlot, expand_day, normalize_slots, effective_masks, minutes_mask, slots_from_masks
+)
+
+
+def _random_student(rng: random.Random) -> Student:
+    def slot(cls):
+        day = rng.choice(range(9))
+        start = rng.randrange(0, 23 * 60, 30)
+        end = min(start + rng.choice((30, 60, 120, 300)), 24 * 60)
+        return cls(day, start // 60, start % 60, end // 60, end % 60)
+    return Student(
+        available=[slot(AvailableSlot) for _ in range(rng.randrange(4))],
+        unavailable=[slot(UnavailableSlot) for _ in range(rng.randrange(4))],
+    )
+
+
+def _placements(s: Student) -> list[int]:
+    """요일·길이·칸 단위별 시작 가능 비트마스크 - 가능 시간의 실제 의미"""
+    return [s.feasible_starts(d, duration, step) for d in range(7) for duration in (30, 60, 150) for step in (10, 30)]
+
+
+def _slow_available(s: Student, day: int, minutes: int) -> bool:
+    """비트맵 도입 전 is_available - 슬롯을 하나씩 훑음"""
+    def hit(slots):
+        return any(day in expand_day(x.day_of_week)
+                   and x.start_hour * 60 + x.start_min <= minutes < x.end_hour * 60 + x.end_min for x in slots)
+    if hit(s.unavailable):
+        return False
+    return not s.available or hit(s.available)
+
+
+def test_can_place_block_matches_slot_scan():
+    rng = random.Random(1)
+    for _ in range(200):
+        s = _random_student(rng)
+        for day in range(7):
+            for start in range(0, 24 * 60, 30):
+                for duration in (30, 60, 90):
+                    expected = all(_slow_available(s, day, start + offset) for offset in range(0, duration + 1, 30))
+                    assert s.can_place_block(day, start, duration) == expected, (s, day, start, duration)
+
+
+def test_slots_are_frozen_and_list_edits_invalidate():
+    s = Student(available=[AvailableSlot(1, 9, 0, 12, 0)])
+    assert s.can_place_block(1, 10 * 60, 60)
+    with pytest.raises(AttributeError):
+        s.available[0].end_hour = 10
+    s.available[0] = AvailableSlot(1, 9, 0, 10, 0)
+    assert not s.can_place_block(1, 10 * 60, 60)
+
+
+def _students():
+    rng = random.Random(7)
+    return make_roster(100, 3) + [_random_student(rng) for _ in range(300)]
+
+
+def test_normalize_preserves_availability():
+    for s in _students():
+        available, unavailable = normalize_slots(s.available, s.unavailable)
+        assert _placements(Student(available=available, unavailable=unavailable)) == _placements(s)
+
+
+def test_normalize_is_idempotent():
+    for s in _students():
+        once = normalize_slots(s.available, s.unavailable)
+        assert normalize_slots(*once) == once
+
+
+def test_normalize_keeps_never_available():
+    available = [AvailableSlot(1, 9, 0, 10, 0)]
+    unavailable = [UnavailableSlot(1, 8, 0, 12, 0)]
+    assert normalize_slots(available, unavailable) == (
+        [], [UnavailableSlot(7, 0, 0, 24, 0), UnavailableSlot(8, 0, 0, 24, 0)])
+    assert not any(_placements(Student(available=[], unavailable=normalize_slots(available, unavailable)[1])))
+
+
+def test_unavailable_from_effective_masks():
+    """불가만 있는 학생: 실제 가능 비트마스크의 여집합 → 불가 목록이 같은 뜻 (칠하기 캔버스 반영)"""
+    day = minutes_mask(0, 24 * 60)
+    checked = 0
+    for s in _students():
+        if s.available:
+            continue
+        masks = effective_masks(s.available, s.unavailable)
+        assert masks == [s.day_mask(d) for d in range(7)]
+        unavailable = slots_from_masks([day & ~m for m in masks], UnavailableSlot)
+        assert _placements(Student(available=[], unavailable=unavailable)) == _placements(s)
+        checked += 1
+    assert checked
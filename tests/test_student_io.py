@@ -0,0 +1,34 @@
+import io
+import json
+
+import pytest
+
+import student_io
+from benchmarks.roster import make_roster
+
+
+def _fields(students):
+    return [student_io._student_to_dict(s) for s in students]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".json", ".jsonl"])
+def test_export_read_round_trip(tmp_path, suffix):
+    students = make_roster(50, 2)
+    for i, s in enumerate(students):
+        s.id = i + 1 if i % 3 else None
+    path = tmp_path / f"students{suffix}"
+    assert student_io.export_students(path, students) == len(students)
+    assert _fields(student_io.read_students(path)) == _fields(students)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_json_array_matches_json_loads(chunk_size):
+    text = json.dumps([1, -2.5e3, "가,]", {"a": [1, {"b": None}]}, [], True, 12345678901234567890], indent=1)
+    assert list(student_io._iter_json_array(io.StringIO(text), chunk_size)) == json.loads(text)
+    assert list(student_io._iter_json_array(io.StringIO(" [ ] "), chunk_size)) == []
+
+
+@pytest.mark.parametrize("text", ["", "{}", "[1, 2", "[1 2]", "[1,]", "[1] 2", "[1, {\"a\": ]"])
+def test_json_array_rejects_malformed(text):
+    with pytest.raises(ValueError, match="JSON 파일을 읽을 수 없습니다"):
+        list(student_io._iter_json_array(io.StringIO(text), 3))
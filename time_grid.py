@@ -0,0 +1,74 @@
+"""시간표 시간 격자 설정 - 칸 단위(5/10/15/30분), 시작·끝 시, 쓰는 요일
+
+자동 배치(시작 후보), 학생 가능 시간 검사(검사 간격), 시간표 그리드(행·열)가 같은 설정을 쓴다.
+칸별 값은 분 단위 비트마스크에서 한 번에 뽑아(sample) 칸 수만큼 파이썬 루프를 돌지 않는다.
+"""
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+
+SLOT_CHOICES = (5, 10, 15, 30)
+# 기본 요일 순서 (월~토, 일)
+ALL_DAYS = (1, 2, 3, 4, 5, 6, 0)
+
+
+@dataclass(frozen=True)
+class TimeGrid:
+    slot_minutes: int = 30
+    start_hour: int = 8
+    end_hour: int = 22
+    days: tuple[int, ...] = ALL_DAYS  # 표시·배치할 요일 (0=일~6=토, 이 순서대로 열)
+
+    def __post_init__(self):
+        if self.slot_minutes not in SLOT_CHOICES:
+            raise ValueError(f"칸 단위는 {SLOT_CHOICES} 중 하나여야 합니다: {self.slot_minutes}")
+        if not 0 <= self.start_hour < self.end_hour <= 24:
+            raise ValueError(f"시간 범위가 올바르지 않습니다: {self.start_hour}~{self.end_hour}시")
+        if not self.days or len(set(self.days)) != len(self.days) or any(not 0 <= d <= 6 for d in self.days):
+            raise ValueError(f"요일이 올바르지 않습니다: {self.days}")
+
+    @property
+    def start_minutes(self) -> int:
+        return self.start_hour * 60
+
+    @property
+    def end_minutes(self) -> int:
+        return self.end_hour * 60
+
+    @property
+    def rows(self) -> int:
+        return (self.end_minutes - self.start_minutes) // self.slot_minutes
+
+    def row_start(self, row: int) -> int:
+        """행의 시작 시각(분)"""
+        return self.start_minutes + row * self.slot_minutes
+
+    def row_of(self, minutes: int) -> int:
+        """시각(분)이 들어가는 행 (범위 밖이면 음수 또는 rows 이상)"""
+        return (minutes - self.start_minutes) // self.slot_minutes
+
+    @cached_property
+    def slot_starts(self) -> array:
+        """행별 시작 시각(분) 배열"""
+        return array("H", range(self.start_minutes, self.end_minutes, self.slot_minutes))
+
+    @cached_property
+    def slot_mask(self) -> int:
+        """칸 시작 시각들의 비트마스크"""
+        mask = 0
+        for t in self.slot_starts:
+            mask |= 1 << t
+        return mask
+
+    def start_mask(self, duration: int) -> int:
+        """끝이 end_hour를 넘지 않는 칸 시작 시각들의 비트마스크 (자동 배치 후보)"""
+        last = self.end_minutes - duration
+        if last < self.start_minutes:
+            return 0
+        return self.slot_mask & ((1 << (last + 1)) - 1)
+
+    def sample(self, mask: int) -> str:
+        """분 단위 비트마스크에서 행별 칸 시작 비트만 뽑아 '0'/'1' 문자열로 (길이 = rows)"""
+        width = self.end_minutes - self.start_minutes
+        bits = format((mask >> self.start_minutes) & ((1 << width) - 1), f"0{width}b")
+        return bits[::-1][::self.slot_minutes]
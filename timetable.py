@@ -0,0 +1,201 @@
+"""화면 없이 시간표 자동 배치 (PyQt를 불러오지 않음)
+
+    python -m timetable                       # timetable.db 학생으로 배치, JSON을 표준 출력으로
+    python -m timetable -i students.csv -o schedule.ics
+    python -m timetable --search --restarts 32 --save -o schedule.csv
+    python -m timetable --resources 3         # 강사·교실 3곳에 나눠 배치
+
+학생은 DB(기본) 또는 CSV/JSON/JSONL 파일(-i)에서 읽는다. 출력 형식은 --format 또는
+출력 파일 확장자(.json/.csv/.ics)로 정한다. 배치하지 못한 블록 수는 표준 오류로 알린다.
+"""
+import argparse
+import csv
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, List
+
+import db
+import perf
+import student_io
+from schedule_generator import ScheduleGenerator, ScheduleBlock
+from student import Student
+from time_grid import TimeGrid, SLOT_CHOICES, ALL_DAYS
+
+DAY_NAMES = ("일", "월", "화", "수", "목", "금", "토")
+FORMATS = ("json", "csv", "ics")
+CSV_FIELDS = ["student_id", "name", "day_of_week", "day", "start", "end", "duration_minutes", "resource_id"]
+
+
+def _hhmm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def schedule_rows(blocks: List[ScheduleBlock], students: List[Student]) -> list[dict]:
+    """블록을 요일·시작 순 행으로 (미배정은 요일 -1, 시각 빈 칸으로 맨 뒤)"""
+    rows = []
+    for b in sorted(blocks, key=lambda b: (b.day_of_week < 0, ALL_DAYS.index(b.day_of_week) if b.day_of_week >= 0 else 0,
+                                         b.start_minutes, b.student_index)):
+        s = students[b.student_index] if 0 <= b.student_index < len(students) else None
+        placed = b.day_of_week >= 0
+        rows.append({
+            "student_id": s.id if s else None,
+            "name": s.name if s else "",
+            "day_of_week": b.day_of_week if placed else -1,
+            "day": DAY_NAMES[b.day_of_week] if placed else "",
+            "start": _hhmm(b.start_minutes) if placed else "",
+            "end": _hhmm(b.start_minutes + b.duration_minutes) if placed else "",
+            "duration_minutes": b.duration_minutes,
+            "resource_id": b.resource_id if placed else -1,
+        })
+    return rows
+
+
+def write_json(fp: IO[str], rows: list[dict], **_):
+    json.dump(rows, fp, ensure_ascii=False, indent=1)
+    fp.write("\n")
+
+
+def write_csv(fp: IO[str], rows: list[dict], **_):
+    writer = csv.DictWriter(fp, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def _ics_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def write_ics(fp: IO[str], rows: list[dict], week_of: date | None = None, students: List[Student] = ()):
+    """배정된 블록을 매주 반복 일정(VEVENT + RRULE:FREQ=WEEKLY)으로 - week_of가 속한 주(월요일 시작)부터"""
+    week_of = week_of or date.today()
+    monday = week_of - timedelta(days=week_of.weekday())
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    address = {s.id: s.address for s in students if s.id is not None}
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//Timetable//Timetable//KO", "CALSCALE:GREGORIAN"]
+    for n, r in enumerate(rows):
+        if r["day_of_week"] < 0:
+            continue
+        day = monday + timedelta(days=(r["day_of_week"] - 1) % 7)  # 월=0 … 일=6
+        hour, minute = map(int, r["start"].split(":"))
+        start = datetime(day.year, day.month, day.day, hour, minute)
+        end = start + timedelta(minutes=r["duration_minutes"])
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:{n}-{r['student_id'] or 0}@timetable",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start:%Y%m%dT%H%M%S}",
+            f"DTEND:{end:%Y%m%dT%H%M%S}",
+            "RRULE:FREQ=WEEKLY",
+            f"SUMMARY:{_ics_text(r['name'])}",
+        ]
+        if address.get(r["student_id"]):
+            lines.append(f"LOCATION:{_ics_text(address[r['student_id']])}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    fp.write("\r\n".join(lines) + "\r\n")
+
+
+_WRITERS = {"json": write_json, "csv": write_csv, "ics": write_ics}
+
+
+def _parse_days(text: str) -> tuple[int, ...]:
+    try:
+        return tuple(int(d) for d in text.split(",") if d.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"요일은 0=일~6=토 숫자를 쉼표로: {text}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m timetable", description="학생 시간표 자동 배치 (화면 없이)")
+    src = p.add_argument_group("입력")
+    src.add_argument("-i", "--input", type=Path, help="학생 파일 (.csv/.json/.jsonl). 없으면 DB에서 읽음")
+    src.add_argument("--db", type=Path, help="DB 파일 경로 (기본: 프로그램 폴더의 timetable.db)")
+    src.add_argument("--keep", action="store_true", help="DB에 저장된 시간표를 불러와 배정된 블록은 그대로 두고 미배정 블록만 배치")
+    out = p.add_argument_group("출력")
+    out.add_argument("-o", "--output", type=Path, help="출력 파일 (없으면 표준 출력)")
+    out.add_argument("-f", "--format", choices=FORMATS, help="출력 형식 (기본: 출력 파일 확장자, 없으면 json)")
+    out.add_argument("--week-of", type=date.fromisoformat, help="ICS 반복 일정을 시작할 주의 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    out.add_argument("--save", action="store_true", help="결과 시간표를 DB에 저장 (DB 입력일 때만)")
+    grid = p.add_argument_group("시간 격자")
+    grid.add_argument("--slot", type=int, choices=SLOT_CHOICES, default=TimeGrid.slot_minutes, help="칸 단위(분)")
+    grid.add_argument("--start-hour", type=int, default=TimeGrid.start_hour)
+    grid.add_argument("--end-hour", type=int, default=TimeGrid.end_hour)
+    grid.add_argument("--days", type=_parse_days, default=ALL_DAYS, help="배치할 요일 (예: 1,2,3,4,5)")
+    grid.add_argument("--resources", type=int, help="동시에 수업할 강사·교실 수 (기본: DB 입력이면 DB의 자원 수, 아니면 1)")
+    search = p.add_argument_group("탐색")
+    search.add_argument("--search", action="store_true", help="순서를 바꿔 여러 번 시도해 가장 좋은 결과 선택")
+    search.add_argument("--restarts", type=int, default=16)
+    search.add_argument("--workers", type=int, help="프로세스 수 (기본: CPU 수)")
+    search.add_argument("--time-budget", type=float, default=2.0, help="시도 한 번의 되돌리기 시간 한도(초)")
+    search.add_argument("--seed", type=int, default=0)
+    prof = p.add_argument_group("계측")
+    prof.add_argument("--profile", action="store_true", help="주요 함수 호출 수·p50/p99를 표준 오류로 출력")
+    prof.add_argument("--profile-capture", choices=perf.CAPTURE_MODES, help="배치 한 번을 cProfile/tracemalloc으로 기록")
+    return p
+
+
+@perf.action("cli.schedule")
+def _schedule(gen: ScheduleGenerator, blocks: List[ScheduleBlock], args) -> List[ScheduleBlock]:
+    if args.search:
+        return gen.search(blocks, restarts=args.restarts, workers=args.workers,
+                          time_budget=args.time_budget, seed=args.seed)
+    gen.place(blocks)
+    return blocks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    fmt = args.format or (args.output.suffix.lower().lstrip(".") if args.output else "json")
+    if fmt not in _WRITERS:
+        parser.error(f"출력 형식을 알 수 없습니다: {fmt} ({', '.join(FORMATS)})")
+    if args.resources is not None and args.resources < 1:
+        parser.error("--resources는 1 이상이어야 합니다")
+    if args.input and (args.save or args.keep):
+        parser.error("--save/--keep은 DB에서 학생을 읽을 때만 쓸 수 있습니다")
+    try:
+        time_grid = TimeGrid(args.slot, args.start_hour, args.end_hour, args.days)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.db:
+        db.set_db_path(args.db)
+    if args.profile or args.profile_capture:
+        perf.enable()
+    if args.profile_capture:
+        perf.arm(args.profile_capture)
+
+    try:
+        if args.input:
+            students = list(student_io.read_students(args.input))
+        else:
+            students = db.load_all_students()
+    except (OSError, ValueError) as e:
+        print(f"학생을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 1
+
+    resources = args.resources or (1 if args.input else len(db.load_resources()))
+    gen = ScheduleGenerator(students, time_grid, resources)
+    blocks = db.load_schedule(students) if args.keep else []
+    if not blocks:
+        blocks = gen.generate()
+    blocks = _schedule(gen, blocks, args)
+    if args.save:
+        db.save_schedule(blocks, students)
+
+    rows = schedule_rows(blocks, students)
+    writer = _WRITERS[fmt]
+    if args.output:
+        encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+        with open(args.output, "w", encoding=encoding, newline="") as fp:
+            writer(fp, rows, week_of=args.week_of, students=students)
+    else:
+        writer(sys.stdout, rows, week_of=args.week_of, students=students)
+    if gen.unplaced:
+        print(f"배치하지 못한 블록 {len(gen.unplaced)}개 (전체 {len(blocks)}개)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
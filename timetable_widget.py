@@ -1,24 +1,32 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QListWidget, QListWidgetItem, QLabel, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QStyledItemDelegate, QStyle,
+    QListView, QLabel, QFrame
 )
-from PyQt6.QtCore import Qt, QMimeData, QPoint, QEvent
-from PyQt6.QtGui import QColor, QDrag
-from typing import List
-from student import Student
-from schedule_generator import ScheduleBlock
-
-# 월~토, 일 (일요일을 토요일 옆에)
-DAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
-# 열 인덱스(1~7) -> day_of_week (0=일, 1=월, ..., 6=토)
-COL_TO_DAY = (1, 2, 3, 4, 5, 6, 0)
-HOURS_START = 8
-HOURS_END = 22
-SLOT_HEIGHT = 40
+from PyQt6.QtCore import (
+    Qt, QMimeData, QPoint, QEvent, pyqtSignal, QAbstractTableModel, QAbstractListModel, QModelIndex
+)
+from PyQt6.QtGui import QColor, QDrag, QPen
+from bisect import bisect_left, insort
+from typing import List, Sequence
+from student import Student, DAY_MINUTES
+from schedule_generator import ScheduleBlock, OccupancyIndex, ResourceOccupancy
+from block_store import BlockStore
+from time_grid import TimeGrid
+import perf
+
+# day_of_week(0=일, 1=월, ..., 6=토) 순 요일 이름 - 열 순서는 TimeGrid.days
+DAY_NAMES = ("일", "월", "화", "수", "목", "금", "토")
+SLOT_HEIGHT = 40      # 30분 칸 높이 (칸 단위가 작으면 비례해서 줄임)
+MIN_SLOT_HEIGHT = 14
 
 # day_of_week < 0 이면 미배정
 UNASSIGNED_DAY = -1
 
+# 모델 데이터 역할
+ROLE_BLOCK = Qt.ItemDataRole.UserRole           # 칸에 걸친 블록 인덱스 (없으면 None)
+ROLE_HIGHLIGHT = Qt.ItemDataRole.UserRole + 1   # 드래그 하이라이트 "available"/"unavailable"/None
+ROLE_SPAN = Qt.ItemDataRole.UserRole + 2        # 블록 칸이면 (첫 칸인지, 마지막 칸인지)
+
 # 학년별 블록 색상 (초1~고3) - QColor 캐시로 반복 생성 방지
 GRADE_COLORS = {
     "초1": (255, 228, 196),   # 블랜치드 알몬드
@@ -35,9 +43,133 @@ GRADE_COLORS = {
     "고3": (240, 248, 255),   # 앨리스블루
 }
 _GRADE_QCOLORS = {g: QColor(*rgb) for g, rgb in GRADE_COLORS.items()}
+_DEFAULT_BLOCK_QCOLOR = QColor(173, 216, 230)
+# TimeGrid.sample 결과('0'/'1')를 하이라이트 문자로: 학생 있음(가능 여부) / 학생 없음(겹침 여부)
+_STUDENT_STATES = str.maketrans("01", "-+")
+_NO_STUDENT_STATES = str.maketrans("01", ".-")
+_HIGHLIGHT_QCOLORS = {
+    "available": QColor(200, 255, 200),    # 연두색 = 가능
+    "unavailable": QColor(255, 230, 230),  # 연한 빨강 = 불가/겹침
+}
+
+
+class BlockPoolModel(QAbstractListModel):
+    """미배정 블록 목록 모델 - 같은 학생·같은 길이 블록은 한 줄로 묶음 ("김민수 60분 ×3")
+
+    블록 하나가 배정/미배정될 때 그 줄만 추가·삭제·갱신하고,
+    줄이 아주 많으면 스크롤할 때 FETCH_BATCH개씩 보여준다.
+    """
+
+    FETCH_BATCH = 200
+
+    def __init__(self, timetable: "TimetableWidget"):
+        super().__init__(timetable)
+        self.tt = timetable
+        self._keys: list[tuple[int, int]] = []  # (학생 인덱스, 길이) 정렬 순서 = 줄 순서
+        self._members: dict[tuple[int, int], list[int]] = {}  # 키 -> 미배정 블록 인덱스(오름차순)
+        self._fetched = 0  # 뷰에 알린 줄 수
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._keys)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        n = min(self.FETCH_BATCH, len(self._keys) - self._fetched)
+        if n > 0:
+            self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + n - 1)
+            self._fetched += n
+            self.endInsertRows()
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+        key = self._keys[index.row()]
+        members = self._members[key]
+        if role == ROLE_BLOCK:
+            return members[0]
+        if role == Qt.ItemDataRole.DisplayRole:
+            si, duration = key
+            if 0 <= si < len(self.tt.students):
+                text = f"{self.tt.students[si].name} {duration}분"
+            else:
+                text = f"블록 #{members[0]} {duration}분"
+            return f"{text} ×{len(members)}" if len(members) > 1 else text
+        return None
+
+    def reset(self):
+        """블록 목록 전체에서 다시 만듦 (set_blocks 때)"""
+        self.beginResetModel()
+        self._members = {}
+        blocks = self.tt.blocks
+        for bi in blocks.unassigned():
+            b = blocks[bi]
+            self._members.setdefault((b.student_index, b.duration_minutes), []).append(bi)
+        self._keys = sorted(self._members)
+        self._fetched = min(self.FETCH_BATCH, len(self._keys))
+        self.endResetModel()
+
+    def add(self, block_idx: int):
+        """블록이 미배정이 됨 - 해당 줄만 추가/갱신"""
+        b = self.tt.blocks[block_idx]
+        key = (b.student_index, b.duration_minutes)
+        members = self._members.get(key)
+        if members is not None:
+            if block_idx not in members:
+                insort(members, block_idx)
+                self._row_changed(key)
+            return
+        self._members[key] = [block_idx]
+        row = bisect_left(self._keys, key)
+        if row < self._fetched or self._fetched == len(self._keys):
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._keys.insert(row, key)
+            self._fetched += 1
+            self.endInsertRows()
+        else:
+            self._keys.insert(row, key)
 
+    def remove(self, block_idx: int, key: tuple[int, int]):
+        """블록이 배정됨 - 해당 줄만 갱신/삭제 (key는 배정 전 (학생, 길이))"""
+        members = self._members.get(key)
+        if not members or block_idx not in members:
+            return
+        members.remove(block_idx)
+        if members:
+            self._row_changed(key)
+            return
+        row = bisect_left(self._keys, key)
+        if row < self._fetched:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._keys[row]
+            del self._members[key]
+            self._fetched -= 1
+            self.endRemoveRows()
+        else:
+            del self._keys[row]
+            del self._members[key]
+
+    def changed(self, block_idx: int):
+        """블록의 학생 정보가 바뀜 - 그 블록이 있는 줄만 다시 그림"""
+        b = self.tt.blocks[block_idx]
+        self._row_changed((b.student_index, b.duration_minutes))
 
-class BlockPoolListWidget(QListWidget):
+    def _row_changed(self, key: tuple[int, int]):
+        row = bisect_left(self._keys, key)
+        if row < self._fetched:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx)
+
+
+class BlockPoolListView(QListView):
     """미배정 블록 목록 - 커스텀 드래그/드롭 지원"""
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -66,19 +198,15 @@ class BlockPoolListWidget(QListWidget):
                 block_idx = int(parts[0])
                 tt = self.parent_pool.parent_timetable
                 if tt and 0 <= block_idx < len(tt.blocks):
-                    tt.blocks[block_idx].day_of_week = UNASSIGNED_DAY
-                    tt.blocks[block_idx].start_minutes = -1
-                    tt._rebuild_all()
+                    tt._unassign_block(block_idx)
             e.acceptProposedAction()
         else:
             super().dropEvent(e)
 
     def startDrag(self, supported_actions):
-        item = self.currentItem()
-        if not item:
-            return
-        block_idx = item.data(Qt.ItemDataRole.UserRole)
-        if block_idx is None or not isinstance(block_idx, int):
+        # 묶인 줄에서는 가장 앞 블록 하나를 끌어감
+        block_idx = self.currentIndex().data(ROLE_BLOCK)
+        if block_idx is None:
             return
         tt = self.parent_pool.parent_timetable if self.parent_pool else None
         if not tt or block_idx < 0 or block_idx >= len(tt.blocks):
@@ -98,34 +226,31 @@ class BlockPoolWidget(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_timetable = None
+        self.model: BlockPoolModel | None = None
         self.setAcceptDrops(True)
         self.setMinimumWidth(180)
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Sunken)
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("미배정 블록"))
-        self.list_widget = BlockPoolListWidget(self)
-        self.list_widget.set_parent_pool(self)
-        self.list_widget.setDragEnabled(True)
-        self.list_widget.setAcceptDrops(True)
-        self.list_widget.setDragDropMode(QListWidget.DragDropMode.DragDrop)
-        layout.addWidget(self.list_widget)
+        self.list_view = BlockPoolListView(self)
+        self.list_view.set_parent_pool(self)
+        self.list_view.setDragEnabled(True)
+        self.list_view.setAcceptDrops(True)
+        self.list_view.setDragDropMode(QListView.DragDropMode.DragDrop)
+        self.list_view.setUniformItemSizes(True)
+        layout.addWidget(self.list_view)
 
     def set_parent(self, p):
         self.parent_timetable = p
+        if p is not None and self.model is None:
+            self.model = BlockPoolModel(p)
+            self.list_view.setModel(self.model)
 
+    @perf.timed()
     def refresh(self):
-        if not self.parent_timetable:
-            return
-        self.list_widget.clear()
-        for bi, b in enumerate(self.parent_timetable.blocks):
-            if b.day_of_week < 0:
-                if b.student_index >= 0 and b.student_index < len(self.parent_timetable.students):
-                    s = self.parent_timetable.students[b.student_index]
-                    item = QListWidgetItem(f"{s.name} ({b.duration_minutes}분)")
-                else:
-                    item = QListWidgetItem(f"블록 #{bi} ({b.duration_minutes}분)")
-                item.setData(Qt.ItemDataRole.UserRole, bi)
-                self.list_widget.addItem(item)
+        """블록 목록 전체로 다시 만듦 - 블록 하나 이동은 model.add/remove로 처리"""
+        if self.model is not None:
+            self.model.reset()
 
     def dragEnterEvent(self, e):
         if e.mimeData().hasText() and e.mimeData().text().startswith("BLOCK:"):
@@ -144,13 +269,185 @@ class BlockPoolWidget(QFrame):
             return
         block_idx = int(parts[0])
         if self.parent_timetable and 0 <= block_idx < len(self.parent_timetable.blocks):
-            self.parent_timetable.blocks[block_idx].day_of_week = UNASSIGNED_DAY
-            self.parent_timetable.blocks[block_idx].start_minutes = -1
-            self.parent_timetable._rebuild_all()
+            self.parent_timetable._unassign_block(block_idx)
         e.acceptProposedAction()
 
 
-class TimetableGrid(QTableWidget):
+class TimetableModel(QAbstractTableModel):
+    """시간표 그리드 모델 - 칸(시간 칸×요일) 내용을 블록 점유 현황에서 바로 계산 (칸별 객체 없음)
+
+    행·열은 timetable.time_grid를 따른다. 하이라이트는 열마다 행 수 길이의 문자열
+    ('+' 가능, '-' 불가, '.' 없음)로 들고 있어 칸 단위가 작아도 칸별 객체가 생기지 않는다.
+    """
+
+    _HIGHLIGHT_STATES = {"+": "available", "-": "unavailable"}
+
+    def __init__(self, timetable: "TimetableWidget"):
+        super().__init__(timetable)
+        self.tt = timetable
+        self._highlight: list[str] | None = None  # 열별 하이라이트 문자열
+        self._day_to_col: dict[int, int] = {}
+        self._sync_grid()
+
+    def _sync_grid(self):
+        self._day_to_col = {d: c for c, d in enumerate(self.tt.time_grid.days)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.tt.time_grid.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.tt.time_grid.days)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return DAY_NAMES[self.tt.time_grid.days[section]]
+        hour, minute = divmod(self.row_start(section), 60)
+        return f"{hour:02d}:{minute:02d}"
+
+    def flags(self, index):
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsDropEnabled | Qt.ItemFlag.ItemIsDragEnabled)
+
+    def row_start(self, row: int) -> int:
+        """행의 시작 시각(분)"""
+        return self.tt.time_grid.row_start(row)
+
+    def day_of(self, column: int) -> int:
+        return self.tt.time_grid.days[column]
+
+    def block_at(self, index: QModelIndex) -> int | None:
+        if not index.isValid():
+            return None
+        start = self.row_start(index.row())
+        return self.tt.occupancy.block_in(self.day_of(index.column()), start, start + self.tt.time_grid.slot_minutes)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == ROLE_HIGHLIGHT:
+            if self._highlight is None:
+                return None
+            return self._HIGHLIGHT_STATES.get(self._highlight[index.column()][index.row()])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole,
+                        Qt.ItemDataRole.ToolTipRole, ROLE_BLOCK, ROLE_SPAN):
+            return None
+        bi = self.block_at(index)
+        if role == ROLE_BLOCK:
+            return bi
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if self._highlight is not None:
+                state = self._HIGHLIGHT_STATES.get(self._highlight[index.column()][index.row()])
+                if state is not None:
+                    return _HIGHLIGHT_QCOLORS[state]
+            if bi is None:
+                return None
+            b = self.tt.blocks[bi]
+            grade = getattr(self.tt.students[b.student_index], 'grade', '중1') if b.student_index < len(self.tt.students) else '중1'
+            return _GRADE_QCOLORS.get(grade, _DEFAULT_BLOCK_QCOLOR)
+        if bi is None:
+            return None
+        b = self.tt.blocks[bi]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            # 칸이 작으면 글자가 잘리므로 블록 어느 칸에서나 전체 내용 표시
+            return self.tt._block_text(b.student_index, b.duration_minutes)
+        start = self.row_start(index.row())
+        slot = self.tt.time_grid.slot_minutes
+        if role == ROLE_SPAN:
+            return (b.start_minutes >= start, b.start_minutes + b.duration_minutes <= start + slot)
+        # DisplayRole: 블록이 시작되는 칸에만 글자 표시
+        if start <= b.start_minutes < start + slot:
+            return self.tt._block_text(b.student_index, b.duration_minutes)
+        return None
+
+    def cell_of(self, day: int, minutes: int) -> tuple[int, int] | None:
+        """(요일, 시각) → (행, 열), 그리드 밖이면 None"""
+        row = self.tt.time_grid.row_of(minutes)
+        if day not in self._day_to_col or not 0 <= row < self.rowCount():
+            return None
+        return row, self._day_to_col[day]
+
+    def span_changed(self, day: int, start: int, duration: int):
+        """한 블록이 차지하는 칸들만 다시 그리도록 알림"""
+        col = self._day_to_col.get(day)
+        if col is None:
+            return
+        grid = self.tt.time_grid
+        first = max(grid.row_of(start), 0)
+        last = min(grid.row_of(start + duration - 1), self.rowCount() - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first, col), self.index(last, col))
+
+    def all_changed(self):
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def set_highlight(self, states: list[str] | None):
+        """하이라이트 교체 - 열마다 상태가 바뀐 첫 행~마지막 행만 dataChanged"""
+        old = self._highlight
+        self._highlight = states
+        if old is states:
+            return
+        rows = self.rowCount()
+        blank = "." * rows
+        for c in range(self.columnCount()):
+            a = old[c] if old is not None else blank
+            b = states[c] if states is not None else blank
+            if a == b:
+                continue
+            first = 0
+            while a[first] == b[first]:
+                first += 1
+            last = rows - 1
+            while a[last] == b[last]:
+                last -= 1
+            self.dataChanged.emit(self.index(first, c), self.index(last, c))
+
+    def reset(self):
+        self.beginResetModel()
+        self._highlight = None
+        self._sync_grid()
+        self.endResetModel()
+
+
+class BlockDelegate(QStyledItemDelegate):
+    """블록을 칸 사이 선 없이 한 덩어리로 그림 (이름은 첫 칸, 테두리는 블록 바깥쪽만)"""
+
+    _GRID_PEN = QPen(QColor(220, 220, 220))
+    _BLOCK_PEN = QPen(QColor(120, 120, 120))
+    _SELECTED = QColor(0, 120, 215, 60)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        bg = index.data(Qt.ItemDataRole.BackgroundRole)
+        painter.fillRect(rect, bg if bg is not None else QColor(255, 255, 255))
+        span = index.data(ROLE_SPAN)
+        if span is None:
+            painter.setPen(self._GRID_PEN)
+            painter.drawLine(rect.topRight(), rect.bottomRight())
+            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        else:
+            first, last = span
+            painter.setPen(self._BLOCK_PEN)
+            painter.drawLine(rect.topLeft(), rect.bottomLeft())
+            painter.drawLine(rect.topRight(), rect.bottomRight())
+            if first:
+                painter.drawLine(rect.topLeft(), rect.topRight())
+            if last:
+                painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, self._SELECTED)
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if text:
+            painter.setPen(option.palette.color(option.palette.ColorRole.Text))
+            painter.drawText(rect.adjusted(2, 1, -2, -1), Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+
+class TimetableGrid(QTableView):
     """시간표 그리드 - 블록 표시, 드래그/드롭, 가능 시간 하이라이트"""
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -160,6 +457,17 @@ class TimetableGrid(QTableWidget):
     def set_parent(self, p):
         self.parent_timetable = p
 
+    def _start_block_drag(self, block_idx: int, supported_actions):
+        tt = self.parent_timetable
+        blk = tt.blocks[block_idx]
+        tt._start_drag_highlight(blk.student_index, blk.duration_minutes, block_idx)
+        drag = QDrag(self)
+        mime = QMimeData()
+        mime.setText(f"BLOCK:{block_idx},{blk.student_index},{blk.day_of_week},{blk.start_minutes},{blk.duration_minutes}")
+        drag.setMimeData(mime)
+        drag.exec(supported_actions)
+        tt._clear_drag_highlight()
+
     def mousePressEvent(self, e):
         if e.button() == Qt.MouseButton.LeftButton:
             self._drag_start_pos = e.position().toPoint()
@@ -168,23 +476,13 @@ class TimetableGrid(QTableWidget):
     def mouseMoveEvent(self, e):
         if (e.buttons() & Qt.MouseButton.LeftButton) and self._drag_start_pos is not None:
             if (e.position().toPoint() - self._drag_start_pos).manhattanLength() > 10:
-                item = self.itemAt(self._drag_start_pos)
-                if item and item.column() > 0:
-                    block_idx = item.data(Qt.ItemDataRole.UserRole)
-                    if block_idx is not None and isinstance(block_idx, int) and block_idx >= 0:
-                        tt = self.parent_timetable
-                        if tt and block_idx < len(tt.blocks):
-                            blk = tt.blocks[block_idx]
-                            if blk.day_of_week >= 0:
-                                self._drag_start_pos = None
-                                tt._start_drag_highlight(blk.student_index, blk.duration_minutes, block_idx)
-                                drag = QDrag(self)
-                                mime = QMimeData()
-                                mime.setText(f"BLOCK:{block_idx},{blk.student_index},{blk.day_of_week},{blk.start_minutes},{blk.duration_minutes}")
-                                drag.setMimeData(mime)
-                                drag.exec(Qt.DropAction.MoveAction)
-                                tt._clear_drag_highlight()
-                                return
+                tt = self.parent_timetable
+                block_idx = self.indexAt(self._drag_start_pos).data(ROLE_BLOCK)
+                if tt and block_idx is not None and 0 <= block_idx < len(tt.blocks):
+                    if tt.blocks[block_idx].day_of_week >= 0:
+                        self._drag_start_pos = None
+                        self._start_block_drag(block_idx, Qt.DropAction.MoveAction)
+                        return
         super().mouseMoveEvent(e)
 
     def mouseReleaseEvent(self, e):
@@ -218,32 +516,20 @@ class TimetableGrid(QTableWidget):
         super().dragLeaveEvent(e)
 
     def startDrag(self, supported_actions):
-        item = self.currentItem()
-        if not item or item.column() == 0:
-            return
-        block_idx = item.data(Qt.ItemDataRole.UserRole)
-        if block_idx is None or not isinstance(block_idx, int) or block_idx < 0:
-            return
         tt = self.parent_timetable
-        if not tt or block_idx >= len(tt.blocks):
+        block_idx = self.currentIndex().data(ROLE_BLOCK)
+        if not tt or block_idx is None or not 0 <= block_idx < len(tt.blocks):
             return
-        blk = tt.blocks[block_idx]
-        if blk.day_of_week < 0:
+        if tt.blocks[block_idx].day_of_week < 0:
             return
-        tt._start_drag_highlight(blk.student_index, blk.duration_minutes, block_idx)
-        drag = QDrag(self)
-        mime = QMimeData()
-        mime.setText(f"BLOCK:{block_idx},{blk.student_index},{blk.day_of_week},{blk.start_minutes},{blk.duration_minutes}")
-        drag.setMimeData(mime)
-        drag.exec(supported_actions)
-        tt._clear_drag_highlight()
+        self._start_block_drag(block_idx, supported_actions)
 
     def dropEvent(self, e):
         if not e.mimeData().hasText() or not e.mimeData().text().startswith("BLOCK:"):
             super().dropEvent(e)
             return
-        item = self.itemAt(e.position().toPoint())
-        if not item or item.column() == 0:
+        index = self.indexAt(e.position().toPoint())
+        if not index.isValid():
             super().dropEvent(e)
             return
         data = e.mimeData().text()[6:]
@@ -252,57 +538,58 @@ class TimetableGrid(QTableWidget):
             super().dropEvent(e)
             return
         block_idx = int(parts[0])
-        col = item.column()
-        new_day = COL_TO_DAY[col - 1] if 1 <= col <= 7 else 0
-        row = item.row()
-        new_start_min = (HOURS_START + row // 2) * 60 + (row % 2) * 30
         tt = self.parent_timetable
         if tt and 0 <= block_idx < len(tt.blocks):
+            new_day = tt.model.day_of(index.column())
+            new_start_min = tt.model.row_start(index.row())
             blk = tt.blocks[block_idx]
             # 가능한 시간대인지 + 다른 블록과 겹치지 않는지 검증
             si = blk.student_index
             dur = blk.duration_minutes
-            if 0 <= si < len(tt.students) and tt.students[si].can_place_block(new_day, new_start_min, dur):
-                block_end = new_start_min + dur
-                overlaps = False
-                for bi, b in enumerate(tt.blocks):
-                    if b.day_of_week < 0 or bi == block_idx:
-                        continue
-                    if b.day_of_week != new_day:
-                        continue
-                    b_end = b.start_minutes + b.duration_minutes
-                    if new_start_min < b_end and block_end > b.start_minutes:
-                        overlaps = True
-                        break
-                if not overlaps:
-                    blk.day_of_week = new_day
-                    blk.start_minutes = new_start_min
-            tt._rebuild_all()
+            step = tt.time_grid.slot_minutes
+            if 0 <= si < len(tt.students) and tt.students[si].can_place_block(new_day, new_start_min, dur, step):
+                overlaps = tt.occupancies.overlaps(tt.resource, si, new_day, new_start_min, dur, exclude=block_idx)
+                moved = (blk.day_of_week, blk.start_minutes, blk.resource_id) != (new_day, new_start_min, tt.resource)
+                if not overlaps and moved:
+                    tt._move_block(block_idx, new_day, new_start_min)
         if tt:
             tt._clear_drag_highlight()
         e.acceptProposedAction()
 
 
 class TimetableWidget(QWidget):
+    # 드래그 앤 드롭으로 블록 배치가 바뀌면 해당 블록 인덱스 전달 - 새 배치는 blocks[인덱스]에서 읽음
+    block_changed = pyqtSignal(int)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.students: List[Student] = []
-        self.blocks: List[ScheduleBlock] = []
+        # 화면의 블록 (set_blocks로 받은 목록을 열 저장소로 옮김 - 옮기기는 여기에만 쓰고 block_changed로 알림)
+        self.blocks = BlockStore()
+        self.occupancies = ResourceOccupancy()  # 자원별 요일 점유 + 학생별 배정 (겹침 검사·칸별 블록 찾기)
+        self.resource = 0  # 그리드에 보이는 자원(강사·교실) - 놓는 블록도 이 자원에 배정
         self._highlight_student_idx: int | None = None
         self._highlight_duration: int = 60
         self._highlight_block_idx: int | None = None  # 이동 중인 블록(겹침 제외용)
+        self._highlight_cache: tuple[tuple, list[str]] | None = None  # (계산 조건, 열별 상태)
+        self.time_grid = TimeGrid()  # 행(시간 칸)·열(요일) 구성 - 생성기와 같은 설정을 set_time_grid로 공유
 
         layout = QHBoxLayout(self)
+        self.model = TimetableModel(self)
         self.grid = TimetableGrid(self)
         self.grid.set_parent(self)
+        self.grid.setModel(self.model)
+        self.grid.setItemDelegate(BlockDelegate(self.grid))
+        self.grid.setShowGrid(False)
         self.grid.setAcceptDrops(True)
         self.grid.setDragEnabled(True)
-        self.grid.setDragDropMode(QTableWidget.DragDropMode.DragDrop)
+        self.grid.setDragDropMode(QTableView.DragDropMode.DragDrop)
         self.grid.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.grid.setDragDropOverwriteMode(False)
-        self.grid.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-        self.grid.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectItems)
-        self.grid.verticalHeader().setDefaultSectionSize(SLOT_HEIGHT)
+        self.grid.setSelectionMode(QTableView.SelectionMode.SingleSelection)
+        self.grid.setSelectionBehavior(QTableView.SelectionBehavior.SelectItems)
+        self.grid.verticalHeader().setDefaultSectionSize(self._slot_height())
+        self.grid.horizontalHeader().setDefaultSectionSize(100)
         layout.addWidget(self.grid, stretch=1)
 
         self.pool = BlockPoolWidget(self)
@@ -311,6 +598,20 @@ class TimetableWidget(QWidget):
 
         self._connect_grid_events()
 
+    @property
+    def occupancy(self) -> OccupancyIndex:
+        """보이는 자원의 점유"""
+        return self.occupancies.resource(self.resource)
+
+    def set_resource(self, resource_id: int):
+        """그리드에 보일 자원 바꾸기 (미배정 풀은 자원과 무관)"""
+        if resource_id == self.resource:
+            return
+        self.resource = resource_id
+        self._highlight_cache = None
+        self._clear_drag_highlight()
+        self.model.all_changed()
+
     def _connect_grid_events(self):
         self.grid.viewport().installEventFilter(self)
 
@@ -323,14 +624,12 @@ class TimetableWidget(QWidget):
     def _on_grid_press(self, event):
         """블록 위에서 마우스 누르면 가능 시간 하이라이트"""
         pos = event.position().toPoint()
-        item = self.grid.itemAt(pos)
         if event.type() == QEvent.Type.MouseButtonPress:
-            if item and item.column() > 0:
-                bi = item.data(Qt.ItemDataRole.UserRole)
-                if bi is not None and isinstance(bi, int) and 0 <= bi < len(self.blocks):
-                    blk = self.blocks[bi]
-                    if blk.day_of_week >= 0:
-                        self._start_drag_highlight(blk.student_index, blk.duration_minutes, bi)
+            bi = self.grid.indexAt(pos).data(ROLE_BLOCK)
+            if bi is not None and 0 <= bi < len(self.blocks):
+                blk = self.blocks[bi]
+                if blk.day_of_week >= 0:
+                    self._start_drag_highlight(blk.student_index, blk.duration_minutes, bi)
         elif event.type() == QEvent.Type.MouseButtonRelease:
             # 클릭만 하고 드래그 안 했을 때 하이라이트 해제 (드래그 시에는 drop/dragLeave에서 해제)
             if self._highlight_student_idx is not None:
@@ -345,121 +644,109 @@ class TimetableWidget(QWidget):
     def _clear_drag_highlight(self):
         self._highlight_student_idx = None
         self._highlight_block_idx = None
-        self._rebuild_table_cells()
+        self.model.set_highlight(None)
 
+    @perf.timed()
     def _apply_availability_highlight(self):
-        """현재 하이라이트 대상 학생의 가능한 시간대를 표시"""
-        self._rebuild_table_cells(highlight_only=True)
+        """현재 하이라이트 대상 학생의 가능한 시간대를 표시 (옮기는 블록 자신과는 겹침 검사 안 함)"""
+        self.model.set_highlight(self._highlight_states())
+
+    def _highlight_states(self) -> list[str]:
+        """열별 하이라이트 상태 - 학생·길이·옮기는 블록·점유·격자가 같으면 이전 결과 재사용"""
+        si = self._highlight_student_idx
+        dur = self._highlight_duration
+        grid = self.time_grid
+        student = self.students[si] if si is not None and 0 <= si < len(self.students) else None
+        key = (si, dur, self._highlight_block_idx, self.resource, self.occupancies.version, grid,
+               id(student), student.__dict__.get("_slots_version") if student is not None else None)
+        if self._highlight_cache is not None and self._highlight_cache[0] == key:
+            return self._highlight_cache[1]
+        # 요일마다 비트마스크로 계산 후 칸 시작 비트만 뽑음: 겹치면(보이는 자원 또는 그 학생의 다른 블록) 불가,
+        # 학생이 가능하면 가능
+        # 자정을 넘는 블록은 비트맵 밖이라 그 행부터는 직접 검사
+        overflow_row = max(grid.row_of(DAY_MINUTES - dur + 1), 0)
+        states: list[str] = []
+        for day in grid.days:
+            blocked = self.occupancies.blocked_starts(self.resource, -1 if si is None else si, day, dur,
+                                                      exclude=self._highlight_block_idx)
+            if student is None:
+                states.append(grid.sample(blocked).translate(_NO_STUDENT_STATES))
+                continue
+            ok = student.feasible_starts(day, dur, grid.slot_minutes) & ~blocked
+            col = grid.sample(ok).translate(_STUDENT_STATES)
+            if overflow_row < grid.rows:
+                col = col[:overflow_row] + "".join(
+                    "+" if not blocked >> t & 1 and student.can_place_block(day, t, dur, grid.slot_minutes) else "-"
+                    for t in grid.slot_starts[overflow_row:]
+                )
+            states.append(col)
+        self._highlight_cache = (key, states)
+        return states
 
     def set_students(self, students: List[Student]):
         self.students = students
 
-    def set_blocks(self, blocks: List[ScheduleBlock]):
-        self.blocks = blocks
-        self._rebuild_all()
-
-    def get_blocks(self) -> List[ScheduleBlock]:
-        return list(self.blocks)
-
-    def _rebuild_all(self):
-        self._rebuild_table_cells()
+    def set_blocks(self, blocks: Sequence[ScheduleBlock]):
+        self.blocks = BlockStore.from_blocks(blocks)
+        self.occupancies.rebuild(self.blocks, self.blocks.placed())
+        self.model.reset()
         self.pool.refresh()
 
+    def student_changed(self, student_idx: int):
+        """학생 이름·학년 등이 바뀜 - 그 학생 블록이 있는 칸과 미배정 줄만 다시 그림"""
+        for bi in self.blocks.of_student(student_idx):
+            b = self.blocks[bi]
+            if b.day_of_week < 0:
+                self.pool.model.changed(bi)
+            elif b.resource_id == self.resource:
+                self.model.span_changed(b.day_of_week, b.start_minutes, b.duration_minutes)
+
+    def set_time_grid(self, time_grid: TimeGrid):
+        """칸 단위·시간 범위·요일 변경 → 그리드 행·열 다시 구성"""
+        self.time_grid = time_grid
+        self._highlight_cache = None
+        self.model.reset()
+        self.grid.verticalHeader().setDefaultSectionSize(self._slot_height())
+
+    def _slot_height(self) -> int:
+        return max(SLOT_HEIGHT * self.time_grid.slot_minutes // 30, MIN_SLOT_HEIGHT)
+
+    @perf.action("move_block")
+    def _move_block(self, block_idx: int, day: int, start: int):
+        """블록을 보이는 자원의 (요일, 시작)으로 옮기고 바뀐 칸만 다시 그림"""
+        blk = self.blocks[block_idx]
+        was_unassigned = blk.day_of_week < 0
+        if not was_unassigned and blk.resource_id == self.resource:
+            self.model.span_changed(blk.day_of_week, blk.start_minutes, blk.duration_minutes)
+        blk.day_of_week = day
+        blk.start_minutes = start
+        blk.resource_id = self.resource
+        self.occupancies.place(block_idx, blk)
+        self.model.span_changed(day, start, blk.duration_minutes)
+        if was_unassigned:
+            self.pool.model.remove(block_idx, (blk.student_index, blk.duration_minutes))
+        self.block_changed.emit(block_idx)
+
+    @perf.action("unassign_block")
+    def _unassign_block(self, block_idx: int):
+        """블록을 미배정 풀로 되돌림"""
+        blk = self.blocks[block_idx]
+        if blk.day_of_week != UNASSIGNED_DAY:
+            old = (blk.day_of_week, blk.start_minutes, blk.duration_minutes)
+            blk.day_of_week = UNASSIGNED_DAY
+            blk.start_minutes = -1
+            self.occupancies.unplace(block_idx)
+            if blk.resource_id == self.resource:
+                self.model.span_changed(*old)
+            self.pool.model.add(block_idx)
+            self.block_changed.emit(block_idx)
+
     def _block_text(self, student_idx: int, duration: int) -> str:
         if student_idx < 0 or student_idx >= len(self.students):
             return "?"
         s = self.students[student_idx]
         return f"{s.name}\n{s.address}"
 
-    def _rebuild_table_cells(self, highlight_only: bool = False):
-        cols = 8
-        rows = (HOURS_END - HOURS_START) * 2
-        if not highlight_only:
-            self.grid.setColumnCount(cols)
-            self.grid.setRowCount(rows)
-            headers = ["시간"] + DAY_NAMES
-            self.grid.setHorizontalHeaderLabels(headers)
-
-            for r in range(rows):
-                hour = HOURS_START + r // 2
-                min = (r % 2) * 30
-                time_item = QTableWidgetItem(f"{hour:02d}:{min:02d}")
-                time_item.setFlags(time_item.flags() & ~Qt.ItemFlag.ItemIsEditable & ~Qt.ItemFlag.ItemIsSelectable)
-                self.grid.setItem(r, 0, time_item)
-
-        for c in range(1, cols):
-            for r in range(rows):
-                if highlight_only:
-                    item = self.grid.item(r, c)
-                    if not item:
-                        continue
-                else:
-                    item = QTableWidgetItem()
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDropEnabled | Qt.ItemFlag.ItemIsDragEnabled)
-                    self.grid.setItem(r, c, item)
-
-                day = COL_TO_DAY[c - 1] if 1 <= c <= 7 else 0
-                slot_start_min = (HOURS_START + r // 2) * 60 + (r % 2) * 30
-
-                # 하이라이트 모드: 가능 시간 + 미사용 슬롯만 표시
-                if self._highlight_student_idx is not None:
-                    si = self._highlight_student_idx
-                    dur = self._highlight_duration
-                    block_end_min = slot_start_min + dur
-                    # 다른 블록과 겹치는지 확인 (이 블록 전체 구간 기준)
-                    overlaps = False
-                    for bi, b in enumerate(self.blocks):
-                        if b.day_of_week < 0:
-                            continue
-                        if self._highlight_block_idx is not None and bi == self._highlight_block_idx:
-                            continue
-                        if b.day_of_week != day:
-                            continue
-                        b_end = b.start_minutes + b.duration_minutes
-                        if slot_start_min < b_end and block_end_min > b.start_minutes:
-                            overlaps = True
-                            break
-                    if overlaps:
-                        item.setBackground(QColor(255, 230, 230))
-                        item.setData(Qt.ItemDataRole.UserRole + 1, "unavailable")
-                    elif 0 <= si < len(self.students):
-                        s = self.students[si]
-                        if s.can_place_block(day, slot_start_min, dur):
-                            item.setBackground(QColor(200, 255, 200))  # 연두색 = 가능
-                            item.setData(Qt.ItemDataRole.UserRole + 1, "available")
-                        else:
-                            item.setBackground(QColor(255, 230, 230))  # 연한 빨강 = 불가
-                            item.setData(Qt.ItemDataRole.UserRole + 1, "unavailable")
-                    continue
-
-                # 기본: 블록 그리기
-                item.setData(Qt.ItemDataRole.UserRole + 1, None)
-                block_found = False
-                for bi, b in enumerate(self.blocks):
-                    if b.day_of_week < 0:
-                        continue
-                    if b.day_of_week != day:
-                        continue
-                    start_slot = (b.start_minutes // 60 - HOURS_START) * 2 + (b.start_minutes % 60) // 30
-                    span = (b.duration_minutes + 29) // 30
-                    if start_slot <= r < start_slot + span:
-                        item.setData(Qt.ItemDataRole.UserRole, bi)
-                        grade = getattr(self.students[b.student_index], 'grade', '중1') if b.student_index < len(self.students) else '중1'
-                        item.setBackground(_GRADE_QCOLORS.get(grade, QColor(173, 216, 230)))
-                        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsDragEnabled)
-                        if r == start_slot:
-                            item.setText(self._block_text(b.student_index, b.duration_minutes))
-                        block_found = True
-                        break
-                if not block_found:
-                    item.setData(Qt.ItemDataRole.UserRole, None)
-                    item.setBackground(QColor(255, 255, 255))
-                    item.setText("")
-
-        for c in range(cols):
-            self.grid.setColumnWidth(c, 100)
-
     def dragEnterEvent(self, e):
         if e.source() != self.grid and e.mimeData().hasText() and e.mimeData().text().startswith("BLOCK:"):
             data = e.mimeData().text()[6:]
@@ -488,7 +775,7 @@ class TimetableWidget(QWidget):
                 self.grid.set_parent(None)
             if self.pool:
                 self.pool.set_parent(None)
-                if getattr(self.pool, 'list_widget', None):
-                    self.pool.list_widget.set_parent_pool(None)
+                if getattr(self.pool, 'list_view', None):
+                    self.pool.list_view.set_parent_pool(None)
         except Exception:
             pass